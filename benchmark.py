@@ -0,0 +1,139 @@
+"""
+File for benchmarking solvers against every dictionary word, or a seeded sample of them.
+
+Functions:
+    parse_arguments() -> Namespace
+    play(solver_type: Type[Solver], answer: str) -> Tuple[bool, List[float]]
+    benchmark(solver_type: Type[Solver], answers: List[str], workers: Optional[int]) -> Dict[str, Any]
+"""
+
+from argparse import ArgumentParser, Namespace
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from json import dumps
+from logging import WARNING, basicConfig
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import numpy as np
+
+from wordlesolver.data import DICTIONARY
+from wordlesolver.generator import FakeGenerator
+from wordlesolver.solver import Solver, ValidateSolver
+
+
+def parse_arguments() -> Namespace:
+    """
+    Parse command line arguments.
+
+    Returns:
+        Namespace: Parsed args
+    """
+    parser = ArgumentParser()
+    parser.add_argument(
+        "solver",
+        action=ValidateSolver,
+        help="Wordle solver to benchmark",
+    )
+    parser.add_argument(
+        "--sample",
+        type=int,
+        help="Number of answers to sample, every dictionary word if not given",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed for sampling answers",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes, one per cpu if not given",
+    )
+    parser.add_argument(
+        "--output",
+        help="File to write JSON results to, stdout if not given",
+    )
+
+    return parser.parse_args()
+
+
+def play(solver_type: Type[Solver], answer: str) -> Tuple[bool, List[float]]:
+    """
+    Play one game against a fixed answer.
+
+    Parameters
+    ----------
+    solver_type : Type[Solver]
+        Solver to play with
+    answer : str
+        Answer to play against
+
+    Returns
+    -------
+    Tuple[bool, List[float]]
+        Whether the game was won, and seconds taken to choose each guess
+    """
+    generator = FakeGenerator(word=answer)
+    latencies = solver_type(generator).run()
+
+    return generator.won, latencies
+
+
+def benchmark(solver_type: Type[Solver], answers: List[str], workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Play a solver against every answer across a process pool.
+
+    Parameters
+    ----------
+    solver_type : Type[Solver]
+        Solver to benchmark
+    answers : List[str]
+        Answers to play against
+    workers : Optional[int]
+        Number of worker processes, one per cpu if not given
+
+    Returns
+    -------
+    Dict[str, Any]
+    """
+    start = perf_counter()
+    with ProcessPoolExecutor(workers) as executor:
+        results = list(executor.map(play, [solver_type] * len(answers), answers, chunksize=max(1, len(answers) // 256)))
+    seconds = perf_counter() - start
+
+    guesses = Counter(len(latencies) for won, latencies in results if won)
+    latencies = np.concatenate([game_latencies for _, game_latencies in results])
+
+    return {
+        "solver": solver_type.__name__,
+        "timestamp": datetime.now().isoformat(),
+        "games": len(results),
+        "failure_rate": 1 - sum(guesses.values()) / len(results),
+        "guesses_distribution": {str(count): guesses[count] for count in range(1, FakeGenerator.GUESSES + 1)},
+        "mean_guesses": sum(count * games for count, games in guesses.items()) / max(1, sum(guesses.values())),
+        "turn_latency_seconds": {
+            f"p{percentile}": float(np.percentile(latencies, percentile)) for percentile in (50, 90, 99, 100)
+        },
+        "games_per_second": len(results) / seconds,
+        "seconds": seconds,
+    }
+
+
+if __name__ == "__main__":
+    basicConfig(level=WARNING)
+    args = parse_arguments()
+
+    benchmark_answers = DICTIONARY
+    if args.sample:
+        benchmark_answers = list(np.random.default_rng(args.seed).choice(DICTIONARY, args.sample, replace=False))
+
+    benchmark_results = dumps(benchmark(args.solver, benchmark_answers, args.workers), indent=4)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(benchmark_results)
+    else:
+        print(benchmark_results)
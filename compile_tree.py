@@ -0,0 +1,48 @@
+"""
+File for compiling deterministic solvers into decision trees for DecisionTreeSolver.
+
+Functions:
+    parse_arguments() -> Namespace
+"""
+
+from argparse import ArgumentParser, Namespace
+from logging import INFO, basicConfig, info
+
+from wordlesolver.generator import FakeGenerator
+from wordlesolver.solver import (
+    DECISION_TREE_FILE,
+    ValidateSolver,
+    compile_decision_tree,
+    save_decision_tree,
+)
+
+
+def parse_arguments() -> Namespace:
+    """
+    Parse command line arguments.
+
+    Returns:
+        Namespace: Parsed args
+    """
+    parser = ArgumentParser()
+    parser.add_argument(
+        "solver",
+        action=ValidateSolver,
+        help="Deterministic wordle solver to compile",
+    )
+    parser.add_argument(
+        "--output",
+        default=DECISION_TREE_FILE,
+        help="File to save decision tree to",
+    )
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    basicConfig(level=INFO)
+    args = parse_arguments()
+
+    tree = compile_decision_tree(args.solver(FakeGenerator()))
+    save_decision_tree(tree, args.output)
+    info(f"Saved decision tree with {len(tree.guesses)} nodes to {args.output}")
@@ -0,0 +1,56 @@
+"""
+File for exporting the trained PPOSolver policy for NumpyPPOSolver.
+
+Functions:
+    parse_arguments() -> Namespace
+"""
+
+from argparse import ArgumentParser, Namespace
+from logging import INFO, basicConfig, info
+from os import path
+
+from wordlesolver.generator import FakeGenerator
+from wordlesolver.solver import POLICY_FILE, PPOSolver, export_policy, save_policy
+
+
+def parse_arguments() -> Namespace:
+    """
+    Parse command line arguments.
+
+    Returns:
+        Namespace: Parsed args
+    """
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--output",
+        default=POLICY_FILE,
+        help="File to save policy to",
+    )
+    parser.add_argument(
+        "--actions",
+        choices=["words", "letters"],
+        default="words",
+        help="Actions the policy was trained on",
+    )
+    parser.add_argument(
+        "--observation",
+        choices=["words", "letters"],
+        default="words",
+        help="Observation the policy was trained on",
+    )
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    basicConfig(level=INFO)
+    args = parse_arguments()
+
+    solver = PPOSolver(FakeGenerator(), observation=args.observation, actions=args.actions)
+    # PPOSolver starts from random weights when there are none to load, which aren't worth exporting
+    if not path.exists(weights_path := path.join(PPOSolver.OUTPUT_FOLDER, solver.weights_file)):
+        raise AssertionError(f"No trained weights in {weights_path}, train PPOSolver first")
+
+    policy = export_policy(solver.model)
+    save_policy(policy, args.output)
+    info(f"Saved policy with {len(policy.weights)} layers to {args.output}")
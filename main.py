@@ -6,10 +6,15 @@ Functions:
 """
 
 from argparse import ArgumentParser, Namespace
-from logging import INFO, basicConfig
+from logging import INFO, basicConfig, info
 
 from wordlesolver.generator import ValidateGenerator
-from wordlesolver.solver import ValidateSolver
+from wordlesolver.solver import (
+    SOLVER_CACHE_FILE,
+    FilterSolver,
+    SolverCache,
+    ValidateSolver,
+)
 
 
 def parse_arguments() -> Namespace:
@@ -30,8 +35,28 @@ def parse_arguments() -> Namespace:
         action=ValidateSolver,
         help="Wordle solver to use",
     )
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const=SOLVER_CACHE_FILE,
+        help="Cache solver decisions across runs, optionally in given file, for solvers filtering possible words",
+    )
+    parser.add_argument(
+        "--word-filter",
+        choices=list(FilterSolver.WORD_FILTERS),
+        help="Filter possible words as an array of indices or as a bitset, for solvers filtering possible words",
+    )
+
+    parsed_args = parser.parse_args()
+    # Only filtering solvers look their guesses up in the cache, so it would go unused by any other solver
+    if parsed_args.cache and not issubclass(parsed_args.solver, FilterSolver):
+        parser.error(f"--cache is only used by solvers filtering possible words, not {parsed_args.solver.__name__}")
+    if parsed_args.word_filter and not issubclass(parsed_args.solver, FilterSolver):
+        parser.error(
+            f"--word-filter is only used by solvers filtering possible words, not {parsed_args.solver.__name__}"
+        )
 
-    return parser.parse_args()
+    return parsed_args
 
 
 if __name__ == "__main__":
@@ -39,6 +64,13 @@ if __name__ == "__main__":
     args = parse_arguments()
 
     generator = args.generator()
-    solver = args.solver(generator)
+    solver_options = {"word_filter": args.word_filter} if args.word_filter else {}
+    solver = args.solver(generator, **solver_options)
+    if args.cache:
+        solver.cache = SolverCache(args.cache)
 
     solver.run()
+
+    if solver.cache:
+        info(f"Solver cache stats: {solver.cache.stats}")
+        solver.cache.close()
@@ -0,0 +1,42 @@
+"""
+File for precomputing the parsed words and the guess x answer feedback matrix.
+
+Functions:
+    parse_arguments() -> Namespace
+"""
+
+from argparse import ArgumentParser, Namespace
+from logging import INFO, basicConfig, info
+
+from wordlesolver.data import (
+    FEEDBACK_MATRIX_FILE,
+    build_feedback_matrix,
+    save_feedback_matrix,
+    save_words_cache,
+)
+
+
+def parse_arguments() -> Namespace:
+    """
+    Parse command line arguments.
+
+    Returns:
+        Namespace: Parsed args
+    """
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--output",
+        default=FEEDBACK_MATRIX_FILE,
+        help="File to save feedback matrix to",
+    )
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    basicConfig(level=INFO)
+    args = parse_arguments()
+
+    info(f"Saved parsed words to {save_words_cache()}")
+    save_feedback_matrix(build_feedback_matrix(), args.output)
+    info(f"Saved feedback matrix to {args.output}")
@@ -1,28 +1,157 @@
 """
-File containing test for get_answer helper function.
+File containing tests for fetching answers.
 
 Functions:
     test_get_answer() -> None
+    test_get_answers(tmp_path: Path) -> None
+    test_get_answers_keeps_fetched_answers(tmp_path: Path) -> None
+    test_cache_merges_answers_saved_meanwhile(tmp_path: Path) -> None
 """
 
-from datetime import datetime
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps
+from pathlib import Path
+from threading import Thread
+from typing import List
 
-from pytest import main
+from pytest import main, raises
 
-from wordlesolver.data import get_answer
+from wordlesolver.data import get_answer, get_answers
+from wordlesolver.data.answers import _load_cache, _save_cache
+
+requested_paths: List[str] = []
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Stub answer service, answering with the requested path's day of the month as a word."""
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name; http.server naming
+        """Respond with an answer."""
+        requested_paths.append(self.path)
+        body = dumps({"solution": f"day{self.path[-7:-5]}"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_: object) -> None:
+        """Keep test output quiet."""
+
+
+class _MissingDayHandler(BaseHTTPRequestHandler):
+    """Stub answer service, missing MISSING_DAY's answer and answering other days with their day of the month."""
+
+    MISSING_DAY: str = "2023-03-02"
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name; http.server naming
+        """Respond with an answer, or not found for the missing day."""
+        if self.MISSING_DAY in self.path:
+            self.send_error(404)
+            return
+
+        body = dumps({"solution": f"day{self.path[-7:-5]}"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_: object) -> None:
+        """Keep test output quiet."""
 
 
 def test_get_answer() -> None:
     """Test get answer for particular day."""
     # Given
-    date = datetime(2022, 11, 10)
+    day = datetime(2022, 11, 10)
 
     # When
-    answer = get_answer(date)
+    answer = get_answer(day, cache_file=None)
 
     # Then
     assert answer == "unite"
 
 
+def test_get_answers(tmp_path: Path) -> None:
+    """Test answers are fetched once per day, then read from the cache offline."""
+    # Given
+    cache_file = str(tmp_path / "answers.json")
+    with ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler) as server:
+        Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_port}/{{date}}.json"
+
+        # When
+        answers = get_answers(date(2023, 1, 30), date(2023, 2, 2), cache_file, workers=2, url=url)
+        overlapping_answers = get_answers(date(2023, 2, 1), date(2023, 2, 3), cache_file, url=url)
+        server.shutdown()
+
+    offline_answers = get_answers(date(2023, 1, 30), date(2023, 2, 3), cache_file, url=None)
+
+    # Then
+    assert answers == {
+        date(2023, 1, 30): "day30",
+        date(2023, 1, 31): "day31",
+        date(2023, 2, 1): "day01",
+        date(2023, 2, 2): "day02",
+    }
+    assert overlapping_answers[date(2023, 2, 3)] == "day03"
+    assert sorted(requested_paths) == [
+        "/2023-01-30.json",
+        "/2023-01-31.json",
+        "/2023-02-01.json",
+        "/2023-02-02.json",
+        "/2023-02-03.json",
+    ]
+    assert offline_answers == {**answers, date(2023, 2, 3): "day03"}
+    assert get_answer(datetime(2023, 2, 1, 12), cache_file, url=None) == "day01"
+
+    with raises(AssertionError) as exc_info:
+        get_answer(date(2023, 2, 4), cache_file, url=None)
+    assert str(exc_info.value) == "No cached answer for 2023-02-04"
+
+
+def test_get_answers_keeps_fetched_answers(tmp_path: Path) -> None:
+    """Test a day failing to fetch is named, and every other day fetched is still cached."""
+    # Given
+    cache_file = str(tmp_path / "answers.json")
+    with ThreadingHTTPServer(("127.0.0.1", 0), _MissingDayHandler) as server:
+        Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_port}/{{date}}.json"
+
+        # When
+        with raises(AssertionError) as exc_info:
+            get_answers(date(2023, 3, 1), date(2023, 3, 4), cache_file, workers=2, url=url)
+        server.shutdown()
+
+    # Then
+    assert str(exc_info.value) == "Failed to fetch answers for 2023-03-02"
+    assert get_answers(date(2023, 3, 3), date(2023, 3, 4), cache_file, url=None) == {
+        date(2023, 3, 3): "day03",
+        date(2023, 3, 4): "day04",
+    }
+    assert get_answer(date(2023, 3, 1), cache_file, url=None) == "day01"
+
+
+def test_cache_merges_answers_saved_meanwhile(tmp_path: Path) -> None:
+    """Test saving answers keeps those another process saved since the cache was loaded, leaving no temporary files."""
+    # Given
+    cache_file = str(tmp_path / "answers.json")
+    _save_cache(cache_file, {"2023-04-01": "day01"})
+    loaded_cache = _load_cache(cache_file)
+    # Stands in for another process saving its answers
+    _save_cache(cache_file, {**loaded_cache, "2023-04-02": "day02"})
+
+    # When
+    _save_cache(cache_file, {**loaded_cache, "2023-04-03": "day03"})
+
+    # Then
+    assert get_answers(date(2023, 4, 1), date(2023, 4, 3), cache_file, url=None) == {
+        date(2023, 4, 1): "day01",
+        date(2023, 4, 2): "day02",
+        date(2023, 4, 3): "day03",
+    }
+    assert [file.name for file in tmp_path.iterdir()] == ["answers.json"]
+
+
 if __name__ == "__main__":
     main()
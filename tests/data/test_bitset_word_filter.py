@@ -0,0 +1,67 @@
+"""
+File containing tests for bitset word filter class.
+
+Functions:
+    test_filter_matches_word_filter(guess: str, answer: str) -> None
+    test_possible_words_lazy() -> None
+    test_no_array_state() -> None
+"""
+
+from pytest import main, mark
+
+from wordlesolver.data import WORD_INDICES, BitsetWordFilter, LetterValidity, WordFilter
+from wordlesolver.generator import FakeGenerator
+
+test_data = [("crane", "unite"), ("eerie", "there"), ("speed", "geese"), ("lolly", "hello")]
+
+
+@mark.parametrize("guess, answer", test_data)
+def test_filter_matches_word_filter(guess: str, answer: str) -> None:
+    """Test bitset filtering gives the same words as array filtering."""
+    # Given
+    filterer = WordFilter()
+    bitset_filterer = BitsetWordFilter()
+    generator = FakeGenerator()
+    # pylint: disable=protected-access; need to set the answer
+    generator._word_id = WORD_INDICES[answer]
+    word_validity = generator._guess_word(WORD_INDICES[guess])
+
+    # When
+    filterer.filter(guess, word_validity)
+    bitset_filterer.filter(guess, word_validity)
+
+    # Then
+    assert len(bitset_filterer.possible_words) == len(filterer.possible_words)
+    assert list(bitset_filterer.possible_words) == filterer.possible_words
+    assert (bitset_filterer.possible_idxs == filterer.possible_idxs).all()
+
+
+def test_possible_words_lazy() -> None:
+    """Test possible words are counted and searched without being materialised."""
+    # Given
+    filterer = BitsetWordFilter()
+    word_validity = [LetterValidity.GREY] * 4 + [LetterValidity.GREEN]
+
+    # When
+    filterer.filter("crane", word_validity)
+
+    # Then
+    assert len(filterer.possible_words) > 0
+    assert "biome" in filterer.possible_words
+    assert "crane" not in filterer.possible_words
+    # pylint: disable=protected-access; need to check words were not materialised
+    assert filterer.possible_words._words is None
+
+
+def test_no_array_state() -> None:
+    """Test the array filter's index and words state is not built alongside the bitmap."""
+    # Given / When
+    filterer = BitsetWordFilter()
+
+    # Then
+    assert not hasattr(filterer, "_possible_idxs")
+    assert not hasattr(filterer, "_possible_words")
+
+
+if __name__ == "__main__":
+    main()
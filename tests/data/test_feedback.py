@@ -0,0 +1,66 @@
+"""
+File containing tests for packed feedback.
+
+Functions:
+    test_tables() -> None
+    test_filter_accepts_feedback() -> None
+"""
+
+from typing import Type
+
+from pytest import main, mark
+
+from wordlesolver.data import (
+    FEEDBACK_CODES,
+    WIN_FEEDBACK,
+    BitsetWordFilter,
+    Feedback,
+    LetterValidity,
+    WordFilter,
+)
+from wordlesolver.generator import FakeGenerator
+
+
+def test_tables() -> None:
+    """Test counts and conversions agree with the validity of each letter."""
+    # Given
+    feedbacks = [Feedback(code) for code in range(FEEDBACK_CODES)]
+
+    # When
+    validities = [feedback.validities() for feedback in feedbacks]
+
+    # Then
+    assert [Feedback.from_validities(word_validity) for word_validity in validities] == feedbacks
+    assert [feedback.green_count for feedback in feedbacks] == [
+        word_validity.count(LetterValidity.GREEN) for word_validity in validities
+    ]
+    assert [feedback.yellow_count for feedback in feedbacks] == [
+        word_validity.count(LetterValidity.YELLOW) for word_validity in validities
+    ]
+    assert [feedback for feedback in feedbacks if feedback.won] == [WIN_FEEDBACK]
+
+
+@mark.parametrize("filter_type", [WordFilter, BitsetWordFilter], ids=["word_filter", "bitset_word_filter"])
+def test_filter_accepts_feedback(filter_type: Type[WordFilter]) -> None:
+    """Test filtering by packed feedback, including all grey, matches filtering by letter validities."""
+    # Given
+    generator = FakeGenerator(word="unite")
+    generator.reset()
+    packed_filterer = filter_type()
+    filterer = filter_type()
+
+    for guess in ["gawky", "crane"]:
+        # When
+        generator.step(guess)
+        feedback = generator.feedback
+        packed_filterer.filter(guess, feedback)
+        filterer.filter(guess, generator.observation)
+
+        # Then
+        assert feedback is not None
+        assert list(packed_filterer.possible_words) == list(filterer.possible_words)
+        assert "unite" in packed_filterer.possible_words
+
+
+if __name__ == "__main__":
+    main()
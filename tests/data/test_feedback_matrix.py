@@ -0,0 +1,100 @@
+"""
+File containing tests for feedback matrix helpers.
+
+Functions:
+    test_encode_decode_feedback() -> None
+    test_feedback_codes_match_fake_generator() -> None
+    test_save_load_feedback_matrix(tmp_path: Path) -> None
+    test_filter_with_feedback_matrix() -> None
+"""
+
+from pathlib import Path
+
+import numpy as np
+from pytest import main
+
+from wordlesolver.data import (
+    DICTIONARY,
+    DICTIONARY_LENGTH,
+    DICTIONARY_LETTERS,
+    FEEDBACK_CODES,
+    WORD_INDICES,
+    LetterValidity,
+    WordFilter,
+    decode_feedback,
+    encode_feedback,
+    feedback_codes,
+    load_feedback_matrix,
+    save_feedback_matrix,
+)
+from wordlesolver.generator import FakeGenerator
+
+
+def test_encode_decode_feedback() -> None:
+    """Test every feedback code survives a round trip."""
+    # Given
+    codes = range(FEEDBACK_CODES)
+
+    # When
+    round_tripped = [encode_feedback(decode_feedback(code)) for code in codes]
+
+    # Then
+    assert round_tripped == list(codes)
+    assert encode_feedback([LetterValidity.GREEN] * 5) == FEEDBACK_CODES - 1
+
+
+def test_feedback_codes_match_fake_generator() -> None:
+    """Test vectorised feedback matches the fake generator, including repeated letters."""
+    # Given
+    words = ["eerie", "there", "speed", "abide", "lolly", "hello", "geese", "levee", "crane", "unite"]
+    generator = FakeGenerator()
+
+    # When
+    codes = feedback_codes(DICTIONARY_LETTERS[[WORD_INDICES[word] for word in words]], DICTIONARY_LETTERS)
+
+    # Then
+    for guess, guess_codes in zip(words, codes):
+        for answer in words:
+            # pylint: disable=protected-access; need to set the answer
+            generator._word_id = WORD_INDICES[answer]
+            assert decode_feedback(guess_codes[WORD_INDICES[answer]]) == generator._guess_word(WORD_INDICES[guess])
+
+
+def test_save_load_feedback_matrix(tmp_path: Path) -> None:
+    """Test feedback matrix is memory mapped when loaded."""
+    # Given
+    file_path = str(tmp_path / "feedback_matrix.npy")
+    matrix = np.zeros((DICTIONARY_LENGTH, DICTIONARY_LENGTH), dtype=np.uint8)
+    matrix[0] = feedback_codes(DICTIONARY_LETTERS[:1], DICTIONARY_LETTERS)[0]
+
+    # When
+    save_feedback_matrix(matrix, file_path)
+    loaded = load_feedback_matrix(file_path)
+
+    # Then
+    assert isinstance(loaded, np.memmap)
+    assert np.array_equal(loaded[0], matrix[0])
+
+
+def test_filter_with_feedback_matrix() -> None:
+    """Test filtering with a feedback matrix matches filtering without one."""
+    # Given
+    guess = "crane"
+    matrix = np.zeros((DICTIONARY_LENGTH, DICTIONARY_LENGTH), dtype=np.uint8)
+    matrix[WORD_INDICES[guess]] = feedback_codes(DICTIONARY_LETTERS[[WORD_INDICES[guess]]], DICTIONARY_LETTERS)[0]
+    word_validity = decode_feedback(matrix[WORD_INDICES[guess], WORD_INDICES["unite"]])
+    filterer = WordFilter()
+    matrix_filterer = WordFilter(matrix)
+
+    # When
+    filterer.filter(guess, word_validity)
+    matrix_filterer.filter(guess, word_validity)
+
+    # Then
+    assert matrix_filterer.possible_words == filterer.possible_words
+    assert "unite" in matrix_filterer.possible_words
+    assert len(matrix_filterer.possible_words) < len(DICTIONARY)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+File containing tests for vocabulary.
+
+Functions:
+    test_round_trip() -> None
+    test_find_id() -> None
+    test_step_by_id() -> None
+"""
+
+from typing import Any, List
+
+import numpy as np
+from pytest import main
+
+from wordlesolver.data import DICTIONARY, VOCABULARY
+from wordlesolver.generator import FakeGenerator
+
+
+def test_round_trip() -> None:
+    """Test words and IDs map back to themselves."""
+    # Given
+    words = DICTIONARY[::1000]
+
+    # When
+    word_ids = VOCABULARY.to_ids(words)
+
+    # Then
+    assert VOCABULARY.to_words(word_ids) == words
+    assert [VOCABULARY.to_word(VOCABULARY.to_id(word)) for word in words] == words
+    assert len(VOCABULARY) == len(DICTIONARY)
+
+
+def test_find_id() -> None:
+    """Test only words and integer IDs in the vocabulary are found."""
+    # Given
+    word = DICTIONARY[10]
+    candidates: List[Any] = [word, 10, np.int64(10), "abcde", -1, len(DICTIONARY), 10.0, 1.5, True, None]
+
+    # When
+    found = [VOCABULARY.find_id(candidate) for candidate in candidates]
+
+    # Then
+    assert found == [10, 10, 10, None, None, None, None, None, None, None]
+    assert word in VOCABULARY
+    assert "abcde" not in VOCABULARY
+
+
+def test_step_by_id() -> None:
+    """Test generators accept word IDs as well as words."""
+    # Given
+    generator = FakeGenerator(word="unite")
+    generator.reset()
+
+    # When
+    observation, reward, done, _ = generator.step(VOCABULARY.to_id("unite"))
+
+    # Then
+    assert generator.won
+    assert observation == generator.observation
+    assert reward == 150
+    assert done
+
+
+if __name__ == "__main__":
+    main()
@@ -6,11 +6,13 @@ Functions:
     test_filter_two_yellow() -> None
     test_filter_all_grey() -> None
     test_filter_one_green_one_yellow() -> None
+    test_filter_multiple_guesses() -> None
 """
 
 from pytest import main
 
-from wordlesolver.data import DICTIONARY, LetterValidity, WordFilter
+from wordlesolver.data import DICTIONARY, WORD_INDICES, LetterValidity, WordFilter
+from wordlesolver.generator import FakeGenerator
 
 
 def test_filter_one_green() -> None:
@@ -131,5 +133,23 @@ def test_filter_all_grey() -> None:
             assert possible_word.count("e") != 0
 
 
+def test_filter_multiple_guesses() -> None:
+    """Test case where several guesses narrow the search space down to the answer."""
+    # Given
+    filterer = WordFilter()
+    generator = FakeGenerator()
+    # pylint: disable=protected-access; need to set the answer
+    generator._word_id = WORD_INDICES["unite"]
+    guesses = ["crane", "spilt", "unite"]
+
+    # When
+    for guess in guesses:
+        filterer.filter(guess, generator._guess_word(WORD_INDICES[guess]))
+
+    # Then
+    assert filterer.possible_words == ["unite"]
+    assert [DICTIONARY[idx] for idx in filterer.possible_idxs] == ["unite"]
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,20 @@
+"""
+File containing fixtures shared by generator tests.
+
+Functions:
+    real_generator_pool() -> Iterator[None]
+"""
+
+from typing import Iterator
+
+from pytest import fixture
+
+from wordlesolver.generator import RealGenerator
+
+
+@fixture
+def real_generator_pool() -> Iterator[None]:
+    """Close the pages and browser shared by real generators after each test, even when it fails."""
+    yield
+    # Sync and async Playwright can't run at once, so one test leaving the pool open would fail the others
+    RealGenerator.close_pool()
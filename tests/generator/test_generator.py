@@ -5,22 +5,31 @@ Functions:
     test_won_game() -> None
     test_lost_game() -> None
     test_invalid_guess() -> None
+    test_async_generator_needs_async_api() -> None
 """
 from datetime import datetime
-from typing import Callable, Type
+from typing import Callable, Type, cast
 
+from playwright.async_api import Page
 from pytest import main, mark, raises
 
-from wordlesolver.data import LetterValidity, get_answer
-from wordlesolver.generator import FakeGenerator, Generator, RealGenerator
+from wordlesolver.data import VOCABULARY, LetterValidity, get_answer
+from wordlesolver.generator import (
+    AsyncRealGenerator,
+    FakeGenerator,
+    Generator,
+    RealGenerator,
+)
 
 test_data = [
     # pylint: disable=protected-access; need to guess the answer
-    (FakeGenerator, lambda fake_generator: fake_generator._word),
+    (FakeGenerator, lambda fake_generator: VOCABULARY.to_word(fake_generator._word_id)),
     (RealGenerator, lambda _: get_answer(datetime.now())),
 ]
 test_data_names = ["fake_generator", "real_generator"]
 
+pytestmark = mark.usefixtures("real_generator_pool")
+
 
 @mark.parametrize("generator_type, generator_to_answer", test_data, ids=test_data_names)
 def test_won_game(
@@ -96,5 +105,21 @@ def test_invalid_guess(generator_type: Type[Generator], _: Callable[[Type[Genera
     assert str(exc_info.value) == "Cannot perform an action when game ended"
 
 
+def test_async_generator_needs_async_api() -> None:
+    """Test the synchronous gym API of an asynchronous generator points to its asynchronous API."""
+    # Given
+    generator = AsyncRealGenerator(cast(Page, None))
+
+    # When
+    with raises(NotImplementedError) as reset_info:
+        generator.reset()
+    with raises(NotImplementedError) as step_info:
+        generator.step("crane")
+
+    # Then
+    assert "await areset()" in str(reset_info.value)
+    assert "await astep(action)" in str(step_info.value)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,49 @@
+"""
+File containing tests for int wrapper.
+
+Functions:
+    test_observation_masks_possible_words() -> None
+    test_reset_makes_every_word_possible() -> None
+"""
+
+import numpy as np
+from pytest import main
+
+from wordlesolver.data import DICTIONARY, WORD_INDICES, WordFilter
+from wordlesolver.generator import FakeGenerator
+from wordlesolver.generator.wrappers import IntWrapper, PreviousActionWrapper
+
+
+def test_observation_masks_possible_words() -> None:
+    """Test each observation marks exactly the words left by filtering."""
+    # Given
+    generator = IntWrapper(PreviousActionWrapper(FakeGenerator(word="unite")))
+    word_filter = WordFilter()
+    generator.reset()
+
+    for guess in ["crane", "spilt"]:
+        # When
+        observation = generator.step(WORD_INDICES[guess])[0]
+
+        # Then
+        word_filter.filter(guess, generator.unwrapped.observation)
+        assert [DICTIONARY[idx] for idx in np.flatnonzero(observation)] == word_filter.possible_words
+
+
+def test_reset_makes_every_word_possible() -> None:
+    """Test reset restores the mask, without changing observations already handed out."""
+    # Given
+    generator = IntWrapper(PreviousActionWrapper(FakeGenerator(word="unite")))
+    generator.reset()
+    observation = generator.step(WORD_INDICES["crane"])[0]
+
+    # When
+    reset_observation = generator.reset()
+
+    # Then
+    assert reset_observation.all()
+    assert not observation.all()
+
+
+if __name__ == "__main__":
+    main()
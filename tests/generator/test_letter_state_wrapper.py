@@ -0,0 +1,62 @@
+"""
+File containing tests for letter state wrapper.
+
+Functions:
+    test_observation_tracks_letter_states() -> None
+    test_reset_makes_every_letter_unknown() -> None
+"""
+
+import numpy as np
+from pytest import main
+
+from wordlesolver.data import LETTERS_COUNT, WORD_INDICES, WORD_LENGTH
+from wordlesolver.generator import FakeGenerator
+from wordlesolver.generator.wrappers import LetterStateWrapper, PreviousActionWrapper
+
+
+def _letter(letter: str) -> int:
+    return ord(letter) - ord("a")
+
+
+def test_observation_tracks_letter_states() -> None:
+    """Test greens, yellows and greys update position states and letter counts."""
+    # Given
+    generator = LetterStateWrapper(PreviousActionWrapper(FakeGenerator(word="geese")))
+    generator.reset()
+
+    # When
+    observation = generator.step(WORD_INDICES["eerie"])[0]
+
+    # Then
+    assert observation.shape == (LetterStateWrapper.OBSERVATION_SIZE,)
+    states = observation[: WORD_LENGTH * LETTERS_COUNT * 3].reshape(WORD_LENGTH, LETTERS_COUNT, 3).argmax(axis=2)
+    min_counts, max_counts = observation[WORD_LENGTH * LETTERS_COUNT * 3 :].reshape(2, LETTERS_COUNT) * WORD_LENGTH
+    for position in [1, 4]:
+        assert states[position, _letter("e")] == LetterStateWrapper.GREEN
+        assert (np.delete(states[position], _letter("e")) == LetterStateWrapper.EXCLUDED).all()
+    assert states[0, _letter("e")] == LetterStateWrapper.EXCLUDED
+    assert states[2, _letter("e")] == LetterStateWrapper.UNKNOWN
+    assert (states[:, [_letter("r"), _letter("i")]] == LetterStateWrapper.EXCLUDED).all()
+    assert states[0, _letter("g")] == LetterStateWrapper.UNKNOWN
+    assert (min_counts[_letter("e")], max_counts[_letter("e")]) == (3, WORD_LENGTH)
+    assert max_counts[_letter("r")] == max_counts[_letter("i")] == 0
+
+
+def test_reset_makes_every_letter_unknown() -> None:
+    """Test reset forgets everything learnt in the previous game."""
+    # Given
+    generator = LetterStateWrapper(PreviousActionWrapper(FakeGenerator(word="geese")))
+    generator.reset()
+    generator.step(WORD_INDICES["eerie"])
+
+    # When
+    observation = generator.reset()
+
+    # Then
+    states = observation[: WORD_LENGTH * LETTERS_COUNT * 3].reshape(WORD_LENGTH, LETTERS_COUNT, 3).argmax(axis=2)
+    assert (states == LetterStateWrapper.UNKNOWN).all()
+    assert (observation[WORD_LENGTH * LETTERS_COUNT * 3 :] == np.repeat([0, 1], LETTERS_COUNT)).all()
+
+
+if __name__ == "__main__":
+    main()
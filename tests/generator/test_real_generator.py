@@ -0,0 +1,168 @@
+"""
+File containing tests for real generator against a locally served copy of the site.
+
+Functions:
+    page_url() -> Iterator[str]
+    test_reset_reuses_page(page_url: str) -> None
+    test_close_forgets_page(page_url: str) -> None
+    test_reset_after_close(page_url: str) -> None
+    test_rejected_guess(page_url: str) -> None
+    test_pool_recycles_pages(page_url: str) -> None
+    test_play_concurrently(page_url: str) -> None
+"""
+
+from asyncio import run
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Thread
+from time import perf_counter
+from typing import Iterator
+
+from pytest import fixture, main, mark, raises
+
+from wordlesolver.data import LetterValidity
+from wordlesolver.generator import BrowserPool, RealGenerator
+from wordlesolver.solver import MaximiseMatchesSolver, play_concurrently
+
+REJECTION_SECONDS: float = 5.0
+
+pytestmark = mark.usefixtures("real_generator_pool")
+
+
+@fixture(scope="module")
+def page_url() -> Iterator[str]:
+    """Serve the stand-in site for the tests in this file."""
+    handler = partial(SimpleHTTPRequestHandler, directory=str(Path(__file__).parent))
+    with ThreadingHTTPServer(("127.0.0.1", 0), handler) as server:
+        Thread(target=server.serve_forever, daemon=True).start()
+        yield f"http://127.0.0.1:{server.server_port}/wordle.html?word=unite"
+        server.shutdown()
+
+
+def test_reset_reuses_page(page_url: str) -> None:  # pylint: disable=redefined-outer-name; pytest fixture
+    """Test resetting after a game reloads the same page with a new game, rather than launching a browser."""
+    # Given
+    generator = RealGenerator(page_url=page_url)
+    generator.reset()
+    # pylint: disable=protected-access; need to compare pages
+    page = generator._tab
+    generator.step("crane")
+
+    # When
+    generator.reset()
+    observation, reward, done, _ = generator.step("unite")
+
+    # Then
+    assert generator._tab is page
+    assert generator.page_ready_seconds is not None
+    assert observation == [LetterValidity.GREEN] * 5
+    assert reward == 150
+    assert done
+
+
+def test_close_forgets_page(page_url: str) -> None:  # pylint: disable=redefined-outer-name; pytest fixture
+    """Test closing twice is harmless, and a closed generator can't drive a page another generator acquired."""
+    # Given
+    generator = RealGenerator(page_url=page_url)
+    generator.reset()
+    generator.close()
+    other = RealGenerator(page_url=page_url)
+
+    # When
+    generator.close()
+    with raises(AssertionError) as exc_info:
+        generator.step("crane")
+
+    # Then
+    assert str(exc_info.value) == "Cannot perform an action after closing, reset to open a new page"
+    assert other.reset() is None
+    assert other.step("unite")[2]
+
+
+def test_reset_after_close(page_url: str) -> None:  # pylint: disable=redefined-outer-name; pytest fixture
+    """Test resetting a closed generator opens a page of its own, leaving the page it returned to its new owner."""
+    # Given
+    generator = RealGenerator(page_url=page_url)
+    generator.reset()
+    generator.step("crane")
+    generator.close()
+    other = RealGenerator(page_url=page_url)
+    # pylint: disable=protected-access; need to compare pages
+    other_page = other._tab
+
+    # When
+    generator.reset()
+    observation, _, done, _ = generator.step("unite")
+
+    # Then
+    assert generator._tab is not None
+    assert generator._tab is not other_page
+    assert other._tab is other_page
+    assert other_page is not None and not other_page.is_closed()
+    assert observation == [LetterValidity.GREEN] * 5
+    assert done
+
+
+def test_rejected_guess(page_url: str) -> None:  # pylint: disable=redefined-outer-name; pytest fixture
+    """Test a guess the site rejects fails as soon as the row is marked invalid, rather than timing out."""
+    # Given
+    generator = RealGenerator(page_url=f"{page_url}&reject=crane")
+    generator.reset()
+    start = perf_counter()
+
+    # When
+    with raises(AssertionError) as exc_info:
+        generator.step("crane")
+
+    # Then
+    assert str(exc_info.value) == "Site rejected guess crane"
+    assert perf_counter() - start < REJECTION_SECONDS
+
+
+def test_pool_recycles_pages(page_url: str) -> None:  # pylint: disable=redefined-outer-name; pytest fixture
+    """Test pages are reused until used max_uses times, and no more than size idle pages are kept."""
+    # Given
+    pool = BrowserPool(size=1, max_uses=2)
+
+    try:
+        # When
+        first = pool.acquire()
+        first.goto(page_url)
+        pool.release(first)
+        reused = pool.acquire()
+        pool.release(reused)
+        recycled = pool.acquire()
+        extra = pool.acquire()
+        pool.release(recycled)
+        pool.release(extra)
+
+        # Then
+        assert reused is first
+        assert first.is_closed()
+        assert recycled is not first
+        assert not recycled.is_closed()
+        assert extra.is_closed()
+    finally:
+        pool.close()
+
+    assert not pool.started
+    assert recycled.is_closed()
+
+
+def test_play_concurrently(page_url: str) -> None:  # pylint: disable=redefined-outer-name; pytest fixture
+    """Test games played in concurrent tabs are each played to the end in their own context."""
+    # Given
+    games = 4
+
+    # When
+    results = run(play_concurrently(MaximiseMatchesSolver, games, concurrency=2, page_url=page_url))
+
+    # Then
+    assert len(results) == games
+    assert all(won for won, _ in results)
+    assert len({len(latencies) for _, latencies in results}) == 1
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+File containing tests for routing policy.
+
+Functions:
+    test_decide() -> None
+    test_decide_without_cache() -> None
+"""
+
+from pytest import main
+
+from wordlesolver.generator import RoutingPolicy
+
+
+def test_decide() -> None:
+    """Test the page is always loaded, assets of allowed hosts are cached and everything else is blocked."""
+    # Given
+    policy = RoutingPolicy(cache_folder="out/test_asset_cache")
+    requests = [
+        ("http://127.0.0.1:8000/wordle.html", "document", True),
+        ("https://www.nytimes.com/games-assets/v2/wordle.js", "script", False),
+        ("https://static01.nyt.com/games-assets/v2/wordle.css", "stylesheet", False),
+        ("https://www.nytimes.com/svc/wordle/v2/2023-01-01.json", "fetch", False),
+        ("https://www.nytimes.com/games-assets/v2/logo.png", "image", False),
+        ("https://securepubads.g.doubleclick.net/tag/js/gpt.js", "script", False),
+        ("https://notnytimes.com/tracker.js", "script", False),
+    ]
+
+    # When
+    decisions = [policy.decide(*request) for request in requests]
+
+    # Then
+    assert decisions == [
+        RoutingPolicy.CONTINUE,
+        RoutingPolicy.CACHE,
+        RoutingPolicy.CACHE,
+        RoutingPolicy.CONTINUE,
+        RoutingPolicy.ABORT,
+        RoutingPolicy.ABORT,
+        RoutingPolicy.ABORT,
+    ]
+
+
+def test_decide_without_cache() -> None:
+    """Test assets are requested as usual when there is no cache folder."""
+    # Given
+    policy = RoutingPolicy(cache_folder=None)
+
+    # When
+    decision = policy.decide("https://www.nytimes.com/games-assets/v2/wordle.js", "script", False)
+
+    # Then
+    assert decision == RoutingPolicy.CONTINUE
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+File containing tests for scoring guesses.
+
+Functions:
+    test_score_guess() -> None
+    test_score_guesses() -> None
+"""
+
+import numpy as np
+from pytest import main
+
+from wordlesolver.data import VOCABULARY, WORD_INDICES, Feedback
+from wordlesolver.generator import FakeGenerator, score_guess, score_guesses
+
+answers = ["unite", "eerie", "lolly", "speed", "levee", "geese"]
+
+
+def test_score_guess() -> None:
+    """Test scores match FakeGenerator, including repeated letters in the guess and the answer."""
+    # Given
+    guesses = ["geese", "eerie", "llama", "speed"]
+
+    for guess in guesses:
+        # When
+        codes = score_guess(guess, VOCABULARY.to_ids(answers))
+
+        # Then
+        # pylint: disable=protected-access; need to compare with scoring one answer at a time
+        assert [Feedback(code).validities() for code in codes] == [
+            FakeGenerator(word=answer)._guess_word(WORD_INDICES[guess]) for answer in answers
+        ]
+
+
+def test_score_guesses() -> None:
+    """Test scoring a batch of guesses matches scoring each guess, against given or all answers."""
+    # Given
+    guess_ids = np.arange(0, 14000, 1000)
+    answer_ids = VOCABULARY.to_ids(answers)
+
+    # When
+    codes = score_guesses(guess_ids, answer_ids)
+    all_codes = score_guesses(guess_ids)
+
+    # Then
+    assert np.array_equal(codes, np.stack([score_guess(int(guess_id), answer_ids) for guess_id in guess_ids]))
+    assert np.array_equal(all_codes[:, answer_ids], codes)
+
+
+if __name__ == "__main__":
+    main()
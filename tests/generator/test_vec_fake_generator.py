@@ -0,0 +1,65 @@
+"""
+File containing tests for vectorised fake generator.
+
+Functions:
+    test_step_matches_fake_generator() -> None
+    test_finished_games_reset() -> None
+"""
+
+import numpy as np
+from pytest import main
+
+from wordlesolver.data import DICTIONARY, WORD_INDICES, WordFilter
+from wordlesolver.generator import FakeGenerator, Generator, VecFakeGenerator
+
+
+def test_step_matches_fake_generator() -> None:
+    """Test observations, rewards and dones match playing each game with FakeGenerator."""
+    # Given
+    generator = VecFakeGenerator(3, seed=0)
+    generator.reset()
+    answers = ["unite", "crane", "levee"]
+    generator.answers[:] = [WORD_INDICES[answer] for answer in answers]
+    fake_generators = [FakeGenerator(word=answer) for answer in answers]
+    word_filters = [WordFilter() for _ in answers]
+    for fake_generator in fake_generators:
+        fake_generator.reset()
+
+    for guess in ["crane", "spilt", "unite"]:
+        # When
+        observations, rewards, dones, _ = generator.step(np.full(3, WORD_INDICES[guess]))
+
+        # Then
+        for idx, (fake_generator, word_filter) in enumerate(zip(fake_generators, word_filters)):
+            if fake_generator.done:
+                continue
+            observation, reward, done, _ = fake_generator.step(guess)
+            word_filter.filter(guess, observation)
+            assert rewards[idx] == reward
+            assert dones[idx] == done
+            if not done:
+                assert [
+                    DICTIONARY[idx] for idx in np.flatnonzero(np.asarray(observations)[idx])
+                ] == word_filter.possible_words
+
+
+def test_finished_games_reset() -> None:
+    """Test finished games return their last observation in info and start again."""
+    # Given
+    generator = VecFakeGenerator(2, seed=0)
+    generator.reset()
+    generator.answers[:] = [WORD_INDICES["unite"], WORD_INDICES["crane"]]
+
+    # When
+    observations, _, dones, infos = generator.step(np.array([WORD_INDICES["unite"], WORD_INDICES["unite"]]))
+
+    # Then
+    assert list(dones) == [True, False]
+    assert infos[0]["won"]
+    assert np.flatnonzero(infos[0]["terminal_observation"]).tolist() == [WORD_INDICES["unite"]]
+    assert np.asarray(observations)[0].all()
+    assert generator.guesses_remaining.tolist() == [Generator.GUESSES, Generator.GUESSES - 1]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+File containing tests for decision tree solver class.
+
+Functions:
+    test_decision_tree_solver_replays_solver(tmp_path: Path) -> None
+"""
+
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+from pytest import main
+
+from wordlesolver.data import DICTIONARY, WORD_INDICES, LetterValidity
+from wordlesolver.generator import FakeGenerator
+from wordlesolver.solver import (
+    DecisionTreeSolver,
+    MaximiseMatchesSolver,
+    compile_decision_tree,
+    save_decision_tree,
+)
+
+
+def test_decision_tree_solver_replays_solver(tmp_path: Path) -> None:
+    """Test decision tree solver makes the same guesses as the solver it was compiled from."""
+    # Given
+    answers = ["unite", "there", "speed", "geese", "hello", "crane", "lolly", DICTIONARY[0], DICTIONARY[-1]]
+    tree_file = str(tmp_path / "decision_tree.npz")
+    save_decision_tree(
+        compile_decision_tree(
+            MaximiseMatchesSolver(FakeGenerator()), np.array([WORD_INDICES[answer] for answer in answers])
+        ),
+        tree_file,
+    )
+
+    for answer in answers:
+        generator = FakeGenerator()
+        # pylint: disable=protected-access; need to set the answer
+        generator._word_id = WORD_INDICES[answer]
+        solver = MaximiseMatchesSolver(generator)
+        tree_solver = DecisionTreeSolver(generator, tree_file)
+        observation: Tuple[Optional[str], Optional[List[LetterValidity]]] = (None, None)
+
+        for _ in range(generator.GUESSES):
+            # When
+            guess = tree_solver._next_guess(observation)
+
+            # Then
+            assert guess == solver._next_guess(observation)
+            observation = (guess, generator._guess_word(WORD_INDICES[guess]))
+            if guess == answer:
+                break
+
+
+if __name__ == "__main__":
+    main()
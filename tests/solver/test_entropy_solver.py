@@ -0,0 +1,67 @@
+"""
+File containing tests for entropy solver class.
+
+Functions:
+    test_entropies() -> None
+    test_next_guess() -> None
+"""
+
+from collections import Counter
+from math import log2
+from typing import Tuple
+
+import numpy as np
+from pytest import approx, main
+
+from wordlesolver.data import WORD_INDICES, LetterValidity
+from wordlesolver.generator import FakeGenerator
+from wordlesolver.solver import EntropySolver
+
+
+def test_entropies() -> None:
+    """Test entropies match the distribution of feedback from the fake generator."""
+    # Given
+    solver = EntropySolver(FakeGenerator())
+    guesses = ["crane", "eerie", "lolly"]
+    answers = ["unite", "there", "speed", "geese", "hello", "crane"]
+    generator = FakeGenerator()
+
+    # When
+    # pylint: disable=protected-access; need to test scoring directly
+    entropies = solver._entropies(
+        np.array([WORD_INDICES[guess] for guess in guesses]),
+        np.array([WORD_INDICES[answer] for answer in answers]),
+    )
+
+    # Then
+    for guess, entropy in zip(guesses, entropies):
+        feedback: Counter[Tuple[LetterValidity, ...]] = Counter()
+        for answer in answers:
+            generator._word_id = WORD_INDICES[answer]
+            feedback[tuple(generator._guess_word(WORD_INDICES[guess]))] += 1
+        assert entropy == approx(-sum(count / len(answers) * log2(count / len(answers)) for count in feedback.values()))
+
+
+def test_next_guess() -> None:
+    """Test next guess is a possible answer once the search space is narrowed down."""
+    # Given
+    solver = EntropySolver(FakeGenerator())
+    generator = FakeGenerator()
+    # pylint: disable=protected-access; need to set the answer
+    generator._word_id = WORD_INDICES["unite"]
+    observations = [
+        ("crane", generator._guess_word(WORD_INDICES["crane"])),
+        ("spilt", generator._guess_word(WORD_INDICES["spilt"])),
+    ]
+
+    # When
+    # pylint: disable=protected-access; need to test guessing directly
+    guesses = [solver._next_guess(observation) for observation in observations]
+
+    # Then
+    assert guesses[-1] == "unite"
+    assert [LetterValidity.GREEN] * 5 == generator._guess_word(WORD_INDICES[guesses[-1]])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+File containing tests for letter actor critic policies.
+
+Functions:
+    test_words_scored_by_letters() -> None
+    test_exported_policy_chooses_same_word() -> None
+"""
+
+import numpy as np
+import torch as th
+from pytest import main
+from stable_baselines3 import PPO  # type:ignore[attr-defined]
+
+from wordlesolver.data import (
+    DICTIONARY_LENGTH,
+    LETTERS_COUNT,
+    WORD_INDICES,
+    WORD_LENGTH,
+)
+from wordlesolver.generator import FakeGenerator
+from wordlesolver.generator.wrappers import IntWrapper, PreviousActionWrapper
+from wordlesolver.solver import export_policy
+from wordlesolver.solver.letter_policy import (
+    LetterActionNet,
+    MaskedLetterActorCriticPolicy,
+)
+
+
+def test_words_scored_by_letters() -> None:
+    """Test each word's score is the sum of its letters' scores at their positions."""
+    # Given
+    action_net = LetterActionNet(8)
+    latent_pi = th.randn(2, 8)
+
+    # When
+    word_logits = action_net(latent_pi).detach()
+
+    # Then
+    letter_logits = action_net.letter_logits(latent_pi).detach().reshape(2, WORD_LENGTH, LETTERS_COUNT)
+    crane = [ord(letter) - ord("a") for letter in "crane"]
+    assert word_logits.shape == (2, DICTIONARY_LENGTH)
+    assert th.allclose(word_logits[:, WORD_INDICES["crane"]], letter_logits[:, range(WORD_LENGTH), crane].sum(dim=1))
+
+
+def test_exported_policy_chooses_same_word() -> None:
+    """Test the masked letter policy and its NumPy export both choose the same possible word."""
+    # Given
+    generator = IntWrapper(PreviousActionWrapper(FakeGenerator(word="unite")))
+    model = PPO(MaskedLetterActorCriticPolicy, generator, n_steps=64, batch_size=64)
+    generator.reset()
+    observation, *_ = generator.step(WORD_INDICES["crane"])
+    assert isinstance(model.policy, MaskedLetterActorCriticPolicy)
+
+    # When
+    most_likely = int(model.predict(observation, deterministic=True)[0])
+    exported = export_policy(model)
+
+    # Then
+    assert model.policy.action_net.letter_logits.out_features == WORD_LENGTH * LETTERS_COUNT
+    assert most_likely in np.flatnonzero(generator.action_masks())
+    assert exported.masked
+    assert exported.predict(observation) == most_likely
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+File containing tests for masked actor critic policy.
+
+Functions:
+    test_only_possible_words_chosen() -> None
+"""
+
+import numpy as np
+import torch as th
+from pytest import main
+from stable_baselines3 import PPO  # type:ignore[attr-defined]
+
+from wordlesolver.data import DICTIONARY_LENGTH
+from wordlesolver.generator import FakeGenerator
+from wordlesolver.generator.wrappers import IntWrapper, PreviousActionWrapper
+from wordlesolver.solver import export_policy
+from wordlesolver.solver.masked_policy import MaskedActorCriticPolicy
+
+
+def test_only_possible_words_chosen() -> None:
+    """Test sampled, most likely and exported choices are all possible words, and other words are never likely."""
+    # Given
+    generator = IntWrapper(PreviousActionWrapper(FakeGenerator(word="unite")))
+    model = PPO(MaskedActorCriticPolicy, generator, n_steps=64, batch_size=64)
+    generator.reset()
+    observation, *_ = generator.step(int(np.flatnonzero(generator.action_masks())[0]))
+    possible_idxs = np.flatnonzero(generator.action_masks())
+    assert isinstance(model.policy, MaskedActorCriticPolicy)
+
+    # When
+    sampled = {int(model.predict(observation)[0]) for _ in range(50)}
+    most_likely = int(model.predict(observation, deterministic=True)[0])
+    exported = export_policy(model).predict(observation)
+    _, log_probs, _ = model.policy.evaluate_actions(
+        th.as_tensor(np.stack([observation, observation]), dtype=th.float32),
+        th.as_tensor([possible_idxs[0], np.flatnonzero(observation == 0)[0]]),
+    )
+
+    # Then
+    assert 0 < len(possible_idxs) < DICTIONARY_LENGTH
+    assert sampled <= set(possible_idxs)
+    assert most_likely in possible_idxs
+    assert exported == most_likely
+    assert float(log_probs[1]) < -1e6 < float(log_probs[0])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+File containing tests for maximise matches solver class.
+
+Functions:
+    test_count_matches() -> None
+    test_next_guess() -> None
+    test_run(word_filter: str) -> None
+    test_bitset_word_filter_rejects_feedback_matrix() -> None
+"""
+
+from typing import Sequence, Set
+
+import numpy as np
+from pytest import main, mark, raises
+
+from wordlesolver.data import (
+    DICTIONARY,
+    DICTIONARY_LETTERS,
+    WORD_INDICES,
+    LetterValidity,
+)
+from wordlesolver.generator import FakeGenerator
+from wordlesolver.solver import MaximiseMatchesSolver
+
+
+def _count_matches(guess: str, words: Sequence[str]) -> int:
+    matching_chars: Set[str] = set()
+
+    for word in words:
+        for char_0, char_1 in zip(guess, word):
+            if char_0 == char_1:
+                matching_chars.add(char_0)
+    return len(matching_chars)
+
+
+def test_count_matches() -> None:
+    """Test vectorised scores match scoring each guess against each word."""
+    # Given
+    guesses = DICTIONARY[::500]
+    words = ["unite", "eerie", "lolly", "speed"]
+
+    # When
+    # pylint: disable=protected-access; need to test scoring directly
+    matches = MaximiseMatchesSolver._count_matches(
+        DICTIONARY_LETTERS[[WORD_INDICES[guess] for guess in guesses]],
+        DICTIONARY_LETTERS[[WORD_INDICES[word] for word in words]],
+    )
+
+    # Then
+    assert list(matches) == [_count_matches(guess, words) for guess in guesses]
+
+
+def test_next_guess() -> None:
+    """Test next guess is the first possible word with the most matches."""
+    # Given
+    solver = MaximiseMatchesSolver(FakeGenerator())
+    observation = ("crane", [LetterValidity.GREY] * 4 + [LetterValidity.GREEN])
+
+    # When
+    # pylint: disable=protected-access; need to test guessing directly
+    guess = solver._next_guess(observation)
+
+    # Then
+    possible_words = solver.word_filter.possible_words
+    assert guess == max(possible_words, key=lambda word: _count_matches(word, possible_words))
+
+
+@mark.parametrize("word_filter", ["array", "bitset"])
+def test_run(word_filter: str) -> None:
+    """Test game against a fixed answer is won with either word filter, timing each guess."""
+    # Given
+    generator = FakeGenerator(word="unite")
+    solver = MaximiseMatchesSolver(generator, word_filter=word_filter)
+
+    # When
+    latencies = solver.run()
+
+    # Then
+    assert generator.won
+    assert 0 < len(latencies) <= generator.GUESSES
+    assert all(latency >= 0 for latency in latencies)
+    assert isinstance(solver.word_filter, MaximiseMatchesSolver.WORD_FILTERS[word_filter])
+
+
+def test_bitset_word_filter_rejects_feedback_matrix() -> None:
+    """Test a feedback matrix cannot be given to the bitset word filter, which would not use it."""
+    # Given
+    feedback_matrix = np.zeros((1, 1), dtype=np.uint8)
+
+    # When
+    with raises(AssertionError) as exc_info:
+        MaximiseMatchesSolver(FakeGenerator(), feedback_matrix, word_filter="bitset")
+
+    # Then
+    assert "feedback matrix" in str(exc_info.value)
+
+
+if __name__ == "__main__":
+    main()
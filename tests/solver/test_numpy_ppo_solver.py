@@ -0,0 +1,76 @@
+"""
+File containing tests for NumPy ppo solver.
+
+Functions:
+    test_export_policy(tmp_path: Path) -> None
+    test_export_script_needs_trained_weights(tmp_path: Path) -> None
+"""
+
+from os import environ, path
+from pathlib import Path
+from subprocess import run  # nosec B404; runs this interpreter on the export script
+from sys import executable
+
+import numpy as np
+from pytest import main
+from stable_baselines3 import PPO  # type:ignore[attr-defined]
+
+from wordlesolver.data import DICTIONARY_LENGTH
+from wordlesolver.generator import FakeGenerator
+from wordlesolver.generator.wrappers import IntWrapper, PreviousActionWrapper
+from wordlesolver.solver import (
+    NumpyPPOSolver,
+    PPOSolver,
+    export_policy,
+    load_policy,
+    save_policy,
+)
+
+EXPORT_SCRIPT: str = str(Path(__file__).parents[2] / "export_policy.py")
+
+
+def test_export_policy(tmp_path: Path) -> None:
+    """Test the exported policy chooses the same guesses as the model, and can be played once saved."""
+    # Given
+    model = PPO("MlpPolicy", IntWrapper(PreviousActionWrapper(FakeGenerator())), n_steps=64, batch_size=64)
+    observations = np.random.default_rng(0).integers(0, 2, (8, DICTIONARY_LENGTH), dtype=np.uint8)
+    policy_file = str(tmp_path / "policy.npz")
+
+    # When
+    save_policy(export_policy(model), policy_file)
+    policy = load_policy(policy_file)
+    solver = NumpyPPOSolver(FakeGenerator(), policy_file)
+    latencies = solver.run()
+
+    # Then
+    assert [policy.predict(observation) for observation in observations] == [
+        int(model.predict(observation, deterministic=True)[0]) for observation in observations
+    ]
+    assert 1 <= len(latencies) <= FakeGenerator.GUESSES
+
+
+def test_export_script_needs_trained_weights(tmp_path: Path) -> None:
+    """Test exporting without trained weights fails naming the missing file, rather than saving a random policy."""
+    # Given
+    python_path = path.pathsep.join([str(Path(EXPORT_SCRIPT).parent), environ.get("PYTHONPATH", "")])
+
+    # When
+    result = run(  # nosec
+        [executable, EXPORT_SCRIPT, "--output", "policy.npz"],
+        capture_output=True,
+        check=False,
+        cwd=tmp_path,
+        env={**environ, "PYTHONPATH": python_path},
+        text=True,
+    )
+
+    # Then
+    assert result.returncode != 0
+    assert f"AssertionError: No trained weights in {path.join(PPOSolver.OUTPUT_FOLDER, 'ppo_weights.hdf5')}" in (
+        result.stderr
+    )
+    assert not (tmp_path / "policy.npz").exists()
+
+
+if __name__ == "__main__":
+    main()
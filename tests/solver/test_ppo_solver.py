@@ -0,0 +1,81 @@
+"""
+File containing tests for ppo solver training backends.
+
+Functions:
+    test_backend_trains(backend: str, tmp_path: Path, monkeypatch: MonkeyPatch) -> None
+    test_vectorised_backend_needs_fake_generator(tmp_path: Path, monkeypatch: MonkeyPatch) -> None
+    test_environments_copy_generator(backend: str, tmp_path: Path, monkeypatch: MonkeyPatch) -> None
+"""
+
+from pathlib import Path
+from typing import List
+
+from pytest import MonkeyPatch, main, mark, raises
+from stable_baselines3.common.monitor import load_results
+
+from wordlesolver.data import WORD_INDICES, LetterValidity
+from wordlesolver.generator import FakeGenerator, Generator
+from wordlesolver.solver.ppo_solver import PPOSolver
+
+N_ENVS: int = 2
+ROLLOUT_STEPS: int = 64
+
+
+# pylint: disable=too-few-public-methods,abstract-method; stub, never copied
+class _StubGenerator(Generator):
+    """Stub generator, standing in for generators other than FakeGenerator."""
+
+    def _guess_word(self, guess_id: int) -> List[LetterValidity]:
+        return [LetterValidity.GREY] * 5
+
+
+@mark.parametrize("backend", ["dummy", "subprocess", "vectorised"])
+def test_backend_trains(backend: str, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    """Test each backend builds n_envs environments, splits rollouts between them and records episodes."""
+    # Given
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(PPOSolver, "ROLLOUT_STEPS", ROLLOUT_STEPS)
+    solver = PPOSolver(FakeGenerator(), n_envs=N_ENVS, backend=backend)
+
+    # When
+    solver.model.learn(ROLLOUT_STEPS)
+
+    # Then
+    assert solver.model.n_envs == N_ENVS
+    assert solver.model.n_steps == ROLLOUT_STEPS // N_ENVS
+    assert len(load_results(PPOSolver.OUTPUT_FOLDER)) > 0
+
+
+def test_vectorised_backend_needs_fake_generator(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    """Test the vectorised backend rejects generators it can't step, rather than training on fake games."""
+    # Given
+    monkeypatch.chdir(tmp_path)
+
+    # When
+    with raises(AssertionError) as exc_info:
+        PPOSolver(_StubGenerator(), n_envs=N_ENVS, backend="vectorised")
+
+    # Then
+    assert str(exc_info.value) == "Vectorised backend can only train on FakeGenerator with the words observation"
+
+
+@mark.parametrize("backend", ["dummy", "subprocess"])
+def test_environments_copy_generator(backend: str, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    """Test every training environment is configured like the solver's generator, e.g. with its fixed answer."""
+    # Given
+    monkeypatch.chdir(tmp_path)
+    solver = PPOSolver(FakeGenerator(word="unite"), n_envs=N_ENVS, backend=backend)
+    training_generator = solver.model.get_env()
+    assert training_generator is not None
+
+    # When
+    training_generator.reset()
+    generators = training_generator.get_attr("unwrapped")
+
+    # Then
+    # pylint: disable=protected-access; need to check the answer
+    assert [generator._word_id for generator in generators] == [WORD_INDICES["unite"]] * N_ENVS
+
+
+if __name__ == "__main__":
+    main()
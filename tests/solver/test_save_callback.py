@@ -0,0 +1,77 @@
+"""
+File containing tests for save callback.
+
+Functions:
+    test_save_best_model(tmp_path: Path) -> None
+    test_failed_save_surfaces(tmp_path: Path, caplog: LogCaptureFixture) -> None
+"""
+
+from io import BufferedIOBase
+from pathlib import Path
+from typing import Any, Dict, List
+
+from pytest import LogCaptureFixture, main, raises
+
+from wordlesolver.solver.save_callback import SaveCallback
+
+
+# pylint: disable=too-few-public-methods; stub
+class _StubModel:
+    """Stub model, saving the number of timesteps trained for."""
+
+    def __init__(self) -> None:
+        """Initialise object."""
+        self.num_timesteps = 0
+
+    def save(self, file: BufferedIOBase) -> None:
+        """Save number of timesteps."""
+        file.write(str(self.num_timesteps).encode())
+
+
+def test_save_best_model(tmp_path: Path) -> None:
+    """Test rewards are averaged over recent episodes from step infos, and the best model is saved."""
+    # Given
+    callback = SaveCallback(str(tmp_path), "weights.zip", eval_interval=2)
+    model = _StubModel()
+    callback.model = model  # type: ignore[assignment] # stands in for an algorithm
+    steps: List[List[Dict[str, Any]]] = [
+        [{"episode": {"r": 10.0, "l": 3}}, {}],
+        [{}, {"episode": {"r": 20.0, "l": 5}}],
+        [{"episode": {"r": 0.0, "l": 6}}, {"episode": {"r": 0.0, "l": 6}}],
+        [{}, {}],
+    ]
+
+    # When
+    for infos in steps:
+        model.num_timesteps += len(infos)
+        callback.update_locals({"infos": infos})
+        callback.on_step()
+    callback.on_training_end()
+
+    # Then
+    assert list(callback.episodes) == [(10.0, 3), (20.0, 5), (0.0, 6), (0.0, 6)]
+    assert callback.best_averaged_reward == 15.0
+    assert (tmp_path / "weights.zip").read_text() == "4"
+    assert not (tmp_path / "weights.zip.tmp").exists()
+
+
+def test_failed_save_surfaces(tmp_path: Path, caplog: LogCaptureFixture) -> None:
+    """Test a failed background write is logged, and raised when the next save is made rather than lost."""
+    # Given
+    callback = SaveCallback(str(tmp_path / "missing"), "weights.zip", eval_interval=1)
+    model = _StubModel()
+    # pylint: disable=protected-access; need to save directly
+    callback._save(model)  # type: ignore[arg-type] # stands in for an algorithm
+
+    # When
+    with raises(FileNotFoundError):
+        callback._save(model)  # type: ignore[arg-type] # stands in for an algorithm
+    # Waits for the failed write's callback, run by the writer thread once the write has failed
+    callback._writer.shutdown(wait=True)
+
+    # Then
+    assert "Saving weights failed: FileNotFoundError" in caplog.text
+
+
+if __name__ == "__main__":
+    main()
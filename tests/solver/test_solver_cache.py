@@ -0,0 +1,117 @@
+"""
+File containing tests for solver cache class.
+
+Functions:
+    test_memory_eviction() -> None
+    test_disk_persistence(tmp_path: Path) -> None
+    test_disk_eviction(tmp_path: Path) -> None
+    test_shared_disk_eviction(tmp_path: Path) -> None
+    test_solver_uses_cache() -> None
+"""
+
+from pathlib import Path
+
+import numpy as np
+from pytest import main
+
+from wordlesolver.data import LetterValidity
+from wordlesolver.generator import FakeGenerator
+from wordlesolver.solver import MaximiseMatchesSolver, SolverCache
+
+
+def test_memory_eviction() -> None:
+    """Test least recently used guesses are evicted from memory."""
+    # Given
+    cache = SolverCache(None, memory_size=2)
+    cache.put("a", "crane")
+    cache.put("b", "unite")
+    cache.get("a")
+
+    # When
+    cache.put("c", "there")
+
+    # Then
+    assert cache.get("a") == "crane"
+    assert cache.get("b") is None
+    assert cache.get("c") == "there"
+    assert cache.stats["memory_evictions"] == 1
+    assert cache.stats["memory_hits"] == 3
+    assert cache.stats["misses"] == 1
+
+
+def test_disk_persistence(tmp_path: Path) -> None:
+    """Test guesses are shared between cache instances through disk."""
+    # Given
+    file_path = str(tmp_path / "cache.sqlite")
+    cache = SolverCache(file_path)
+    key = cache.key("MaximiseMatchesSolver", np.arange(10))
+    cache.put(key, "crane", 2.5)
+    cache.close()
+
+    # When
+    new_cache = SolverCache(file_path)
+    guess = new_cache.get(key)
+
+    # Then
+    assert guess == "crane"
+    assert new_cache.stats["disk_hits"] == 1
+    assert new_cache.stats["seconds_saved"] == 2.5
+    assert new_cache.get(new_cache.key("EntropySolver", np.arange(10))) is None
+
+
+def test_disk_eviction(tmp_path: Path) -> None:
+    """Test least recently used guesses are evicted from disk."""
+    # Given
+    cache = SolverCache(str(tmp_path / "cache.sqlite"), memory_size=0, disk_size=2)
+    cache.put("a", "crane")
+    cache.put("b", "unite")
+    cache.get("a")
+
+    # When
+    cache.put("c", "there")
+
+    # Then
+    assert cache.get("a") == "crane"
+    assert cache.get("b") is None
+    assert cache.get("c") == "there"
+    assert cache.stats["disk_evictions"] == 1
+
+
+def test_shared_disk_eviction(tmp_path: Path) -> None:
+    """Test the disk size bound holds when several caches, e.g. in different processes, share a file."""
+    # Given
+    file_path = str(tmp_path / "cache.sqlite")
+    caches = [SolverCache(file_path, memory_size=0, disk_size=2) for _ in range(2)]
+
+    # When
+    for cache, key in zip(caches * 2, "abcd"):
+        cache.put(key, "crane")
+
+    # Then
+    assert [caches[0].get(key) is not None for key in "abcd"] == [False, False, True, True]
+    assert sum(cache.stats["disk_evictions"] for cache in caches) == 2
+
+
+def test_solver_uses_cache() -> None:
+    """Test solver reuses the guess for the same remaining candidates."""
+    # Given
+    observation = ("crane", [LetterValidity.GREY] * 4 + [LetterValidity.GREEN])
+    cache = SolverCache(None)
+    solver = MaximiseMatchesSolver(FakeGenerator())
+    solver.cache = cache
+    other_solver = MaximiseMatchesSolver(FakeGenerator())
+    other_solver.cache = cache
+
+    # When
+    # pylint: disable=protected-access; need to test guessing directly
+    guess = solver._next_guess(observation)
+    other_guess = other_solver._next_guess(observation)
+
+    # Then
+    assert guess == other_guess
+    assert cache.stats["misses"] == 1
+    assert cache.stats["memory_hits"] == 1
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+File containing startup tests.
+
+Functions:
+    test_registries_import_lazily() -> None
+"""
+
+from subprocess import run  # nosec B404; runs this interpreter on fixed code
+from sys import executable
+
+from pytest import main
+
+STARTUP_CODE: str = """
+import sys
+from wordlesolver.generator import generators
+from wordlesolver.solver import solvers
+generators["FakeGenerator"]
+solvers["MaximiseMatchesSolver"]
+print(",".join(module for module in ["torch", "stable_baselines3", "playwright"] if module in sys.modules))
+"""
+
+
+def _run_startup_code() -> str:
+    return run([executable, "-c", STARTUP_CODE], capture_output=True, check=True, text=True).stdout.strip()  # nosec
+
+
+def test_registries_import_lazily() -> None:
+    """Test looking up light generators and solvers doesn't import heavy dependencies."""
+    # When
+    heavy_modules = _run_startup_code()
+
+    # Then
+    assert heavy_modules == ""
+
+
+if __name__ == "__main__":
+    main()
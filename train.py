@@ -7,7 +7,7 @@ Functions:
 
 # pylint: disable=duplicate-code; similar to main file
 
-from argparse import ArgumentParser, Namespace
+from argparse import ArgumentParser, BooleanOptionalAction, Namespace
 from logging import INFO, basicConfig
 
 from wordlesolver.generator import FakeGenerator
@@ -27,6 +27,31 @@ def parse_arguments() -> Namespace:
         action=ValidateSolver,
         help="Wordle solver to use",
     )
+    parser.add_argument(
+        "--n-envs",
+        type=int,
+        help="Number of environments to gather experience from at once",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["dummy", "subprocess", "vectorised"],
+        help="Run environments in process, in worker processes, or stepped together as one vectorised environment",
+    )
+    parser.add_argument(
+        "--actions",
+        choices=["words", "letters"],
+        help="Score every word, or every letter at every position with words scored by their letters",
+    )
+    parser.add_argument(
+        "--observation",
+        choices=["words", "letters"],
+        help="Observe the words still possible, or what is known about each letter",
+    )
+    parser.add_argument(
+        "--mask-actions",
+        action=BooleanOptionalAction,
+        help="Only sample words still possible",
+    )
 
     return parser.parse_args()
 
@@ -36,6 +61,11 @@ if __name__ == "__main__":
     args = parse_arguments()
 
     generator = FakeGenerator()
-    solver = args.solver(generator)
+    training_options = {
+        name: getattr(args, name)
+        for name in ["n_envs", "backend", "observation", "actions", "mask_actions"]
+        if getattr(args, name) is not None
+    }
+    solver = args.solver(generator, **training_options)
 
     solver.train()
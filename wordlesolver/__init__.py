@@ -1,5 +1,12 @@
-"""Import file."""
+"""Import file, importing each subpackage once it is used."""
 
-from . import data, generator, solver
+from typing import TYPE_CHECKING
+
+from .lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from . import data, generator, solver
+
+__getattr__ = lazy_attributes(__name__, {"data": ".data", "generator": ".generator", "solver": ".solver"})
 
 __all__ = ["data", "generator", "solver"]
@@ -1,17 +1,81 @@
 """Import file."""
 
-from .answers import get_answer
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_attributes
+from .bitset_word_filter import BitsetWordFilter, BitsetWords
+from .feedback import (
+    FEEDBACK_CODES,
+    FEEDBACK_VALIDITIES,
+    GREEN_COUNTS,
+    WIN_FEEDBACK,
+    YELLOW_COUNTS,
+    Feedback,
+)
+from .feedback_matrix import (
+    FEEDBACK_MATRIX_FILE,
+    build_feedback_matrix,
+    decode_feedback,
+    encode_feedback,
+    feedback_codes,
+    load_feedback_matrix,
+    save_feedback_matrix,
+)
 from .letter_validity import LetterValidity
+from .vocabulary import VOCABULARY, Vocabulary
 from .word_filter import WordFilter
-from .words import DICTIONARY, DICTIONARY_LENGTH, LETTERS, LETTERS_COUNT, WORD_LENGTH
+from .words import (
+    DICTIONARY,
+    DICTIONARY_COUNTS,
+    DICTIONARY_LENGTH,
+    DICTIONARY_LETTER_IDXS,
+    DICTIONARY_LETTERS,
+    LETTERS,
+    LETTERS_COUNT,
+    WORD_INDICES,
+    WORD_LENGTH,
+    save_words_cache,
+)
+
+if TYPE_CHECKING:
+    from .answers import ANSWERS_CACHE_FILE, get_answer, get_answers
+
+# Fetching answers needs requests, so is only imported once used
+__getattr__ = lazy_attributes(
+    __name__, {"get_answer": ".answers", "get_answers": ".answers", "ANSWERS_CACHE_FILE": ".answers"}
+)
 
 __all__ = [
     "WordFilter",
+    "BitsetWordFilter",
+    "BitsetWords",
     "LetterValidity",
     "get_answer",
+    "get_answers",
+    "ANSWERS_CACHE_FILE",
+    "Vocabulary",
+    "VOCABULARY",
     "DICTIONARY",
     "DICTIONARY_LENGTH",
+    "DICTIONARY_LETTERS",
+    "DICTIONARY_COUNTS",
+    "DICTIONARY_LETTER_IDXS",
+    "WORD_INDICES",
     "WORD_LENGTH",
     "LETTERS",
     "LETTERS_COUNT",
+    "save_words_cache",
+    "Feedback",
+    "FEEDBACK_CODES",
+    "FEEDBACK_VALIDITIES",
+    "GREEN_COUNTS",
+    "YELLOW_COUNTS",
+    "WIN_FEEDBACK",
+    "FEEDBACK_MATRIX_FILE",
+    "encode_feedback",
+    "decode_feedback",
+    "feedback_codes",
+    "build_feedback_matrix",
+    "save_feedback_matrix",
+    "load_feedback_matrix",
 ]
@@ -1,34 +1,153 @@
 """
-File containing helper function for fetching a particular day's answer.
+File containing helper functions for fetching past days' answers, cached on disk.
 
 Functions:
-    get_answer(date: datetime) -> str
+    get_answer(day: date, ...) -> str
+    get_answers(start: date, end: date, ...) -> Dict[date, str]
+
+Misc variables:
+    ANSWERS_URL : str
+    ANSWERS_CACHE_FILE : str
+    ANSWER_WORKERS : int
 """
 
-from datetime import datetime
-from json import loads
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from json import dumps, loads
+from os import makedirs, path, replace
+from tempfile import mkstemp
+from typing import Dict, Optional
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+ANSWERS_URL: str = "https://www.nytimes.com/svc/wordle/v2/{date}.json"
+ANSWERS_CACHE_FILE: str = path.join("out", "answers.json")
+ANSWER_WORKERS: int = 8
+
+
+@lru_cache(maxsize=None)
+def _session(workers: int) -> Session:
+    session = Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=workers))
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=workers))
+
+    return session
+
+
+def _day(day: date) -> date:
+    return day.date() if isinstance(day, datetime) else day
+
+
+def _fetch_answer(day: date, url: str, workers: int) -> str:
+    response = _session(workers).get(url.format(date=day.isoformat()), timeout=10)
+    response.raise_for_status()
+
+    return str(loads(response.content)["solution"])
+
+
+def _load_cache(cache_file: Optional[str]) -> Dict[str, str]:
+    if cache_file is None or not path.exists(cache_file):
+        return {}
+
+    with open(cache_file, "r", encoding="utf-8") as file:
+        cache: Dict[str, str] = loads(file.read())
+
+    return cache
+
+
+def _save_cache(cache_file: str, cache: Dict[str, str]) -> None:
+    folder = path.dirname(cache_file) or "."
+    makedirs(folder, exist_ok=True)
 
-from requests import get
+    # Written to a file of its own then swapped in, so processes saving at once never mix their writes
+    file_descriptor, temporary_file = mkstemp(dir=folder, prefix=f"{path.basename(cache_file)}.", suffix=".tmp")
+    with open(file_descriptor, "w", encoding="utf-8") as file:
+        # Merged with the cache as saved now, keeping answers other processes added since it was loaded
+        file.write(dumps({**_load_cache(cache_file), **cache}, indent=0, sort_keys=True))
+    replace(temporary_file, cache_file)
 
 
-def get_answer(date: datetime) -> str:
+def get_answer(day: date, cache_file: Optional[str] = ANSWERS_CACHE_FILE, url: Optional[str] = ANSWERS_URL) -> str:
     """
     Fetch a particular day's answer.
 
     Parameters
     ----------
-    date : datetime
+    day : date
         Day to get answer for
+    cache_file : Optional[str]
+        File caching answers between runs, or None to always fetch
+    url : Optional[str]
+        Url of a day's answer with {date} in place of the day, or None to work offline from the cache
 
     Returns
     -------
     str
     """
-    return str(
-        loads(
-            get(
-                f"https://www.nytimes.com/svc/wordle/v2/{date.year}-{date.month}-{date.day}.json",
-                timeout=10,
-            ).content
-        )["solution"]
-    )
+    return get_answers(day, day, cache_file, url=url)[_day(day)]
+
+
+def get_answers(
+    start: date,
+    end: date,
+    cache_file: Optional[str] = ANSWERS_CACHE_FILE,
+    workers: int = ANSWER_WORKERS,
+    url: Optional[str] = ANSWERS_URL,
+) -> Dict[date, str]:
+    """
+    Fetch every day's answer from start to end inclusive, fetching days missing from the cache concurrently.
+
+    Parameters
+    ----------
+    start : date
+        First day to get answer for
+    end : date
+        Last day to get answer for
+    cache_file : Optional[str]
+        File caching answers between runs, or None to always fetch
+    workers : int
+        Maximum number of answers fetched at once, over pooled connections
+    url : Optional[str]
+        Url of a day's answer with {date} in place of the day, or None to work offline from the cache
+
+    Returns
+    -------
+    Dict[date, str]
+        Answer of each day
+
+    Raises
+    ------
+    AssertionError
+        If any day's answer couldn't be fetched, once the answers that could be are cached
+    """
+    days = [_day(start) + timedelta(days=offset) for offset in range((_day(end) - _day(start)).days + 1)]
+    cache = _load_cache(cache_file)
+
+    if missing := [day for day in days if day.isoformat() not in cache]:
+        if url is None:
+            raise AssertionError(f"No cached answer for {missing[0].isoformat()}")
+
+        answers: Dict[str, str] = {}
+        failures: Dict[date, BaseException] = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fetches: Dict[Future[str], date] = {
+                executor.submit(_fetch_answer, day, url, workers): day for day in missing
+            }
+            # Each answer is kept as it arrives, so one failed day doesn't lose the others
+            for fetch in as_completed(fetches):
+                if (exception := fetch.exception()) is not None:
+                    failures[fetches[fetch]] = exception
+                else:
+                    answers[fetches[fetch].isoformat()] = fetch.result()
+
+        cache.update(answers)
+        if cache_file is not None and answers:
+            _save_cache(cache_file, cache)
+
+        if failures:
+            failed_days = ", ".join(day.isoformat() for day in sorted(failures))
+            raise AssertionError(f"Failed to fetch answers for {failed_days}") from failures[min(failures)]
+
+    return {day: cache[day.isoformat()] for day in days}
@@ -0,0 +1,191 @@
+"""
+File containing bitset word filter class.
+
+Classes:
+    BitsetWords(Sequence[str])
+    BitsetWordFilter(WordFilter)
+"""
+
+from functools import cache
+from typing import Iterator, List, Optional, Sequence, Tuple, Union, overload
+
+import numpy as np
+import numpy.typing as npt
+
+from .feedback import FEEDBACK_VALIDITIES, Feedback
+from .letter_validity import LetterValidity
+from .word_filter import WordFilter
+from .words import (
+    DICTIONARY,
+    DICTIONARY_COUNTS,
+    DICTIONARY_LENGTH,
+    DICTIONARY_LETTERS,
+    LETTERS_COUNT,
+    WORD_INDICES,
+    WORD_LENGTH,
+)
+
+Bitmaps = Tuple[Tuple[int, ...], ...]
+
+
+def _to_bitmap(mask: npt.NDArray[np.bool_]) -> int:
+    return int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+
+
+def _to_idxs(bitmap: int) -> npt.NDArray[np.int_]:
+    bitmap_bytes = np.frombuffer(bitmap.to_bytes((DICTIONARY_LENGTH + 7) // 8, "little"), dtype=np.uint8)
+
+    return np.flatnonzero(np.unpackbits(bitmap_bytes, bitorder="little")[:DICTIONARY_LENGTH])
+
+
+@cache
+def _position_bitmaps() -> Bitmaps:
+    """Bitmaps of words with letter L at position P, indexed [P][L]."""
+    return tuple(
+        tuple(_to_bitmap(DICTIONARY_LETTERS[:, pos] == letter) for letter in range(LETTERS_COUNT))
+        for pos in range(WORD_LENGTH)
+    )
+
+
+@cache
+def _count_bitmaps() -> Bitmaps:
+    """Bitmaps of words with letter L occurring at least C times, indexed [L][C]."""
+    return tuple(
+        tuple(_to_bitmap(DICTIONARY_COUNTS[:, letter] >= count) for count in range(WORD_LENGTH + 2))
+        for letter in range(LETTERS_COUNT)
+    )
+
+
+class BitsetWords(Sequence[str]):
+    """
+    Possible words backed by a bitmap over dictionary indices, only materialised when indexed or iterated.
+
+    ...
+
+    Properties
+    ----------
+    bitmap : int
+        Bitmap of possible dictionary indices
+    """
+
+    def __init__(self, bitmap: int) -> None:
+        """Initialise object."""
+        self._bitmap: int = bitmap
+        self._words: Optional[List[str]] = None
+
+    @property
+    def bitmap(self) -> int:
+        """Bitmap of possible dictionary indices."""
+        return self._bitmap
+
+    def __len__(self) -> int:
+        """Count possible words without materialising them."""
+        return self._bitmap.bit_count()
+
+    def __contains__(self, word: object) -> bool:
+        """Check a word is possible without materialising the others."""
+        return isinstance(word, str) and word in WORD_INDICES and bool(self._bitmap >> WORD_INDICES[word] & 1)
+
+    @overload
+    def __getitem__(self, idx: int) -> str:
+        """Get possible word by position."""
+
+    @overload
+    def __getitem__(self, idx: slice) -> List[str]:
+        """Get possible words by positions."""
+
+    def __getitem__(self, idx: int | slice) -> str | List[str]:
+        """Get possible word(s) by position."""
+        return self._materialise()[idx]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over possible words."""
+        return iter(self._materialise())
+
+    def _materialise(self) -> List[str]:
+        if self._words is None:
+            self._words = [DICTIONARY[idx] for idx in _to_idxs(self._bitmap)]
+
+        return self._words
+
+
+class BitsetWordFilter(WordFilter):
+    """
+    Bitset word filter class, applying each constraint as a few AND/ANDNOT operations on precomputed bitmaps.
+
+    ...
+
+    Properties
+    ----------
+    possible_idxs : npt.NDArray[np.int_]
+        Dictionary indices of possible words left in search space
+    possible_words : BitsetWords
+        Possible words left in search space
+
+    Methods
+    -------
+    filter(self, guess: Optional[Union[str, int]], word_validity: Optional[Union[...]]) -> None
+        Filter possible words list given a guess and corresponding validity
+    reset(self) -> None
+        Make every word possible again
+    """
+
+    # pylint: disable=super-init-not-called; the bitmap replaces the base class's index array and words list
+    def __init__(self) -> None:
+        """Initialise object."""
+        self._bitmap: int = (1 << DICTIONARY_LENGTH) - 1
+        self._bitset_words: BitsetWords = BitsetWords(self._bitmap)
+
+    @property
+    def possible_idxs(self) -> npt.NDArray[np.int_]:
+        """Dictionary indices of possible words left in search space."""
+        return _to_idxs(self._bitmap)
+
+    @property
+    def possible_words(self) -> BitsetWords:
+        """Possible words left in search space."""
+        return self._bitset_words
+
+    def filter(
+        self, guess: Optional[Union[str, int]], word_validity: Optional[Union[List[LetterValidity], Feedback]]
+    ) -> None:
+        """
+        Filter possible words list given a guess and corresponding validity.
+
+        Parameters
+        ----------
+        guess : Optional[Union[str, int]]
+            Guessed word or its ID
+        word_validity : Optional[Union[List[LetterValidity], Feedback]]
+            Corresponding validity, or the same packed as feedback
+        """
+        if guess is not None and word_validity is not None:
+            letters = self._guess_letters(guess).tolist()
+            validities = FEEDBACK_VALIDITIES[Feedback.of(word_validity)].tolist()
+            position_bitmaps = _position_bitmaps()
+            count_bitmaps = _count_bitmaps()
+            counts = [0] * LETTERS_COUNT
+            exact = [False] * LETTERS_COUNT
+
+            for pos, (letter, validity) in enumerate(zip(letters, validities)):
+                if validity == LetterValidity.GREEN.value:
+                    self._bitmap &= position_bitmaps[pos][letter]
+                else:
+                    self._bitmap &= ~position_bitmaps[pos][letter]
+
+                if validity == LetterValidity.GREY.value:
+                    exact[letter] = True
+                else:
+                    counts[letter] += 1
+
+            for letter in set(letters):
+                self._bitmap &= count_bitmaps[letter][counts[letter]]
+                if exact[letter]:
+                    self._bitmap &= ~count_bitmaps[letter][counts[letter] + 1]
+
+            self._bitset_words = BitsetWords(self._bitmap)
+
+    def reset(self) -> None:
+        """Make every word possible again."""
+        self._bitmap = (1 << DICTIONARY_LENGTH) - 1
+        self._bitset_words = BitsetWords(self._bitmap)
@@ -0,0 +1,131 @@
+"""
+File containing packed feedback type and its lookup tables.
+
+Feedback on a guess is packed into one int in base 3, with the first letter as the least significant digit, so values
+range from 0 (all grey) to 242 (all green) and can index arrays directly.
+
+Classes:
+    Feedback(int)
+
+Misc variables:
+    FEEDBACK_CODES : int
+    FEEDBACK_VALIDITIES : npt.NDArray[np.uint8]
+    GREEN_COUNTS : npt.NDArray[np.uint8]
+    YELLOW_COUNTS : npt.NDArray[np.uint8]
+    WIN_FEEDBACK : Feedback
+"""
+
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from .letter_validity import LetterValidity
+from .words import WORD_LENGTH
+
+FEEDBACK_CODES: int = len(LetterValidity) ** WORD_LENGTH
+
+_POWERS: npt.NDArray[np.int_] = len(LetterValidity) ** np.arange(WORD_LENGTH)
+
+FEEDBACK_VALIDITIES: npt.NDArray[np.uint8] = (
+    np.arange(FEEDBACK_CODES)[:, None] // _POWERS % len(LetterValidity)
+).astype(np.uint8)
+GREEN_COUNTS: npt.NDArray[np.uint8] = (FEEDBACK_VALIDITIES == LetterValidity.GREEN.value).sum(axis=1, dtype=np.uint8)
+YELLOW_COUNTS: npt.NDArray[np.uint8] = (FEEDBACK_VALIDITIES == LetterValidity.YELLOW.value).sum(axis=1, dtype=np.uint8)
+
+_VALIDITY_LISTS: Tuple[Tuple[LetterValidity, ...], ...] = tuple(
+    tuple(LetterValidity(value) for value in validities) for validities in FEEDBACK_VALIDITIES.tolist()
+)
+
+
+class Feedback(int):
+    """
+    Feedback class, the validity of every letter of a guess packed into one int.
+
+    ...
+
+    Properties
+    ----------
+    green_count : int
+        Number of letters in the correct place
+    yellow_count : int
+        Number of letters in the incorrect place
+    won : bool
+        Whether every letter is in the correct place
+
+    Methods
+    -------
+    from_validities(word_validity: Sequence[LetterValidity]) -> Feedback
+        Pack the validity of each letter
+    validities(self) -> List[LetterValidity]
+        Unpack the validity of each letter
+    of(feedback: Union[Feedback, int, Sequence[LetterValidity]]) -> Feedback
+        Get feedback, packing it if given the validity of each letter
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_validities(cls, word_validity: Sequence[LetterValidity]) -> "Feedback":
+        """
+        Pack the validity of each letter.
+
+        Parameters
+        ----------
+        word_validity : Sequence[LetterValidity]
+            Validity of each letter
+
+        Returns
+        -------
+        Feedback
+        """
+        return cls(sum(validity.value * int(power) for validity, power in zip(word_validity, _POWERS)))
+
+    @property
+    def green_count(self) -> int:
+        """Number of letters in the correct place."""
+        return int(GREEN_COUNTS[self])
+
+    @property
+    def yellow_count(self) -> int:
+        """Number of letters in the incorrect place."""
+        return int(YELLOW_COUNTS[self])
+
+    @property
+    def won(self) -> bool:
+        """Whether every letter is in the correct place."""
+        return self == FEEDBACK_CODES - 1
+
+    def validities(self) -> List[LetterValidity]:
+        """
+        Unpack the validity of each letter.
+
+        Returns
+        -------
+        List[LetterValidity]
+        """
+        return list(_VALIDITY_LISTS[self])
+
+    @staticmethod
+    def of(feedback: Union["Feedback", int, Sequence[LetterValidity]]) -> "Feedback":
+        """
+        Get feedback, packing it if given the validity of each letter.
+
+        Parameters
+        ----------
+        feedback : Union[Feedback, int, Sequence[LetterValidity]]
+            Packed feedback or validity of each letter
+
+        Returns
+        -------
+        Feedback
+        """
+        if isinstance(feedback, Feedback):
+            return feedback
+        if isinstance(feedback, (int, np.integer)):
+            return Feedback(feedback)
+
+        return Feedback.from_validities(feedback)
+
+
+WIN_FEEDBACK: Feedback = Feedback(FEEDBACK_CODES - 1)
@@ -0,0 +1,172 @@
+"""
+File containing helpers for the precomputed guess x answer feedback matrix.
+
+Each cell of the matrix holds the feedback for a guess (row) against an answer (column), encoded in base 3 with the
+first letter as the least significant digit, so codes range from 0 (all grey) to 242 (all green).
+
+Functions:
+    encode_feedback(word_validity: List[LetterValidity]) -> int
+    decode_feedback(code: int) -> List[LetterValidity]
+    feedback_codes(guesses: npt.NDArray[np.uint8], answers: npt.NDArray[np.uint8]) -> npt.NDArray[np.uint8]
+    build_feedback_matrix(batch_size: int) -> npt.NDArray[np.uint8]
+    save_feedback_matrix(matrix: npt.NDArray[np.uint8], file_path: str) -> None
+    load_feedback_matrix(file_path: str) -> npt.NDArray[np.uint8]
+
+Misc variables:
+    FEEDBACK_MATRIX_VERSION : int
+    FEEDBACK_MATRIX_FILE : str
+"""
+
+from os import makedirs, path, replace
+from typing import List
+
+import numpy as np
+import numpy.typing as npt
+from tqdm import tqdm
+
+from .feedback import Feedback
+from .letter_validity import LetterValidity
+from .words import DICTIONARY_LENGTH, DICTIONARY_LETTERS, LETTERS_COUNT, WORD_LENGTH
+
+FEEDBACK_MATRIX_VERSION: int = 1
+FEEDBACK_MATRIX_FILE: str = path.join("out", f"feedback_matrix_v{FEEDBACK_MATRIX_VERSION}.npy")
+
+_POWERS: npt.NDArray[np.uint8] = (len(LetterValidity) ** np.arange(WORD_LENGTH)).astype(np.uint8)
+
+
+def encode_feedback(word_validity: List[LetterValidity]) -> int:
+    """
+    Encode a word's validity as a base 3 feedback code.
+
+    Parameters
+    ----------
+    word_validity : List[LetterValidity]
+        Validity of each letter
+
+    Returns
+    -------
+    int
+    """
+    return Feedback.from_validities(word_validity)
+
+
+def decode_feedback(code: int) -> List[LetterValidity]:
+    """
+    Decode a base 3 feedback code into a word's validity.
+
+    Parameters
+    ----------
+    code : int
+        Feedback code
+
+    Returns
+    -------
+    List[LetterValidity]
+    """
+    return Feedback(code).validities()
+
+
+def feedback_codes(guesses: npt.NDArray[np.uint8], answers: npt.NDArray[np.uint8]) -> npt.NDArray[np.uint8]:
+    """
+    Score every guess against every answer, handling repeated letters the same way as FakeGenerator.
+
+    Parameters
+    ----------
+    guesses : npt.NDArray[np.uint8]
+        (G, WORD_LENGTH) letter indices of the guesses
+    answers : npt.NDArray[np.uint8]
+        (A, WORD_LENGTH) letter indices of the answers
+
+    Returns
+    -------
+    npt.NDArray[np.uint8]
+        (G, A) feedback codes
+    """
+    letter_counts = (answers[:, :, None] == np.arange(LETTERS_COUNT, dtype=np.uint8)).sum(axis=1, dtype=np.int8)
+
+    # available[g, p, a] is how many copies of letter p of guess g are left in answer a to mark yellow
+    available = letter_counts.T[guesses]
+    green = guesses[:, :, None] == answers.T[None, :, :]
+    same_letter = guesses[:, :, None] == guesses[:, None, :]
+
+    # Greens use up copies first, then earlier letters claim the remaining copies from left to right
+    for pos in range(WORD_LENGTH):
+        for other_pos in range(WORD_LENGTH):
+            if other_pos < pos:
+                available[same_letter[:, pos, other_pos], pos] -= 1
+            else:
+                available[:, pos] -= green[:, other_pos] & same_letter[:, pos, other_pos, None]
+
+    codes: npt.NDArray[np.uint8] = np.zeros((len(guesses), len(answers)), dtype=np.uint8)
+    for pos, power in enumerate(_POWERS):
+        codes += np.where(
+            green[:, pos],
+            power * np.uint8(LetterValidity.GREEN.value),
+            np.where(available[:, pos] > 0, power * np.uint8(LetterValidity.YELLOW.value), np.uint8(0)),
+        )
+
+    return codes
+
+
+def build_feedback_matrix(batch_size: int = 256) -> npt.NDArray[np.uint8]:
+    """
+    Compute the feedback of every dictionary word against every dictionary word.
+
+    Parameters
+    ----------
+    batch_size : int
+        Number of guesses to score at once
+
+    Returns
+    -------
+    npt.NDArray[np.uint8]
+    """
+    matrix: npt.NDArray[np.uint8] = np.empty((DICTIONARY_LENGTH, DICTIONARY_LENGTH), dtype=np.uint8)
+
+    for start in tqdm(range(0, DICTIONARY_LENGTH, batch_size)):
+        matrix[start : start + batch_size] = feedback_codes(
+            DICTIONARY_LETTERS[start : start + batch_size], DICTIONARY_LETTERS
+        )
+
+    return matrix
+
+
+def save_feedback_matrix(matrix: npt.NDArray[np.uint8], file_path: str = FEEDBACK_MATRIX_FILE) -> None:
+    """
+    Save the feedback matrix, replacing any existing file atomically.
+
+    Parameters
+    ----------
+    matrix : npt.NDArray[np.uint8]
+        Feedback matrix
+    file_path : str
+        File to save to
+    """
+    if folder := path.dirname(file_path):
+        makedirs(folder, exist_ok=True)
+
+    temporary_file_path = f"{file_path}.tmp"
+    with open(temporary_file_path, "wb") as file:
+        np.save(file, matrix)
+    replace(temporary_file_path, file_path)
+
+
+def load_feedback_matrix(file_path: str = FEEDBACK_MATRIX_FILE) -> npt.NDArray[np.uint8]:
+    """
+    Memory map the feedback matrix, so processes share one page cached copy.
+
+    Parameters
+    ----------
+    file_path : str
+        File to load from
+
+    Returns
+    -------
+    npt.NDArray[np.uint8]
+    """
+    matrix: npt.NDArray[np.uint8] = np.load(file_path, mmap_mode="r")
+
+    if matrix.shape != (DICTIONARY_LENGTH, DICTIONARY_LENGTH) or matrix.dtype != np.uint8:
+        raise AssertionError(f"Feedback matrix {file_path} does not match dictionary, rebuild it")
+
+    return matrix
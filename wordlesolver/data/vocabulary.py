@@ -0,0 +1,134 @@
+"""
+File containing vocabulary class, interning words as integer IDs.
+
+Classes:
+    Vocabulary
+
+Misc variables:
+    VOCABULARY : Vocabulary
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from .words import DICTIONARY, WORD_INDICES
+
+
+class Vocabulary:
+    """
+    Vocabulary class, mapping between words and their integer IDs in constant time.
+
+    ...
+
+    Methods
+    -------
+    find_id(self, word: Union[str, int, np.integer]) -> Optional[int]
+        Find ID of a word or ID, or None if it is not in the vocabulary
+    to_id(self, word: str) -> int
+        Get ID of a word
+    to_word(self, word_id: int) -> str
+        Get word of an ID
+    to_ids(self, words: Iterable[str]) -> npt.NDArray[np.int_]
+        Get IDs of words
+    to_words(self, word_ids: Iterable[int]) -> List[str]
+        Get words of IDs
+    """
+
+    def __init__(self, words: Sequence[str], ids: Optional[Dict[str, int]] = None) -> None:
+        """Initialise object, optionally reusing an existing word to ID mapping."""
+        self._words: Sequence[str] = words
+        self._ids: Dict[str, int] = ids if ids is not None else {word: idx for idx, word in enumerate(words)}
+
+    def __len__(self) -> int:
+        """Return number of words."""
+        return len(self._words)
+
+    def __contains__(self, word: object) -> bool:
+        """Return whether a word or ID is in the vocabulary."""
+        return isinstance(word, (str, int, np.integer)) and self.find_id(word) is not None
+
+    def find_id(self, word: Union[str, int, np.integer]) -> Optional[int]:
+        """
+        Find ID of a word or integer ID, or None if it is not in the vocabulary.
+
+        Parameters
+        ----------
+        word : Union[str, int, np.integer]
+            Word or ID
+
+        Returns
+        -------
+        Optional[int]
+        """
+        if isinstance(word, str):
+            return self._ids.get(word)
+        # Anything else, even a float or bool that would convert to an int, isn't a word ID
+        if isinstance(word, (bool, np.bool_)) or not isinstance(word, (int, np.integer)):
+            return None
+
+        return int(word) if 0 <= word < len(self._words) else None
+
+    def to_id(self, word: str) -> int:
+        """
+        Get ID of a word.
+
+        Parameters
+        ----------
+        word : str
+            Word
+
+        Returns
+        -------
+        int
+        """
+        return self._ids[word]
+
+    def to_word(self, word_id: int) -> str:
+        """
+        Get word of an ID.
+
+        Parameters
+        ----------
+        word_id : int
+            ID
+
+        Returns
+        -------
+        str
+        """
+        return self._words[word_id]
+
+    def to_ids(self, words: Iterable[str]) -> npt.NDArray[np.int_]:
+        """
+        Get IDs of words.
+
+        Parameters
+        ----------
+        words : Iterable[str]
+            Words
+
+        Returns
+        -------
+        npt.NDArray[np.int_]
+        """
+        return np.array([self._ids[word] for word in words], dtype=np.int_)
+
+    def to_words(self, word_ids: Iterable[int]) -> List[str]:
+        """
+        Get words of IDs.
+
+        Parameters
+        ----------
+        word_ids : Iterable[int]
+            IDs
+
+        Returns
+        -------
+        List[str]
+        """
+        return [self._words[word_id] for word_id in word_ids]
+
+
+VOCABULARY: Vocabulary = Vocabulary(DICTIONARY, WORD_INDICES)
@@ -5,11 +5,25 @@ Classes:
     WordFilter
 """
 
-from collections import defaultdict
-from typing import Dict, List, Optional
+from typing import List, Optional, Sequence, Union
 
+import numpy as np
+import numpy.typing as npt
+
+from .feedback import FEEDBACK_VALIDITIES, Feedback
 from .letter_validity import LetterValidity
-from .words import DICTIONARY
+from .vocabulary import VOCABULARY
+from .words import (
+    DICTIONARY,
+    DICTIONARY_COUNTS,
+    DICTIONARY_LENGTH,
+    DICTIONARY_LETTERS,
+    LETTERS,
+)
+
+# Filtering replaces rather than modifies possible indices, so every filter can start from one read only array
+_ALL_IDXS: npt.NDArray[np.int_] = np.arange(DICTIONARY_LENGTH)
+_ALL_IDXS.setflags(write=False)
 
 
 class WordFilter:
@@ -20,72 +34,102 @@ class WordFilter:
 
     Properties
     ----------
-    possible_words : List[str]
+    possible_idxs : npt.NDArray[np.int_]
+        Dictionary indices of possible words left in search space
+    possible_words : Sequence[str]
         Possible words left in search space
 
     Methods
     -------
-    filter(self, guess : Optional[str], word_validity : Optional[List[LetterValidity]]) -> None
+    filter(self, guess: Optional[Union[str, int]], word_validity: Optional[Union[...]]) -> None
         Filter possible words list given a guess and corresponding validity
+    reset(self) -> None
+        Make every word possible again
     """
 
-    def __init__(self) -> None:
-        """Initialise object."""
-        self._possible_words: List[str] = DICTIONARY
+    def __init__(self, feedback_matrix: Optional[npt.NDArray[np.uint8]] = None) -> None:
+        """Initialise object, optionally looking up feedback from a precomputed feedback matrix."""
+        self._feedback_matrix: Optional[npt.NDArray[np.uint8]] = feedback_matrix
+        self._possible_idxs: npt.NDArray[np.int_] = _ALL_IDXS
+        self._possible_words: Optional[List[str]] = DICTIONARY
+
+    @property
+    def possible_idxs(self) -> npt.NDArray[np.int_]:
+        """Dictionary indices of possible words left in search space."""
+        return self._possible_idxs
 
     @property
-    def possible_words(self) -> List[str]:
+    def possible_words(self) -> Sequence[str]:
         """Possible words left in search space."""
+        if self._possible_words is None:
+            self._possible_words = [DICTIONARY[idx] for idx in self._possible_idxs]
+
         return self._possible_words
 
-    def filter(self, guess: Optional[str], word_validity: Optional[List[LetterValidity]]) -> None:
+    def filter(
+        self, guess: Optional[Union[str, int]], word_validity: Optional[Union[List[LetterValidity], Feedback]]
+    ) -> None:
         """
         Filter possible words list given a guess and corresponding validity.
 
         Parameters
         ----------
-        guess : Optional[str]
-            Guessed word
-        word_validity : Optional[List[LetterValidity]]
-            Corresponding validity
+        guess : Optional[Union[str, int]]
+            Guessed word or its ID
+        word_validity : Optional[Union[List[LetterValidity], Feedback]]
+            Corresponding validity, or the same packed as feedback
         """
-        if guess and word_validity:
-            self._filter_by_matches(guess, word_validity)
-            self._filter_by_counts(guess, word_validity)
+        if guess is not None and word_validity is not None:
+            feedback = Feedback.of(word_validity)
 
-    def _filter_by_matches(self, guess: str, word_validity: List[LetterValidity]) -> None:
-        for pos, (character, validity) in enumerate(zip(guess, word_validity)):
-            self._filter_by_match(pos, character, validity)
+            if self._feedback_matrix is not None:
+                mask = self._feedback_mask(self._feedback_matrix, guess, feedback)
+            else:
+                letters = self._guess_letters(guess)
+                validities = FEEDBACK_VALIDITIES[feedback]
+                mask = self._match_mask(letters, validities) & self._count_mask(letters, validities)
 
-    def _filter_by_match(self, pos: int, character: str, validity: LetterValidity) -> None:
-        match validity:
-            case LetterValidity.GREEN:
-                self._filter_by_valid_match(pos, character)
-            case _:
-                self._filter_by_invalid_match(pos, character)
+            self._possible_idxs = self._possible_idxs[mask]
+            self._possible_words = None
 
-    def _filter_by_valid_match(self, pos: int, character: str) -> None:
-        self._possible_words = [word for word in self._possible_words if word[pos] == character]
+    def reset(self) -> None:
+        """Make every word possible again."""
+        self._possible_idxs = _ALL_IDXS
+        self._possible_words = DICTIONARY
 
-    def _filter_by_invalid_match(self, pos: int, character: str) -> None:
-        self._possible_words = [word for word in self._possible_words if word[pos] != character]
+    @staticmethod
+    def _guess_letters(guess: Union[str, int]) -> npt.NDArray[np.uint8]:
+        if isinstance(guess, str):
+            return np.array([LETTERS.index(character) for character in guess], dtype=np.uint8)
 
-    def _filter_by_counts(self, guess: str, word_validity: List[LetterValidity]) -> None:
-        character_idxs: Dict[str, Dict[LetterValidity, int]] = defaultdict(lambda: defaultdict(int))
+        letters: npt.NDArray[np.uint8] = DICTIONARY_LETTERS[guess]
 
-        for character, letter_validity in zip(guess, word_validity):
-            character_idxs[character][letter_validity] += 1
+        return letters
 
-        for character, validities in character_idxs.items():
-            count: int = validities[LetterValidity.GREEN] + validities[LetterValidity.YELLOW]
+    def _feedback_mask(
+        self, feedback_matrix: npt.NDArray[np.uint8], guess: Union[str, int], feedback: Feedback
+    ) -> npt.NDArray[np.bool_]:
+        guess_id = VOCABULARY.to_id(guess) if isinstance(guess, str) else guess
+        mask: npt.NDArray[np.bool_] = feedback_matrix[guess_id, self._possible_idxs] == feedback
 
-            if LetterValidity.GREY in validities:
-                self._filter_by_exact_count(count, character)
-            else:
-                self._filter_by_at_least_count(count, character)
+        return mask
+
+    def _match_mask(self, letters: npt.NDArray[np.uint8], validities: npt.NDArray[np.uint8]) -> npt.NDArray[np.bool_]:
+        greens = validities == LetterValidity.GREEN.value
+
+        # Green letters must match their position, every other letter must not
+        mask: npt.NDArray[np.bool_] = np.all((DICTIONARY_LETTERS[self._possible_idxs] == letters) == greens, axis=1)
+
+        return mask
+
+    def _count_mask(self, letters: npt.NDArray[np.uint8], validities: npt.NDArray[np.uint8]) -> npt.NDArray[np.bool_]:
+        greys = validities == LetterValidity.GREY.value
+        unique_letters, letter_idxs = np.unique(letters, return_inverse=True)
+        counts = np.bincount(letter_idxs, weights=~greys)
+        exact = np.bincount(letter_idxs, weights=greys) > 0
 
-    def _filter_by_at_least_count(self, count: int, character: str) -> None:
-        self._possible_words = [word for word in self._possible_words if word.count(character) >= count]
+        # A grey letter caps its count at the number of green and yellow copies, otherwise that is the minimum
+        word_counts = DICTIONARY_COUNTS[self._possible_idxs][:, unique_letters]
+        mask: npt.NDArray[np.bool_] = np.all(np.where(exact, word_counts == counts, word_counts >= counts), axis=1)
 
-    def _filter_by_exact_count(self, count: int, character: str) -> None:
-        self._possible_words = [word for word in self._possible_words if word.count(character) == count]
+        return mask
@@ -1,21 +1,98 @@
 """
 File containing list of possible words.
 
+Functions:
+    save_words_cache() -> str
+
 Misc variables:
     DICTIONARY : List[str]
     DICTIONARY_LENGTH : int
     WORD_LENGTH : int
     LETTERS : List[str]
     LETTERS_COUNT : int
+    WORD_INDICES : Dict[str, int]
+    DICTIONARY_LETTERS : npt.NDArray[np.uint8]
+    DICTIONARY_COUNTS : npt.NDArray[np.uint8]
+    DICTIONARY_LETTER_IDXS : npt.NDArray[np.int_]
 """
 
+from importlib.abc import Traversable
+from importlib.resources import files
+from os import replace
+from pathlib import Path
 from string import ascii_lowercase
-from typing import List
+from tempfile import mkstemp
+from typing import Dict, List
+from zlib import crc32
 
-with open("wordlesolver/data/words.txt", "r", encoding="utf-8") as file:
-    DICTIONARY: List[str] = file.read().replace('"', "").split(", ")
+import numpy as np
+import numpy.typing as npt
 
-DICTIONARY_LENGTH: int = len(DICTIONARY)
-WORD_LENGTH: int = len(DICTIONARY[0])
 LETTERS: List[str] = list(ascii_lowercase)
 LETTERS_COUNT: int = len(LETTERS)
+
+
+def _parse_words(source: bytes) -> npt.NDArray[np.uint8]:
+    words = source.decode("utf-8").replace('"', "").split(", ")
+    letters = (
+        np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8).reshape(len(words), -1) - ord(LETTERS[0])
+    ).astype(np.uint8)
+    counts = np.zeros((len(words), LETTERS_COUNT), dtype=np.uint8)
+    for pos in range(letters.shape[1]):
+        counts[np.arange(len(words)), letters[:, pos]] += 1
+
+    return np.concatenate([letters, counts], axis=1)
+
+
+def _words_cache(source: bytes) -> Traversable:
+    # Named by checksum, so editing words.txt never picks up a stale cache
+    return files("wordlesolver.data").joinpath(f"words_{crc32(source):08x}.npy")
+
+
+def _load_words() -> npt.NDArray[np.uint8]:
+    source = files("wordlesolver.data").joinpath("words.txt").read_bytes()
+
+    # Only read at import, as written by save_words_cache when precomputing, and otherwise parsed each time
+    try:
+        with _words_cache(source).open("rb") as file:
+            cached: npt.NDArray[np.uint8] = np.load(file)
+            return cached
+    except (OSError, ValueError):
+        return _parse_words(source)
+
+
+def save_words_cache() -> str:
+    """
+    Save the parsed words next to words.txt, so importing the package reads them rather than parsing words.txt.
+
+    Returns
+    -------
+    str
+        File saved to
+    """
+    source = files("wordlesolver.data").joinpath("words.txt").read_bytes()
+    if not isinstance(cache := _words_cache(source), Path):
+        raise AssertionError("Words can only be cached in a package installed as files")
+
+    # Written to a file of its own then swapped in, so processes saving at once never mix their writes
+    file_descriptor, temporary_file = mkstemp(dir=cache.parent, prefix=f"{cache.name}.", suffix=".tmp")
+    with open(file_descriptor, "wb") as file:
+        np.save(file, _parse_words(source))
+    replace(temporary_file, cache)
+
+    return str(cache)
+
+
+# Letter indices of each word followed by the count of each letter, as cached
+_WORDS: npt.NDArray[np.uint8] = _load_words()
+
+DICTIONARY_LENGTH: int = len(_WORDS)
+WORD_LENGTH: int = _WORDS.shape[1] - LETTERS_COUNT
+DICTIONARY_LETTERS: npt.NDArray[np.uint8] = np.ascontiguousarray(_WORDS[:, :WORD_LENGTH])
+DICTIONARY_COUNTS: npt.NDArray[np.uint8] = np.ascontiguousarray(_WORDS[:, WORD_LENGTH:])
+# Index of each word's letter at each position, into scores of every letter at every position flattened
+DICTIONARY_LETTER_IDXS: npt.NDArray[np.int_] = np.arange(WORD_LENGTH) * LETTERS_COUNT + DICTIONARY_LETTERS
+
+_JOINED_WORDS: str = (DICTIONARY_LETTERS + ord(LETTERS[0])).astype(np.uint8).tobytes().decode("ascii")
+DICTIONARY: List[str] = [_JOINED_WORDS[idx : idx + WORD_LENGTH] for idx in range(0, len(_JOINED_WORDS), WORD_LENGTH)]
+WORD_INDICES: Dict[str, int] = {word: idx for idx, word in enumerate(DICTIONARY)}
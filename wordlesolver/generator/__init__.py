@@ -5,23 +5,45 @@ Classes:
     ValidateGenerator
 
 Misc variables:
-    generators: Dict[str, Generator]
+    generators: LazyRegistry[Type[Generator]]
 """
 
 from argparse import Action, ArgumentParser, Namespace
-from typing import Any, Dict, Optional, Sequence, Type, Union
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Type, Union
 
 from gym.envs import register
 
 from ..data import LetterValidity
+from ..lazy import LazyRegistry, lazy_attributes
 from .fake_generator import FakeGenerator
 from .generator import Generator
-from .real_generator import RealGenerator
+from .scoring import score_guess, score_guesses
 
-register(id="FakeGenerator-v0", entry_point=FakeGenerator, max_episode_steps=Generator.GUESSES)
-register(id="RealGenerator-v0", entry_point=RealGenerator, max_episode_steps=Generator.GUESSES)
+if TYPE_CHECKING:
+    from .async_real_generator import AsyncRealGenerator
+    from .browser_pool import BrowserPool
+    from .real_generator import RealGenerator
+    from .routing_policy import RoutingPolicy
+    from .vec_fake_generator import VecFakeGenerator
 
-generators: Dict[str, Type[Generator]] = {"FakeGenerator": FakeGenerator, "RealGenerator": RealGenerator}
+# Generators needing playwright or stable baselines are only imported once used
+__getattr__ = lazy_attributes(
+    __name__,
+    {
+        "AsyncRealGenerator": ".async_real_generator",
+        "BrowserPool": ".browser_pool",
+        "RealGenerator": ".real_generator",
+        "RoutingPolicy": ".routing_policy",
+        "VecFakeGenerator": ".vec_fake_generator",
+    },
+)
+
+generators: LazyRegistry[Type[Generator]] = LazyRegistry(
+    __name__, {"FakeGenerator": ".fake_generator", "RealGenerator": ".real_generator"}
+)
+
+for name in generators:
+    register(id=f"{name}-v0", entry_point=generators.entry_point(name), max_episode_steps=Generator.GUESSES)
 
 
 class ValidateGenerator(Action):
@@ -43,4 +65,16 @@ class ValidateGenerator(Action):
         setattr(namespace, self.dest, generators[value])
 
 
-__all__ = ["Generator", "FakeGenerator", "RealGenerator", "ValidateGenerator", "LetterValidity"]
+__all__ = [
+    "Generator",
+    "FakeGenerator",
+    "RealGenerator",
+    "AsyncRealGenerator",
+    "BrowserPool",
+    "RoutingPolicy",
+    "VecFakeGenerator",
+    "ValidateGenerator",
+    "LetterValidity",
+    "score_guess",
+    "score_guesses",
+]
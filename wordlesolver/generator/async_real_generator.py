@@ -0,0 +1,113 @@
+"""
+File containing asynchronous real word generator class.
+
+Classes:
+    AsyncRealGenerator(Generator)
+"""
+
+from logging import info
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from playwright.async_api import Page, expect
+
+from ..data import VOCABULARY, Feedback, LetterValidity
+from .generator import Generator
+from .real_generator import RealGenerator
+
+
+class AsyncRealGenerator(Generator):
+    """
+    Asynchronous real word generator class, playing in a given tab so many games can wait on the site at once.
+
+    ...
+
+    Attributes
+    ----------
+    page_ready_seconds : Optional[float]
+        Seconds taken to load the page and close its dialogs when it was last opened
+
+    Methods
+    -------
+    reset(self) -> Optional[List[LetterValidity]]
+        [NOT IMPLEMENTED] Reset the environment, see areset
+    step(self, action: Union[str, int]) -> Tuple[Optional[List[LetterValidity]], int, bool, Dict[str, Any]]
+        [NOT IMPLEMENTED] Perform given action, see astep
+    areset(self) -> Optional[List[LetterValidity]]
+        Reset the environment
+    astep(self, action: Union[str, int]) -> Tuple[Optional[List[LetterValidity]], int, bool, Dict[str, Any]]
+        Perform given action
+    """
+
+    def __init__(self, tab: Page, page_url: Optional[str] = None) -> None:
+        """Initialise object, optionally playing at a different url e.g. a locally served copy of the site."""
+        super().__init__()
+
+        self._tab: Page = tab
+        self._page_url: str = page_url or RealGenerator.PAGE_URL
+        self.page_ready_seconds: Optional[float] = None
+
+    def reset(self) -> Optional[List[LetterValidity]]:
+        """[NOT IMPLEMENTED] Reset the environment, see areset."""
+        raise NotImplementedError("AsyncRealGenerator is played asynchronously, reset it with await areset()")
+
+    def step(self, action: Union[str, int]) -> Tuple[Optional[List[LetterValidity]], int, bool, Dict[str, Any]]:
+        """[NOT IMPLEMENTED] Perform given action, see astep."""
+        raise NotImplementedError("AsyncRealGenerator is played asynchronously, step it with await astep(action)")
+
+    async def areset(self) -> Optional[List[LetterValidity]]:
+        """
+        Reset the environment.
+
+        Returns
+        -------
+        Optional[List[LetterValidity]]
+        """
+        await self._open_page()
+
+        return super().reset()
+
+    async def astep(self, action: Union[str, int]) -> Tuple[Optional[List[LetterValidity]], int, bool, Dict[str, Any]]:
+        """
+        Perform given action.
+
+        Parameters
+        ----------
+        action : Union[str, int]
+            Action to perform, a word or its ID
+
+        Returns
+        -------
+        Tuple[Optional[List[LetterValidity]], float, bool, dict]
+        """
+        if (guess_id := self._start_step(action)) is None:
+            return (self.observation, self.INVALID_WORD_VALUE, self.done, {})
+
+        return self._finish_step(Feedback.from_validities(await self._aguess_word(guess_id)))
+
+    async def _open_page(self) -> None:
+        start = perf_counter()
+        await self._tab.goto(self._page_url)
+        if await (button := self._tab.locator("#pz-gdpr-btn-reject")).is_visible():
+            await button.click()
+        await self._tab.locator('[data-testid="icon-close"]').click()
+        await expect(self._tab.locator('[data-testid="modal-overlay"]')).to_be_hidden()
+
+        self.page_ready_seconds = perf_counter() - start
+        info(f"Page ready after {self.page_ready_seconds:.3f}s")
+
+    def _guess_word(self, guess_id: int) -> List[LetterValidity]:
+        raise NotImplementedError("Asynchronous generators are played with areset and astep")
+
+    async def _aguess_word(self, guess_id: int) -> List[LetterValidity]:
+        guess = VOCABULARY.to_word(guess_id)
+        await self._tab.keyboard.type(guess)
+        await self._tab.keyboard.press("Enter")
+
+        row_states = await self._tab.wait_for_function(RealGenerator.ROW_STATES_SCRIPT, arg=self._current_row)
+
+        return RealGenerator.row_validities(guess, await row_states.json_value())
+
+    @property
+    def _current_row(self) -> int:
+        return self.GUESSES - self.guesses_remaining + 1
@@ -0,0 +1,142 @@
+"""
+File containing browser pool class.
+
+Classes:
+    BrowserPool
+"""
+
+from atexit import register, unregister
+from typing import Callable, Dict, List, Optional
+
+from playwright.sync_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    sync_playwright,
+)
+
+
+class BrowserPool:
+    """
+    Browser pool class, sharing one browser and recycling its pages between episodes.
+
+    ...
+
+    Attributes
+    ----------
+    size : int
+        Number of idle pages kept for reuse
+    max_uses : int
+        Number of episodes a page is used for before its context is replaced, 1 for a new context every episode
+
+    Properties
+    ----------
+    started : bool
+        Whether the browser is running
+
+    Methods
+    -------
+    acquire(self) -> Page
+        Get an idle page, opening a new one if there are none
+    release(self, page: Page) -> None
+        Return a page, keeping it for reuse or closing it
+    close(self) -> None
+        Close every page and the browser
+    """
+
+    CLEAR_STORAGE_SCRIPT: str = "() => { try { localStorage.clear(); sessionStorage.clear(); } catch (error) {} }"
+
+    def __init__(
+        self,
+        size: int = 4,
+        max_uses: int = 50,
+        new_context: Optional[Callable[[Browser], BrowserContext]] = None,
+    ) -> None:
+        """Initialise object, opening each context with new_context if given e.g. to set it up."""
+        if size < 1 or max_uses < 1:
+            raise AssertionError("Pool size and page uses must be positive")
+
+        self.size: int = size
+        self.max_uses: int = max_uses
+        self._new_context: Callable[[Browser], BrowserContext] = new_context or Browser.new_context
+
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._idle: List[Page] = []
+        self._uses: Dict[Page, int] = {}
+
+    @property
+    def started(self) -> bool:
+        """Whether the browser is running."""
+        return self._browser is not None
+
+    def acquire(self) -> Page:
+        """
+        Get an idle page, opening a new one if there are none.
+
+        Returns
+        -------
+        Page
+        """
+        page = self._idle.pop() if self._idle else self._new_page()
+        self._uses[page] += 1
+
+        return page
+
+    def release(self, page: Page) -> None:
+        """
+        Return a page, keeping it for reuse or closing it.
+
+        Pages are kept until they have been used max_uses times or there are already size idle pages. Kept pages have
+        their cookies and storage cleared, so the site starts a new game when next loaded.
+
+        Parameters
+        ----------
+        page : Page
+            Page given by acquire
+        """
+        if page not in self._uses:
+            raise AssertionError("Page does not belong to this pool")
+        if page in self._idle:
+            return
+
+        if page.is_closed() or self._uses[page] >= self.max_uses or len(self._idle) >= self.size:
+            self._close_page(page)
+            return
+
+        page.context.clear_cookies()
+        page.evaluate(self.CLEAR_STORAGE_SCRIPT)
+        self._idle.append(page)
+
+    def close(self) -> None:
+        """Close every page and the browser."""
+        for page in list(self._uses):
+            self._close_page(page)
+
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+        unregister(self.close)
+
+    def _new_page(self) -> Page:
+        if self._browser is None:
+            self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.launch()
+            register(self.close)
+
+        page = self._new_context(self._browser).new_page()
+        self._uses[page] = 0
+
+        return page
+
+    def _close_page(self, page: Page) -> None:
+        del self._uses[page]
+        if page in self._idle:
+            self._idle.remove(page)
+
+        page.context.close()
@@ -5,22 +5,35 @@ Classes:
     FakeGenerator(Generator)
 """
 
-from collections import Counter
-from secrets import choice
-from typing import List, Optional
-
-from ..data import DICTIONARY, LetterValidity
+from functools import partial
+from secrets import randbelow
+from typing import Callable, List, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from ..data import (
+    DICTIONARY_COUNTS,
+    DICTIONARY_LENGTH,
+    DICTIONARY_LETTERS,
+    VOCABULARY,
+    WORD_INDICES,
+    Feedback,
+    LetterValidity,
+)
 from .generator import Generator
 
 
 class FakeGenerator(Generator):
     """Fake generator class."""
 
-    def __init__(self) -> None:
-        """Initialise object."""
+    def __init__(self, feedback_matrix: Optional[npt.NDArray[np.uint8]] = None, word: Optional[str] = None) -> None:
+        """Initialise object, optionally looking up feedback from a precomputed feedback matrix or fixing the answer."""
         super().__init__()
 
-        self._word: str = choice(DICTIONARY)
+        self._feedback_matrix: Optional[npt.NDArray[np.uint8]] = feedback_matrix
+        self._fixed_word_id: Optional[int] = WORD_INDICES[word] if word is not None else None
+        self._word_id: int = self._new_word_id()
 
     def reset(self) -> Optional[List[LetterValidity]]:
         """
@@ -30,34 +43,50 @@ class FakeGenerator(Generator):
         -------
         Optional[List[LetterValidity]]
         """
-        self._word = choice(DICTIONARY)
+        self._word_id = self._new_word_id()
 
         return super().reset()
 
-    def _guess_word(self, guess: str) -> List[LetterValidity]:
-        word_validity: List[LetterValidity] = [self._letter_validity(pos, letter) for pos, letter in enumerate(guess)]
+    def factory(self) -> Callable[[], Generator]:
+        """
+        Picklable function building a new generator with the same feedback matrix and answer.
 
-        character_frequencies: Counter[str] = Counter(self._word)
+        Returns
+        -------
+        Callable[[], Generator]
+        """
+        word = VOCABULARY.to_word(self._fixed_word_id) if self._fixed_word_id is not None else None
 
-        for character, validity in zip(guess, word_validity):
-            if validity == LetterValidity.GREEN:
-                character_frequencies[character] -= 1
+        return partial(FakeGenerator, self._feedback_matrix, word)
 
-        for pos, (character, validity) in enumerate(zip(guess, word_validity)):
-            if validity == LetterValidity.YELLOW:
-                if character_frequencies[character] <= 0:
-                    word_validity[pos] = LetterValidity.GREY
-                else:
-                    character_frequencies[character] -= 1
+    def _new_word_id(self) -> int:
+        return self._fixed_word_id if self._fixed_word_id is not None else randbelow(DICTIONARY_LENGTH)
 
-        return word_validity
+    def _guess_feedback(self, guess_id: int) -> Feedback:
+        if self._feedback_matrix is not None:
+            return Feedback(self._feedback_matrix[guess_id, self._word_id])
 
-    def _letter_validity(self, pos: int, letter: str) -> LetterValidity:
-        if len(letter) != 1:
-            raise AssertionError("Expected char, got string")
+        return super()._guess_feedback(guess_id)
 
-        if letter == self._word[pos]:
-            return LetterValidity.GREEN
-        if letter in self._word:
-            return LetterValidity.YELLOW
-        return LetterValidity.GREY
+    def _guess_word(self, guess_id: int) -> List[LetterValidity]:
+        if self._feedback_matrix is not None:
+            return self._guess_feedback(guess_id).validities()
+
+        guess = DICTIONARY_LETTERS[guess_id]
+        greens = guess == DICTIONARY_LETTERS[self._word_id]
+
+        # Letters of the answer left to mark yellow, once greens have been marked
+        letter_counts = DICTIONARY_COUNTS[self._word_id].astype(np.int_)
+        np.subtract.at(letter_counts, guess[greens], 1)
+
+        word_validity: List[LetterValidity] = []
+        for letter, green in zip(guess, greens):
+            if green:
+                word_validity.append(LetterValidity.GREEN)
+            elif letter_counts[letter] > 0:
+                word_validity.append(LetterValidity.YELLOW)
+                letter_counts[letter] -= 1
+            else:
+                word_validity.append(LetterValidity.GREY)
+
+        return word_validity
@@ -7,11 +7,11 @@ Classes:
 
 from abc import abstractmethod
 from logging import warning
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from gym import Env
 
-from ..data import DICTIONARY, WORD_LENGTH, LetterValidity
+from ..data import VOCABULARY, WORD_LENGTH, Feedback, LetterValidity
 
 
 class Generator(Env):  # type: ignore[misc] # gym has bad types
@@ -41,6 +41,8 @@ class Generator(Env):  # type: ignore[misc] # gym has bad types
         Remaining guesses
     observation : Optional[List[LetterValidity]]
         Environment state
+    feedback : Optional[Feedback]
+        Environment state packed into one int
     won : bool
         Whether the game has been won
     reward : int
@@ -50,8 +52,10 @@ class Generator(Env):  # type: ignore[misc] # gym has bad types
     -------
     reset(self) -> Optional[List[LetterValidity]]
         Reset the environment
-    step(self, action: str) -> Tuple[Optional[List[LetterValidity]], int, bool, Dict[str, Any]]
+    step(self, action: Union[str, int]) -> Tuple[Optional[List[LetterValidity]], int, bool, Dict[str, Any]]
         Perform given action
+    factory(self) -> Callable[[], Generator]
+        Picklable function building a new generator configured like this one
     """
 
     GUESSES: int = 6
@@ -65,7 +69,7 @@ class Generator(Env):  # type: ignore[misc] # gym has bad types
         """Initialise object."""
         self._done: bool = False
         self._guesses_remaining: int = self.GUESSES
-        self._observation: Optional[List[LetterValidity]] = None
+        self._feedback: Optional[Feedback] = None
 
     @property
     def done(self) -> bool:
@@ -80,7 +84,12 @@ class Generator(Env):  # type: ignore[misc] # gym has bad types
     @property
     def observation(self) -> Optional[List[LetterValidity]]:
         """Environment state."""
-        return self._observation
+        return self._feedback.validities() if self._feedback is not None else None
+
+    @property
+    def feedback(self) -> Optional[Feedback]:
+        """Environment state packed into one int."""
+        return self._feedback
 
     # pylint: disable=arguments-differ
     def reset(self) -> Optional[List[LetterValidity]]:
@@ -93,34 +102,53 @@ class Generator(Env):  # type: ignore[misc] # gym has bad types
         """
         self._done = False
         self._guesses_remaining = self.GUESSES
-        self._observation = None
+        self._feedback = None
 
         return self.observation
 
     # pylint: disable=arguments-differ
-    def step(self, action: str) -> Tuple[Optional[List[LetterValidity]], int, bool, Dict[str, Any]]:
+    def step(self, action: Union[str, int]) -> Tuple[Optional[List[LetterValidity]], int, bool, Dict[str, Any]]:
         """
         Perform given action.
 
         Parameters
         ----------
-        action : str
-            Action to perform
+        action : Union[str, int]
+            Action to perform, a word or its ID
 
         Returns
         -------
         Tuple[Optional[List[LetterValidity]], float, bool, dict]
         """
+        if (guess_id := self._start_step(action)) is None:
+            return (self.observation, self.INVALID_WORD_VALUE, self.done, {})
+
+        return self._finish_step(self._guess_feedback(guess_id))
+
+    def factory(self) -> Callable[[], "Generator"]:
+        """
+        Picklable function building a new generator configured like this one, e.g. for training in worker processes.
+
+        Returns
+        -------
+        Callable[[], Generator]
+        """
+        raise NotImplementedError(f"{type(self).__name__} can't be copied")
+
+    def _start_step(self, action: Union[str, int]) -> Optional[int]:
         if self.done:
             raise AssertionError("Cannot perform an action when game ended")
 
-        if action not in DICTIONARY:
+        if (word_id := VOCABULARY.find_id(action)) is None:
             self._done = True
-            self._observation = None
+            self._feedback = None
 
-            return (self.observation, self.INVALID_WORD_VALUE, self.done, {})
+            return None
 
-        self._observation = self._guess_word(action)
+        return word_id
+
+    def _finish_step(self, feedback: Feedback) -> Tuple[Optional[List[LetterValidity]], int, bool, Dict[str, Any]]:
+        self._feedback = feedback
         self._guesses_remaining -= 1
         self._done = self.guesses_remaining <= 0 or self.won
 
@@ -129,25 +157,25 @@ class Generator(Env):  # type: ignore[misc] # gym has bad types
     @property
     def won(self) -> bool:
         """Whether the game has been won."""
-        if not self.observation:
-            return False
-
-        return all(letter_validity == LetterValidity.GREEN for letter_validity in self.observation)
+        return self._feedback is not None and self._feedback.won
 
     @property
     def reward(self) -> int:
         """Reward of previous action."""
-        if not self.observation:
+        if self._feedback is None:
             raise AssertionError("Cannot get reward of unknown observation")
 
-        green_reward: int = self.observation.count(LetterValidity.GREEN) * self.GREEN_VALUE
-        yellow_reward: int = self.observation.count(LetterValidity.YELLOW) * self.YELLOW_VALUE
+        green_reward: int = self._feedback.green_count * self.GREEN_VALUE
+        yellow_reward: int = self._feedback.yellow_count * self.YELLOW_VALUE
         unused_turns_reward: int = self.guesses_remaining * self.UNUSED_TURN_VALUE if self.done else 0
 
         return green_reward + yellow_reward + unused_turns_reward
 
+    def _guess_feedback(self, guess_id: int) -> Feedback:
+        return Feedback.from_validities(self._guess_word(guess_id))
+
     @abstractmethod
-    def _guess_word(self, guess: str) -> List[LetterValidity]:
+    def _guess_word(self, guess_id: int) -> List[LetterValidity]:
         raise NotImplementedError
 
     def render(self, _: str = "human") -> None:
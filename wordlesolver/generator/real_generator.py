@@ -5,12 +5,17 @@ Classes:
     RealGenerator(Generator)
 """
 
-from typing import Dict, List, Optional
+from functools import partial
+from logging import info
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
 
-from playwright.sync_api import Locator, Page, Playwright, expect, sync_playwright
+from playwright.sync_api import Browser, BrowserContext, Page, expect
 
-from ..data import LetterValidity
+from ..data import VOCABULARY, LetterValidity
+from .browser_pool import BrowserPool
 from .generator import Generator
+from .routing_policy import RoutingPolicy
 
 
 class RealGenerator(Generator):
@@ -21,8 +26,14 @@ class RealGenerator(Generator):
 
     Attributes
     ----------
-    PLAYWRIGHT : Playwright
-        Playwright instance
+    POOL : Optional[BrowserPool]
+        Pool of pages shared by every real generator, created when the first real generator is constructed
+    POOL_SIZE : int
+        Number of idle pages kept for reuse
+    MAX_PAGE_USES : int
+        Number of episodes a page is used for before its context is replaced
+    ROUTING_POLICY : Optional[RoutingPolicy]
+        Policy blocking and caching requests of every page, or None to load pages in full
     PAGE_URL : str
         Url to wordle site
     PAGE_WIDTH : int
@@ -31,9 +42,28 @@ class RealGenerator(Generator):
         Height to render page at
     DATA_STATE_TO_VALIDITY : Dict[str, LetterValidity]
         Dictionary containing mappings from cell states to LetterValidities
+    ROW_STATES_SCRIPT : str
+        In-page function of a row number, giving the states of its cells once revealed or "rejected" if the site
+        rejected the guess
+    page_ready_seconds : Optional[float]
+        Seconds taken to load the page and close its dialogs when it was last opened
+
+    Methods
+    -------
+    factory(self) -> Callable[[], Generator]
+        Picklable function building a new generator playing at the same url
+    close(self) -> None
+        Return page to the pool, closing it if the pool is full, until reset opens another
+    close_pool() -> None
+        Close every page and the browser shared by real generators
+    row_validities(guess: str, row_states: Any) -> List[LetterValidity]
+        Convert result of ROW_STATES_SCRIPT to the validity of each letter
     """
 
-    PLAYWRIGHT: Playwright = sync_playwright().start()
+    POOL: Optional[BrowserPool] = None
+    POOL_SIZE: int = 4
+    MAX_PAGE_USES: int = 50
+    ROUTING_POLICY: Optional[RoutingPolicy] = RoutingPolicy()
     PAGE_URL: str = "https://www.nytimes.com/games/wordle/index.html"
     PAGE_WIDTH: int = 1920
     PAGE_HEIGHT: int = 1080
@@ -42,13 +72,31 @@ class RealGenerator(Generator):
         "present": LetterValidity.YELLOW,
         "correct": LetterValidity.GREEN,
     }
-
-    def __init__(self) -> None:
-        """Initialise object."""
+    ROW_STATES_SCRIPT: str = """(row) => {
+        const rowElement = document.querySelector(`[aria-label="Row ${row}"]`);
+        if (rowElement === null) {
+            return null;
+        }
+        if (rowElement.matches('[class*="Row-module_invalid"]')) {
+            return "rejected";
+        }
+        const tiles = rowElement.querySelectorAll(".Tile-module_tile__3ayIZ");
+        const states = Array.from(tiles, (tile) => tile.getAttribute("data-state"));
+        return states.every((state) => state !== "empty" && state !== "tbd") ? states : null;
+    }"""
+
+    def __init__(self, page_url: Optional[str] = None) -> None:
+        """Initialise object, optionally playing at a different url e.g. a locally served copy of the site."""
         super().__init__()
 
-        self._tab: Page = self._new_tab()
-        self._open_page()
+        if RealGenerator.POOL is None:
+            RealGenerator.POOL = BrowserPool(self.POOL_SIZE, self.MAX_PAGE_USES, self._new_context)
+
+        self._pool: BrowserPool = RealGenerator.POOL
+        self._page_url: str = page_url or self.PAGE_URL
+        self.page_ready_seconds: Optional[float] = None
+        self._tab: Optional[Page] = self._pool.acquire()
+        self._open_page(self._tab)
 
     def reset(self) -> Optional[List[LetterValidity]]:
         """
@@ -58,41 +106,91 @@ class RealGenerator(Generator):
         -------
         Optional[List[LetterValidity]]
         """
-        self._tab = self._new_tab()
-        self._open_page()
+        # A page nothing has been guessed on yet still shows a new game
+        if self._tab is None or self._tab.is_closed() or self.guesses_remaining < self.GUESSES:
+            self.close()
+            self._tab = self._pool.acquire()
+            self._open_page(self._tab)
 
         return super().reset()
 
+    def factory(self) -> Callable[[], Generator]:
+        """
+        Picklable function building a new generator playing at the same url.
+
+        Returns
+        -------
+        Callable[[], Generator]
+        """
+        return partial(RealGenerator, self._page_url)
+
+    def close(self) -> None:
+        """Return page to the pool, closing it if the pool is full, until reset opens another."""
+        # The page is forgotten, as once idle in the pool another generator may acquire it
+        if self._tab is not None:
+            self._pool.release(self._tab)
+            self._tab = None
+
+    @classmethod
+    def close_pool(cls) -> None:
+        """Close every page and the browser shared by real generators."""
+        if cls.POOL is not None:
+            cls.POOL.close()
+            cls.POOL = None
+
     @classmethod
-    def _new_tab(cls) -> Page:
-        return cls.PLAYWRIGHT.chromium.launch().new_page(viewport={"width": cls.PAGE_WIDTH, "height": cls.PAGE_HEIGHT})
+    def row_validities(cls, guess: str, row_states: Any) -> List[LetterValidity]:
+        """
+        Convert result of ROW_STATES_SCRIPT to the validity of each letter.
+
+        Parameters
+        ----------
+        guess : str
+            Word guessed in the row
+        row_states : Any
+            States of the cells in the row, or "rejected"
+
+        Returns
+        -------
+        List[LetterValidity]
+        """
+        if row_states == "rejected":
+            raise AssertionError(f"Site rejected guess {guess}")
 
-    def _open_page(self) -> None:
-        self._tab.goto(self.PAGE_URL)
-        if (button := self._tab.locator("#pz-gdpr-btn-reject")).is_visible():
+        return [cls.DATA_STATE_TO_VALIDITY[state] for state in row_states]
+
+    @classmethod
+    def _new_context(cls, browser: Browser) -> BrowserContext:
+        context = browser.new_context(viewport={"width": cls.PAGE_WIDTH, "height": cls.PAGE_HEIGHT})
+        if cls.ROUTING_POLICY is not None:
+            cls.ROUTING_POLICY.install(context)
+
+        return context
+
+    def _open_page(self, tab: Page) -> None:
+        start = perf_counter()
+        tab.goto(self._page_url)
+        if (button := tab.locator("#pz-gdpr-btn-reject")).is_visible():
             button.click()
-        self._tab.locator('[data-testid="icon-close"]').click()
-        expect(self._tab.locator('[data-testid="modal-overlay"]')).to_be_hidden()
+        tab.locator('[data-testid="icon-close"]').click()
+        expect(tab.locator('[data-testid="modal-overlay"]')).to_be_hidden()
 
-    def _guess_word(self, guess: str) -> List[LetterValidity]:
-        self._enter(guess)
-        self._wait_for_cell(4)
+        self.page_ready_seconds = perf_counter() - start
+        info(f"Page ready after {self.page_ready_seconds:.3f}s")
 
-        return [self._letter_validity(pos) for pos in range(len(guess))]
+    def _guess_word(self, guess_id: int) -> List[LetterValidity]:
+        if self._tab is None:
+            raise AssertionError("Cannot perform an action after closing, reset to open a new page")
 
-    def _enter(self, guess: str) -> None:
+        # The site is the one place guesses are needed as text
+        guess = VOCABULARY.to_word(guess_id)
         self._tab.keyboard.type(guess)
         self._tab.keyboard.press("Enter")
 
-    def _wait_for_cell(self, idx: int) -> None:
-        expect(self._cell(idx)).not_to_have_attribute("data-state", "empty")
-        expect(self._cell(idx)).not_to_have_attribute("data-state", "tbd")
-
-    def _letter_validity(self, pos: int) -> LetterValidity:
-        return self.DATA_STATE_TO_VALIDITY[str(self._cell(pos).get_attribute("data-state"))]
+        # Waits for and reads the whole row in one round trip, failing as soon as the guess is rejected
+        row_states = self._tab.wait_for_function(self.ROW_STATES_SCRIPT, arg=self._current_row).json_value()
 
-    def _cell(self, idx: int) -> Locator:
-        return self._tab.locator(f'[aria-label="Row {self._current_row}"]').locator(".Tile-module_tile__3ayIZ").nth(idx)
+        return self.row_validities(guess, row_states)
 
     @property
     def _current_row(self) -> int:
@@ -0,0 +1,184 @@
+"""
+File containing routing policy class.
+
+Classes:
+    RoutingPolicy
+
+Misc variables:
+    ASSET_CACHE_FOLDER : str
+"""
+
+from hashlib import sha256
+from os import getpid, makedirs, path, replace
+from typing import Any, Collection, Optional, Tuple
+from urllib.parse import urlparse
+
+from playwright.async_api import APIRequestContext as AsyncAPIRequestContext
+from playwright.async_api import BrowserContext as AsyncBrowserContext
+from playwright.async_api import Route as AsyncRoute
+from playwright.sync_api import APIRequestContext, BrowserContext, Route
+
+ASSET_CACHE_FOLDER: str = path.join("out", "asset_cache")
+
+
+class RoutingPolicy:
+    """
+    Routing policy class, blocking requests a generator never reads and caching essential static assets on disk.
+
+    ...
+
+    Attributes
+    ----------
+    ALLOWED_HOSTS : Tuple[str, ...]
+        Hosts, including their subdomains, whose requests aren't blocked
+    BLOCKED_RESOURCE_TYPES : Tuple[str, ...]
+        Resource types blocked from every host
+    CACHED_RESOURCE_TYPES : Tuple[str, ...]
+        Resource types cached on disk, whose urls change whenever their content does
+    ABORT : str
+        Decision to block a request
+    CACHE : str
+        Decision to serve a request from the cache
+    CONTINUE : str
+        Decision to send a request as usual
+
+    Methods
+    -------
+    decide(self, url: str, resource_type: str, main_document: bool) -> str
+        Decide how to route a request
+    install(self, context: BrowserContext) -> None
+        Route every request of a context
+    ainstall(self, context: AsyncBrowserContext) -> None
+        Route every request of an asynchronous context
+    """
+
+    ALLOWED_HOSTS: Tuple[str, ...] = ("nytimes.com", "nyt.com")
+    BLOCKED_RESOURCE_TYPES: Tuple[str, ...] = ("image", "media", "font", "beacon", "ping", "manifest", "texttrack")
+    CACHED_RESOURCE_TYPES: Tuple[str, ...] = ("script", "stylesheet")
+    ABORT: str = "abort"
+    CACHE: str = "cache"
+    CONTINUE: str = "continue"
+
+    def __init__(
+        self,
+        allowed_hosts: Collection[str] = ALLOWED_HOSTS,
+        blocked_resource_types: Collection[str] = BLOCKED_RESOURCE_TYPES,
+        cache_folder: Optional[str] = ASSET_CACHE_FOLDER,
+    ) -> None:
+        """Initialise object, caching assets in cache_folder if given."""
+        self._allowed_hosts: Collection[str] = allowed_hosts
+        self._blocked_resource_types: Collection[str] = blocked_resource_types
+        self._cache_folder: Optional[str] = cache_folder
+
+    def decide(self, url: str, resource_type: str, main_document: bool) -> str:
+        """
+        Decide how to route a request.
+
+        The page itself is always loaded, so generators can play at any url.
+
+        Parameters
+        ----------
+        url : str
+            Requested url
+        resource_type : str
+            Playwright resource type of the request
+        main_document : bool
+            Whether the request is the page itself
+
+        Returns
+        -------
+        str
+            One of ABORT, CACHE or CONTINUE
+        """
+        if main_document:
+            return self.CONTINUE
+
+        host = urlparse(url).hostname or ""
+        if resource_type in self._blocked_resource_types or not any(
+            host == allowed or host.endswith(f".{allowed}") for allowed in self._allowed_hosts
+        ):
+            return self.ABORT
+
+        if self._cache_folder is not None and resource_type in self.CACHED_RESOURCE_TYPES:
+            return self.CACHE
+
+        return self.CONTINUE
+
+    def install(self, context: BrowserContext) -> None:
+        """
+        Route every request of a context.
+
+        Parameters
+        ----------
+        context : BrowserContext
+            Context to route requests of
+        """
+        context.route("**/*", lambda route: self._handle(route, context.request))
+
+    async def ainstall(self, context: AsyncBrowserContext) -> None:
+        """
+        Route every request of an asynchronous context.
+
+        Parameters
+        ----------
+        context : AsyncBrowserContext
+            Context to route requests of
+        """
+        await context.route("**/*", lambda route: self._ahandle(route, context.request))
+
+    def _handle(self, route: Route, request_context: APIRequestContext) -> None:
+        decision = self._decide_route(route)
+        if decision == self.ABORT:
+            route.abort()
+        elif decision == self.CONTINUE:
+            route.continue_()
+        elif (cached := self._load(route.request.url)) is not None:
+            route.fulfill(status=200, content_type=cached[0], body=cached[1])
+        else:
+            response = request_context.fetch(route.request)
+            if response.ok:
+                self._save(route.request.url, response.headers.get("content-type", ""), response.body())
+            route.fulfill(response=response)
+
+    async def _ahandle(self, route: AsyncRoute, request_context: AsyncAPIRequestContext) -> None:
+        decision = self._decide_route(route)
+        if decision == self.ABORT:
+            await route.abort()
+        elif decision == self.CONTINUE:
+            await route.continue_()
+        elif (cached := self._load(route.request.url)) is not None:
+            await route.fulfill(status=200, content_type=cached[0], body=cached[1])
+        else:
+            response = await request_context.fetch(route.request)
+            if response.ok:
+                self._save(route.request.url, response.headers.get("content-type", ""), await response.body())
+            await route.fulfill(response=response)
+
+    def _decide_route(self, route: Any) -> str:
+        request = route.request
+        main_document = request.is_navigation_request() and request.frame.parent_frame is None
+
+        return self.decide(request.url, request.resource_type, main_document)
+
+    def _cache_path(self, url: str) -> str:
+        return path.join(str(self._cache_folder), sha256(url.encode()).hexdigest())
+
+    def _load(self, url: str) -> Optional[Tuple[str, bytes]]:
+        try:
+            with open(self._cache_path(url), "rb") as file:
+                content_type, _, body = file.read().partition(b"\n")
+        except OSError:
+            return None
+
+        return content_type.decode(), body
+
+    def _save(self, url: str, content_type: str, body: bytes) -> None:
+        cache_path = self._cache_path(url)
+        temporary_path = f"{cache_path}.{getpid()}.tmp"
+        try:
+            makedirs(path.dirname(cache_path), exist_ok=True)
+            with open(temporary_path, "wb") as file:
+                file.write(content_type.encode() + b"\n" + body)
+            replace(temporary_path, cache_path)
+        except OSError:
+            pass
@@ -0,0 +1,73 @@
+"""
+File containing functions scoring guesses against many answers at once.
+
+Functions:
+    score_guess(guess: Union[str, int], ...) -> npt.NDArray[np.uint8]
+    score_guesses(guess_ids: npt.NDArray[np.int_], ...) -> npt.NDArray[np.uint8]
+"""
+
+from typing import Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from ..data import DICTIONARY_LETTERS, VOCABULARY, feedback_codes
+
+
+def score_guess(
+    guess: Union[str, int],
+    answer_ids: Optional[npt.NDArray[np.int_]] = None,
+    feedback_matrix: Optional[npt.NDArray[np.uint8]] = None,
+) -> npt.NDArray[np.uint8]:
+    """
+    Score one guess against many answers, handling repeated letters the same way as FakeGenerator.
+
+    Parameters
+    ----------
+    guess : Union[str, int]
+        Guessed word or its ID
+    answer_ids : Optional[npt.NDArray[np.int_]]
+        IDs of the answers, every word if not given
+    feedback_matrix : Optional[npt.NDArray[np.uint8]]
+        Precomputed feedback matrix to look feedback up in
+
+    Returns
+    -------
+    npt.NDArray[np.uint8]
+        Feedback code against each answer
+    """
+    guess_id = VOCABULARY.to_id(guess) if isinstance(guess, str) else guess
+    codes: npt.NDArray[np.uint8] = score_guesses(np.array([guess_id]), answer_ids, feedback_matrix)[0]
+
+    return codes
+
+
+def score_guesses(
+    guess_ids: npt.NDArray[np.int_],
+    answer_ids: Optional[npt.NDArray[np.int_]] = None,
+    feedback_matrix: Optional[npt.NDArray[np.uint8]] = None,
+) -> npt.NDArray[np.uint8]:
+    """
+    Score many guesses against many answers, handling repeated letters the same way as FakeGenerator.
+
+    Parameters
+    ----------
+    guess_ids : npt.NDArray[np.int_]
+        IDs of the guesses
+    answer_ids : Optional[npt.NDArray[np.int_]]
+        IDs of the answers, every word if not given
+    feedback_matrix : Optional[npt.NDArray[np.uint8]]
+        Precomputed feedback matrix to look feedback up in
+
+    Returns
+    -------
+    npt.NDArray[np.uint8]
+        (guesses, answers) feedback codes
+    """
+    if feedback_matrix is not None:
+        rows = feedback_matrix[guess_ids]
+        return np.asarray(rows if answer_ids is None else rows[:, answer_ids])
+
+    return feedback_codes(
+        DICTIONARY_LETTERS[guess_ids], DICTIONARY_LETTERS if answer_ids is None else DICTIONARY_LETTERS[answer_ids]
+    )
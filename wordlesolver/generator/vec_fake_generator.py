@@ -0,0 +1,181 @@
+"""
+File containing vectorised fake word generator class.
+
+Classes:
+    VecFakeGenerator(VecEnv)
+"""
+
+from typing import Any, List, Optional, Sequence, Type
+
+import numpy as np
+import numpy.typing as npt
+from gym import Wrapper, spaces
+from stable_baselines3.common.vec_env.base_vec_env import (
+    VecEnv,
+    VecEnvIndices,
+    VecEnvStepReturn,
+)
+
+from ..data import DICTIONARY_LENGTH, GREEN_COUNTS, WIN_FEEDBACK, YELLOW_COUNTS
+from .generator import Generator
+from .scoring import score_guesses
+
+
+class VecFakeGenerator(VecEnv):
+    """
+    Vectorised fake generator class, stepping many games at once.
+
+    Observations and actions match a FakeGenerator wrapped with IntWrapper(PreviousActionWrapper(...)), a mask of
+    possible words and a dictionary index.
+
+    ...
+
+    Attributes
+    ----------
+    answers : npt.NDArray[np.int_]
+        Dictionary index of each game's answer
+    guesses_remaining : npt.NDArray[np.int_]
+        Remaining guesses of each game
+    possible : npt.NDArray[np.bool_]
+        Mask of possible words left in each game's search space
+
+    Methods
+    -------
+    reset(self) -> npt.NDArray[np.uint8]
+        Reset every game
+    step_async(self, actions: npt.NDArray[np.int_]) -> None
+        Store actions to perform
+    step_wait(self) -> VecEnvStepReturn
+        Perform stored actions, resetting finished games
+    seed(self, seed: Optional[int]) -> List[Optional[int]]
+        Seed answer generation
+    action_masks(self) -> npt.NDArray[np.bool_]
+        Mask of words worth guessing in each game
+    """
+
+    def __init__(
+        self, num_envs: int, feedback_matrix: Optional[npt.NDArray[np.uint8]] = None, seed: Optional[int] = None
+    ) -> None:
+        """Initialise object, optionally looking up feedback from a precomputed feedback matrix."""
+        super().__init__(num_envs, spaces.MultiBinary(DICTIONARY_LENGTH), spaces.Discrete(DICTIONARY_LENGTH))
+
+        self._feedback_matrix: Optional[npt.NDArray[np.uint8]] = feedback_matrix
+        self._rng: np.random.Generator = np.random.default_rng(seed)
+        self._actions: npt.NDArray[np.int_] = np.zeros(num_envs, dtype=np.int_)
+        self.answers: npt.NDArray[np.int_] = self._rng.integers(DICTIONARY_LENGTH, size=num_envs)
+        self.guesses_remaining: npt.NDArray[np.int_] = np.full(num_envs, Generator.GUESSES)
+        self.possible: npt.NDArray[np.bool_] = np.ones((num_envs, DICTIONARY_LENGTH), dtype=np.bool_)
+
+    def reset(self) -> npt.NDArray[np.uint8]:
+        """
+        Reset every game.
+
+        Returns
+        -------
+        npt.NDArray[np.uint8]
+        """
+        self._reset_games(np.ones(self.num_envs, dtype=np.bool_))
+
+        return self.possible.astype(np.uint8)
+
+    def step_async(self, actions: npt.NDArray[np.int_]) -> None:
+        """
+        Store actions to perform.
+
+        Parameters
+        ----------
+        actions : npt.NDArray[np.int_]
+            Dictionary index of each game's guess
+        """
+        self._actions = np.asarray(actions, dtype=np.int_).reshape(self.num_envs)
+
+    def step_wait(self) -> VecEnvStepReturn:
+        """
+        Perform stored actions, resetting finished games.
+
+        Returns
+        -------
+        VecEnvStepReturn
+            Observations, rewards, dones and infos, with each finished game's last observation in its info
+        """
+        guess_codes = score_guesses(self._actions, feedback_matrix=self._feedback_matrix)
+        codes = guess_codes[np.arange(self.num_envs), self.answers]
+
+        # Keep words that would have given the same feedback, as WordFilter does
+        self.possible &= guess_codes == codes[:, None]
+        self.guesses_remaining -= 1
+
+        won = codes == WIN_FEEDBACK
+        dones = won | (self.guesses_remaining <= 0)
+        rewards = (
+            GREEN_COUNTS[codes].astype(np.int_) * Generator.GREEN_VALUE
+            + YELLOW_COUNTS[codes].astype(np.int_) * Generator.YELLOW_VALUE
+            + np.where(dones, self.guesses_remaining * Generator.UNUSED_TURN_VALUE, 0)
+        )
+
+        observations = self.possible.astype(np.uint8)
+        infos: List[Any] = [{} for _ in range(self.num_envs)]
+        for idx in np.flatnonzero(dones):
+            infos[idx] = {"terminal_observation": observations[idx].copy(), "won": bool(won[idx])}
+
+        self._reset_games(dones)
+        observations[dones] = 1
+
+        return observations, rewards.astype(np.float32), dones, infos
+
+    def seed(self, seed: Optional[int] = None) -> List[Optional[int]]:
+        """
+        Seed answer generation.
+
+        Parameters
+        ----------
+        seed : Optional[int]
+            Seed
+
+        Returns
+        -------
+        List[Optional[int]]
+        """
+        self._rng = np.random.default_rng(seed)
+
+        return [seed] * self.num_envs
+
+    def close(self) -> None:
+        """Close environments, which hold no resources."""
+
+    def get_attr(self, attr_name: str, indices: VecEnvIndices = None) -> List[Any]:
+        """Return attribute, shared between games."""
+        return [getattr(self, attr_name) for _ in self._get_indices(indices)]
+
+    def set_attr(self, attr_name: str, value: Any, indices: VecEnvIndices = None) -> None:
+        """Set attribute, shared between games."""
+        setattr(self, attr_name, value)
+
+    def env_method(
+        self, method_name: str, *method_args: Any, indices: VecEnvIndices = None, **method_kwargs: Any
+    ) -> List[Any]:
+        """Call method once per game."""
+        return [getattr(self, method_name)(*method_args, **method_kwargs) for _ in self._get_indices(indices)]
+
+    def env_is_wrapped(self, wrapper_class: Type[Wrapper], indices: VecEnvIndices = None) -> List[bool]:
+        """Return false for every game, as games are not gym environments."""
+        return [False for _ in self._get_indices(indices)]
+
+    def action_masks(self) -> npt.NDArray[np.bool_]:
+        """
+        Mask of words worth guessing in each game, those still possible.
+
+        Returns
+        -------
+        npt.NDArray[np.bool_]
+        """
+        return self.possible.copy()
+
+    def get_images(self) -> Sequence[npt.NDArray[np.uint8]]:
+        """[NOT IMPLEMENTED] Render current state."""
+        raise NotImplementedError("Rendering has not been implemented for this environment")
+
+    def _reset_games(self, games: npt.NDArray[np.bool_]) -> None:
+        self.answers[games] = self._rng.integers(DICTIONARY_LENGTH, size=int(games.sum()))
+        self.guesses_remaining[games] = Generator.GUESSES
+        self.possible[games] = True
@@ -1,6 +1,7 @@
 """Import file."""
 
 from .int_wrapper import IntWrapper
+from .letter_state_wrapper import LetterStateWrapper
 from .previous_action_wrapper import PreviousActionWrapper
 
-__all__ = ["IntWrapper", "PreviousActionWrapper"]
+__all__ = ["IntWrapper", "LetterStateWrapper", "PreviousActionWrapper"]
@@ -23,6 +23,12 @@ class ActionObservationWrapper(Wrapper):  # type: ignore[misc] # gym has bad typ
         Reset the environment using modified observation
     step(self, action: Any) -> Tuple[Any, ...]
         Perform given action using modified action and observation
+    areset(self) -> Any
+        Reset an environment that plays asynchronously using modified observation
+    astep(self, action: Any) -> Tuple[Any, ...]
+        Perform given action on an environment that plays asynchronously using modified action and observation
+    reset_state(self) -> None
+        Clear state kept between steps
     observation(self, observation: Any) -> Any
         Override observation
     action(self, action: Any) -> Any:
@@ -38,6 +44,8 @@ class ActionObservationWrapper(Wrapper):  # type: ignore[misc] # gym has bad typ
         -------
         Any
         """
+        self.reset_state()
+
         return self.observation(super().reset())
 
     def step(self, action: Any) -> Tuple[Any, ...]:
@@ -57,6 +65,38 @@ class ActionObservationWrapper(Wrapper):  # type: ignore[misc] # gym has bad typ
 
         return self.observation(observation), *rest
 
+    async def areset(self) -> Any:
+        """
+        Reset an environment that plays asynchronously using modified observation.
+
+        Returns
+        -------
+        Any
+        """
+        self.reset_state()
+
+        return self.observation(await self.env.areset())
+
+    async def astep(self, action: Any) -> Tuple[Any, ...]:
+        """
+        Perform given action on an environment that plays asynchronously using modified action and observation.
+
+        Parameters
+        ----------
+        action : Any
+            Action to perform
+
+        Returns
+        -------
+        Tuple[Any, ...]
+        """
+        observation, *rest = await self.env.astep(self.action(action))
+
+        return self.observation(observation), *rest
+
+    def reset_state(self) -> None:
+        """Clear state kept between steps."""
+
     @abstractmethod
     def observation(self, observation: Any) -> Any:
         """
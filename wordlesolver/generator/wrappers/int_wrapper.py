@@ -11,7 +11,7 @@ import numpy as np
 import numpy.typing as npt
 from gym import spaces
 
-from ...data import DICTIONARY, DICTIONARY_LENGTH, LetterValidity, WordFilter
+from ...data import DICTIONARY_LENGTH, LetterValidity, WordFilter
 from ..generator import Generator
 from .action_observation_wrapper import ActionObservationWrapper
 
@@ -31,14 +31,18 @@ class IntWrapper(ActionObservationWrapper):
 
     Methods
     -------
-    reset(self) -> Any
-        Reset the environment
-    observation(self, observation: Tuple[Optional[str], Optional[List[LetterValidity]]]) -> npt.NDArray[np.uint8]
+    reset_state(self) -> None
+        Mark every word as possible again
+    observation(self, observation: Tuple[Optional[int], Optional[List[LetterValidity]]]) -> npt.NDArray[np.uint8]
         Return observation as numpy array
-    action(self, action: npt.NDArray[np.uint8]) -> str
-        Return action as string
+    action(self, action: npt.NDArray[np.uint8]) -> int
+        Return action as word ID
+    action_masks(self) -> npt.NDArray[np.bool_]
+        Mask of words worth guessing
     """
 
+    _ALL_WORDS: npt.NDArray[np.uint8] = np.ones(DICTIONARY_LENGTH, dtype=np.uint8)
+
     def __init__(self, env: Generator) -> None:
         """Initialise object."""
         super().__init__(env)
@@ -46,39 +50,40 @@ class IntWrapper(ActionObservationWrapper):
         self.action_space: spaces.Box = spaces.Discrete(DICTIONARY_LENGTH)
         self.observation_space: spaces.Box = spaces.MultiBinary(DICTIONARY_LENGTH)
         self._word_filter = WordFilter()
+        self._possible: npt.NDArray[np.uint8] = self._ALL_WORDS.copy()
 
-    def reset(self) -> npt.NDArray[np.uint8]:
-        """
-        Reset the environment.
-
-        Returns
-        -------
-        npt.NDArray[np.uint8]
-        """
-        self._word_filter = WordFilter()
-
-        return super().reset()  # type: ignore[no-any-return]
+    def reset_state(self) -> None:
+        """Mark every word as possible again."""
+        self._word_filter.reset()
+        np.copyto(self._possible, self._ALL_WORDS)
 
-    def observation(self, observation: Tuple[Optional[str], Optional[List[LetterValidity]]]) -> npt.NDArray[np.uint8]:
+    def observation(self, observation: Tuple[Optional[int], Optional[List[LetterValidity]]]) -> npt.NDArray[np.uint8]:
         """
         Return observation as numpy array.
 
         Parameters
         ----------
-        observation : Tuple[Optional[str], Optional[List[LetterValidity]]]
+        observation : Tuple[Optional[int], Optional[List[LetterValidity]]]
             Environment state
 
         Returns
         -------
         npt.NDArray[np.uint8]
         """
+        previous_idxs = self._word_filter.possible_idxs
         self._word_filter.filter(*observation)
 
-        return np.array([(1 if word in self._word_filter.possible_words else 0) for word in DICTIONARY])
+        # Possible words only ever narrow, so clear the previous ones and set those that are left
+        if len(self._word_filter.possible_idxs) != len(previous_idxs):
+            self._possible[previous_idxs] = 0
+            self._possible[self._word_filter.possible_idxs] = 1
 
-    def action(self, action: npt.NDArray[np.uint8]) -> str:
+        # Callers such as vectorised environments keep observations across reset, so hand out a copy
+        return self._possible.copy()
+
+    def action(self, action: npt.NDArray[np.uint8]) -> int:
         """
-        Return action as string.
+        Return action as word ID.
 
         Parameters
         ----------
@@ -87,6 +92,18 @@ class IntWrapper(ActionObservationWrapper):
 
         Returns
         -------
-        str
+        int
+        """
+        return int(action)
+
+    def action_masks(self) -> npt.NDArray[np.bool_]:
+        """
+        Mask of words worth guessing, those still possible.
+
+        Words already guessed are never possible again, as their feedback would have been all green.
+
+        Returns
+        -------
+        npt.NDArray[np.bool_]
         """
-        return DICTIONARY[action]
+        return self._possible.astype(np.bool_)
@@ -0,0 +1,142 @@
+"""
+File containing letter state wrapper.
+
+Classes:
+    LetterStateWrapper(ActionObservationWrapper)
+"""
+
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+from gym import spaces
+
+from ...data import (
+    DICTIONARY_LENGTH,
+    DICTIONARY_LETTERS,
+    FEEDBACK_VALIDITIES,
+    LETTERS_COUNT,
+    WORD_LENGTH,
+    Feedback,
+    LetterValidity,
+)
+from ..generator import Generator
+from .action_observation_wrapper import ActionObservationWrapper
+
+
+class LetterStateWrapper(ActionObservationWrapper):
+    """
+    Letter state wrapper, observing what is known about each letter rather than which words are possible.
+
+    The observation is the one hot state (unknown, excluded or green) of every letter at every position, followed by
+    the minimum and maximum count of every letter as fractions of the word length.
+
+    ...
+
+    Attributes
+    ----------
+    UNKNOWN : int
+        State of a letter that may be at a position
+    EXCLUDED : int
+        State of a letter that isn't at a position
+    GREEN : int
+        State of a letter that is at a position
+    OBSERVATION_SIZE : int
+        Number of features observed
+    action_space : spaces.Discrete
+        Actions allowed
+    observation_space : spaces.Box
+        Possible observations
+
+    Methods
+    -------
+    reset_state(self) -> None
+        Mark every letter as unknown again
+    observation(self, observation: Tuple[Optional[int], Optional[Union[List[LetterValidity], Feedback]]]) -> ...
+        Update and return what is known about each letter
+    action(self, action: npt.NDArray[np.int_]) -> int
+        Return action as word ID
+    """
+
+    UNKNOWN: int = 0
+    EXCLUDED: int = 1
+    GREEN: int = 2
+    OBSERVATION_SIZE: int = WORD_LENGTH * LETTERS_COUNT * 3 + LETTERS_COUNT * 2
+
+    _ONE_HOT: npt.NDArray[np.float32] = np.eye(3, dtype=np.float32)
+    _POSITIONS: npt.NDArray[np.int_] = np.arange(WORD_LENGTH)
+
+    def __init__(self, env: Generator) -> None:
+        """Initialise object."""
+        super().__init__(env)
+
+        self.action_space: spaces.Discrete = spaces.Discrete(DICTIONARY_LENGTH)
+        self.observation_space: spaces.Box = spaces.Box(0, 1, (self.OBSERVATION_SIZE,), dtype=np.float32)
+        self._states: npt.NDArray[np.int_] = np.full((WORD_LENGTH, LETTERS_COUNT), self.UNKNOWN)
+        self._min_counts: npt.NDArray[np.int_] = np.zeros(LETTERS_COUNT, dtype=np.int_)
+        self._max_counts: npt.NDArray[np.int_] = np.full(LETTERS_COUNT, WORD_LENGTH)
+
+    def reset_state(self) -> None:
+        """Mark every letter as unknown again."""
+        self._states.fill(self.UNKNOWN)
+        self._min_counts.fill(0)
+        self._max_counts.fill(WORD_LENGTH)
+
+    def observation(
+        self, observation: Tuple[Optional[int], Optional[Union[List[LetterValidity], Feedback]]]
+    ) -> npt.NDArray[np.float32]:
+        """
+        Update and return what is known about each letter.
+
+        Parameters
+        ----------
+        observation : Tuple[Optional[int], Optional[Union[List[LetterValidity], Feedback]]]
+            Previous guess ID and environment state
+
+        Returns
+        -------
+        npt.NDArray[np.float32]
+        """
+        guess, word_validity = observation
+        if guess is not None and word_validity is not None:
+            self._update(DICTIONARY_LETTERS[guess], FEEDBACK_VALIDITIES[Feedback.of(word_validity)])
+
+        return np.concatenate(
+            [
+                self._ONE_HOT[self._states].reshape(-1),
+                self._min_counts.astype(np.float32) / WORD_LENGTH,
+                self._max_counts.astype(np.float32) / WORD_LENGTH,
+            ]
+        )
+
+    def action(self, action: npt.NDArray[np.int_]) -> int:
+        """
+        Return action as word ID.
+
+        Parameters
+        ----------
+        action : npt.NDArray[np.int_]
+            Action to perform
+
+        Returns
+        -------
+        int
+        """
+        return int(action)
+
+    def _update(self, letters: npt.NDArray[np.uint8], validities: npt.NDArray[np.uint8]) -> None:
+        green = validities == LetterValidity.GREEN.value
+
+        # A green position rules out every other letter there, and any other colour rules out the guessed letter
+        self._states[self._POSITIONS[green]] = self.EXCLUDED
+        self._states[self._POSITIONS[green], letters[green]] = self.GREEN
+        self._states[self._POSITIONS[~green], letters[~green]] = self.EXCLUDED
+
+        # Green and yellow copies are in the answer, and a grey copy means there are no more than those
+        found = np.bincount(letters[validities != LetterValidity.GREY.value], minlength=LETTERS_COUNT)
+        np.maximum(self._min_counts, found, out=self._min_counts)
+        capped = np.zeros(LETTERS_COUNT, dtype=np.bool_)
+        capped[letters[validities == LetterValidity.GREY.value]] = True
+        self._max_counts[capped] = found[capped]
+
+        self._states[:, self._max_counts == 0] = self.EXCLUDED
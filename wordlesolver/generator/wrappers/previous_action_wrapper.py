@@ -25,8 +25,8 @@ class PreviousActionWrapper(ActionObservationWrapper):
 
     Methods
     -------
-    reset(self) -> Any
-        Reset the environment
+    reset_state(self) -> None
+        Forget previous action
     observation(self, observation: Any) -> Tuple[Optional[Any], Any]
         Return observation with previous action
     action(self, action: Any) -> Any
@@ -39,18 +39,10 @@ class PreviousActionWrapper(ActionObservationWrapper):
 
         self.previous_action: Optional[Any] = None
 
-    def reset(self) -> Any:
-        """
-        Reset the environment.
-
-        Returns
-        -------
-        Any
-        """
+    def reset_state(self) -> None:
+        """Forget previous action."""
         self.previous_action = None
 
-        return super().reset()
-
     def observation(self, observation: Any) -> Tuple[Optional[Any], Any]:
         """
         Return observation with previous action.
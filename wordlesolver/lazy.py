@@ -0,0 +1,91 @@
+"""
+File containing helpers for importing modules only once something in them is used.
+
+Classes:
+    LazyRegistry(Mapping[str, T])
+
+Functions:
+    lazy_attributes(package: str, modules: Dict[str, str]) -> Callable[[str], Any]
+"""
+
+from importlib import import_module
+from typing import Any, Callable, Dict, Iterator, Mapping, TypeVar, cast
+
+T = TypeVar("T")
+
+
+def _import_attribute(package: str, module: str, name: str) -> Any:
+    imported = import_module(module, package)
+
+    # Subpackages and submodules are looked up by their own name
+    return imported if module == f".{name}" else getattr(imported, name)
+
+
+class LazyRegistry(Mapping[str, T]):
+    """
+    Lazy registry class, mapping names to attributes of modules imported on first lookup.
+
+    ...
+
+    Methods
+    -------
+    entry_point(self, name: str) -> str
+        Import path of the named attribute, as module:attribute
+    """
+
+    def __init__(self, package: str, modules: Dict[str, str]) -> None:
+        """Initialise object, with module names relative to package."""
+        self._package: str = package
+        self._modules: Dict[str, str] = modules
+
+    def __getitem__(self, name: str) -> T:
+        """Import and return the named attribute."""
+        return cast(T, _import_attribute(self._package, self._modules[name], name))
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over names without importing anything."""
+        return iter(self._modules)
+
+    def __len__(self) -> int:
+        """Return number of names."""
+        return len(self._modules)
+
+    def entry_point(self, name: str) -> str:
+        """
+        Import path of the named attribute, as module:attribute.
+
+        Parameters
+        ----------
+        name : str
+            Attribute name
+
+        Returns
+        -------
+        str
+        """
+        return f"{self._package}{self._modules[name]}:{name}"
+
+
+def lazy_attributes(package: str, modules: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Build a module __getattr__ importing each attribute's module on first access.
+
+    Parameters
+    ----------
+    package : str
+        Package the modules are relative to
+    modules : Dict[str, str]
+        Module of each attribute
+
+    Returns
+    -------
+    Callable[[str], Any]
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in modules:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        return _import_attribute(package, modules[name], name)
+
+    return __getattr__
@@ -5,20 +5,52 @@ Classes:
     ValidateSolver
 
 Misc variables:
-    solvers: Dict[str, Solver]
+    solvers: LazyRegistry[Type[Solver]]
 """
 
 from argparse import Action, ArgumentParser, Namespace
-from typing import Any, Dict, Optional, Sequence, Type, Union
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Type, Union
 
+from ..lazy import LazyRegistry, lazy_attributes
+from .decision_tree import (
+    DECISION_TREE_FILE,
+    DecisionTree,
+    compile_decision_tree,
+    load_decision_tree,
+    save_decision_tree,
+)
+from .decision_tree_solver import DecisionTreeSolver
+from .entropy_solver import EntropySolver
+from .filter_solver import FilterSolver
 from .maximise_matches_solver import MaximiseMatchesSolver
-from .ppo_solver import PPOSolver
+from .numpy_policy import (
+    POLICY_FILE,
+    NumpyPolicy,
+    export_policy,
+    load_policy,
+    save_policy,
+)
+from .numpy_ppo_solver import NumpyPPOSolver
 from .solver import Solver
+from .solver_cache import SOLVER_CACHE_FILE, SolverCache
 
-solvers: Dict[str, Type[Solver]] = {
-    "PPOSolver": PPOSolver,
-    "MaximiseMatchesSolver": MaximiseMatchesSolver,
-}
+if TYPE_CHECKING:
+    from .concurrent_games import play_concurrently
+    from .ppo_solver import PPOSolver
+
+# Solvers needing torch or stable baselines, and playing live games, are only imported once used
+__getattr__ = lazy_attributes(__name__, {"PPOSolver": ".ppo_solver", "play_concurrently": ".concurrent_games"})
+
+solvers: LazyRegistry[Type[Solver]] = LazyRegistry(
+    __name__,
+    {
+        "PPOSolver": ".ppo_solver",
+        "NumpyPPOSolver": ".numpy_ppo_solver",
+        "MaximiseMatchesSolver": ".maximise_matches_solver",
+        "EntropySolver": ".entropy_solver",
+        "DecisionTreeSolver": ".decision_tree_solver",
+    },
+)
 
 
 class ValidateSolver(Action):
@@ -40,4 +72,26 @@ class ValidateSolver(Action):
         setattr(namespace, self.dest, solvers[value])
 
 
-__all__ = ["Solver", "PPOSolver", "MaximiseMatchesSolver", "ValidateSolver"]
+__all__ = [
+    "Solver",
+    "FilterSolver",
+    "SolverCache",
+    "SOLVER_CACHE_FILE",
+    "PPOSolver",
+    "NumpyPPOSolver",
+    "NumpyPolicy",
+    "POLICY_FILE",
+    "export_policy",
+    "save_policy",
+    "load_policy",
+    "MaximiseMatchesSolver",
+    "EntropySolver",
+    "DecisionTreeSolver",
+    "DecisionTree",
+    "DECISION_TREE_FILE",
+    "compile_decision_tree",
+    "save_decision_tree",
+    "load_decision_tree",
+    "ValidateSolver",
+    "play_concurrently",
+]
@@ -0,0 +1,71 @@
+"""
+File containing function playing many live games at once.
+
+Functions:
+    play_concurrently(solver_type: Type[Solver], games: int, ...) -> List[Tuple[bool, List[float]]]
+
+Misc variables:
+    CONCURRENCY : int
+"""
+
+from asyncio import Semaphore, gather
+from typing import List, Optional, Tuple, Type
+
+from playwright.async_api import Browser, async_playwright
+
+from ..generator import AsyncRealGenerator, RealGenerator
+from .solver import Solver
+
+CONCURRENCY: int = 8
+
+
+async def _play(
+    solver_type: Type[Solver], browser: Browser, semaphore: Semaphore, page_url: Optional[str]
+) -> Tuple[bool, List[float]]:
+    async with semaphore:
+        context = await browser.new_context(
+            viewport={"width": RealGenerator.PAGE_WIDTH, "height": RealGenerator.PAGE_HEIGHT}
+        )
+        try:
+            if RealGenerator.ROUTING_POLICY is not None:
+                await RealGenerator.ROUTING_POLICY.ainstall(context)
+            generator = AsyncRealGenerator(await context.new_page(), page_url)
+            latencies = await solver_type(generator).run_async()
+
+            return generator.won, latencies
+        finally:
+            await context.close()
+
+
+async def play_concurrently(
+    solver_type: Type[Solver], games: int, concurrency: int = CONCURRENCY, page_url: Optional[str] = None
+) -> List[Tuple[bool, List[float]]]:
+    """
+    Play games in separate tabs of one browser, waiting on the site for up to concurrency games at once.
+
+    Parameters
+    ----------
+    solver_type : Type[Solver]
+        Solver to play each game with
+    games : int
+        Number of games to play
+    concurrency : int
+        Maximum number of games open at once
+    page_url : Optional[str]
+        Url to play at instead of the wordle site, e.g. a locally served copy of it
+
+    Returns
+    -------
+    List[Tuple[bool, List[float]]]
+        Whether each game was won and seconds taken to choose each of its guesses
+    """
+    if concurrency < 1:
+        raise AssertionError("Concurrency must be positive")
+
+    semaphore = Semaphore(concurrency)
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch()
+        try:
+            return list(await gather(*(_play(solver_type, browser, semaphore, page_url) for _ in range(games))))
+        finally:
+            await browser.close()
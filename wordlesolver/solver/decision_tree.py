@@ -0,0 +1,169 @@
+"""
+File containing helpers for compiling a deterministic solver into a decision tree.
+
+Node 0 holds the opening guess, and children[node, feedback code] is the node to play after that feedback, or -1 when
+no answer leads there.
+
+Classes:
+    DecisionTree(NamedTuple)
+
+Functions:
+    compile_decision_tree(solver: Solver, ...) -> DecisionTree
+    save_decision_tree(tree: DecisionTree, file_path: str) -> None
+    load_decision_tree(file_path: str) -> DecisionTree
+
+Misc variables:
+    DECISION_TREE_FILE : str
+"""
+
+from copy import deepcopy
+from os import makedirs, path, replace
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from tqdm import tqdm
+
+from ..data import (
+    DICTIONARY,
+    DICTIONARY_LENGTH,
+    FEEDBACK_CODES,
+    WIN_FEEDBACK,
+    WORD_INDICES,
+    Feedback,
+)
+from ..generator import Generator, score_guess
+from .solver import Solver
+
+DECISION_TREE_FILE: str = path.join("out", "decision_tree.npz")
+
+
+class DecisionTree(NamedTuple):
+    """
+    Decision tree of guesses.
+
+    ...
+
+    Attributes
+    ----------
+    guesses : npt.NDArray[np.int32]
+        Dictionary index of the guess at each node
+    children : npt.NDArray[np.int32]
+        Next node for each node and feedback code, -1 if unreachable
+    """
+
+    guesses: npt.NDArray[np.int32]
+    children: npt.NDArray[np.int32]
+
+
+class _PendingNode(NamedTuple):
+    parent_solver: Solver
+    observation: Tuple[Optional[str], Any]
+    answer_idxs: npt.NDArray[np.int_]
+    parent: int
+    code: int
+    depth: int
+
+
+def compile_decision_tree(
+    solver: Solver,
+    answer_idxs: Optional[npt.NDArray[np.int_]] = None,
+    feedback_matrix: Optional[npt.NDArray[np.uint8]] = None,
+) -> DecisionTree:
+    """
+    Run a deterministic solver over every feedback path reachable from the given answers.
+
+    The solver must take (previous guess, word validity) observations, as solvers wrapping PreviousActionWrapper do.
+
+    Parameters
+    ----------
+    solver : Solver
+        Freshly constructed solver
+    answer_idxs : Optional[npt.NDArray[np.int_]]
+        Dictionary indices of possible answers, all words if not given
+    feedback_matrix : Optional[npt.NDArray[np.uint8]]
+        Precomputed feedback matrix, shared rather than copied between solver states
+
+    Returns
+    -------
+    DecisionTree
+    """
+    guesses: List[int] = []
+    children: List[npt.NDArray[np.int32]] = []
+    memo: Dict[int, Any] = {} if feedback_matrix is None else {id(feedback_matrix): feedback_matrix}
+    pending: List[_PendingNode] = [
+        _PendingNode(
+            solver, (None, None), np.arange(DICTIONARY_LENGTH) if answer_idxs is None else answer_idxs, -1, -1, 1
+        )
+    ]
+
+    with tqdm() as progress:
+        while pending:
+            node = pending.pop()
+            node_idx = len(guesses)
+            # Siblings branch from the same solver state, so each node plays on its own copy
+            node_solver = deepcopy(node.parent_solver, memo.copy())
+
+            # pylint: disable=protected-access; compiling drives the solver one turn at a time
+            guess = WORD_INDICES[node_solver._next_guess(node.observation)]
+            guesses.append(guess)
+            children.append(np.full(FEEDBACK_CODES, -1, dtype=np.int32))
+            if node.parent >= 0:
+                children[node.parent][node.code] = node_idx
+            progress.update()
+
+            if node.depth >= Generator.GUESSES:
+                continue
+
+            codes = score_guess(guess, node.answer_idxs, feedback_matrix)
+
+            for code in np.unique(codes[codes != WIN_FEEDBACK]):
+                pending.append(
+                    _PendingNode(
+                        node_solver,
+                        (DICTIONARY[guess], Feedback(code)),
+                        node.answer_idxs[codes == code],
+                        node_idx,
+                        code,
+                        node.depth + 1,
+                    )
+                )
+
+    return DecisionTree(np.array(guesses, dtype=np.int32), np.stack(children))
+
+
+def save_decision_tree(tree: DecisionTree, file_path: str = DECISION_TREE_FILE) -> None:
+    """
+    Save the decision tree, replacing any existing file atomically.
+
+    Parameters
+    ----------
+    tree : DecisionTree
+        Decision tree
+    file_path : str
+        File to save to
+    """
+    if folder := path.dirname(file_path):
+        makedirs(folder, exist_ok=True)
+
+    temporary_file_path = f"{file_path}.tmp"
+    with open(temporary_file_path, "wb") as file:
+        np.savez_compressed(file, guesses=tree.guesses, children=tree.children)
+    replace(temporary_file_path, file_path)
+
+
+def load_decision_tree(file_path: str = DECISION_TREE_FILE) -> DecisionTree:
+    """
+    Load the decision tree.
+
+    Parameters
+    ----------
+    file_path : str
+        File to load from
+
+    Returns
+    -------
+    DecisionTree
+    """
+    with np.load(file_path) as tree:
+        return DecisionTree(tree["guesses"], tree["children"])
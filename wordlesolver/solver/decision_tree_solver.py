@@ -0,0 +1,42 @@
+"""
+File containing decision tree solver class.
+
+Classes:
+    DecisionTreeSolver(Solver)
+"""
+
+from typing import List, Optional, Tuple, Union
+
+from ..data import DICTIONARY, Feedback, LetterValidity
+from ..generator import Generator
+from ..generator.wrappers import PreviousActionWrapper
+from .decision_tree import DECISION_TREE_FILE, DecisionTree, load_decision_tree
+from .solver import Solver
+
+
+class DecisionTreeSolver(Solver):
+    """Decision tree solver class, replaying a solver compiled with compile_tree.py."""
+
+    def __init__(self, generator: Generator, tree_file: str = DECISION_TREE_FILE) -> None:
+        """Initialise object."""
+        super().__init__(PreviousActionWrapper(generator))
+
+        self.tree: DecisionTree = load_decision_tree(tree_file)
+        self._node: int = 0
+
+    def _next_guess(self, observation: Tuple[Optional[str], Optional[Union[List[LetterValidity], Feedback]]]) -> str:
+        guess, word_validity = observation
+
+        if guess is None or word_validity is None:
+            self._node = 0
+        else:
+            self._node = int(self.tree.children[self._node, Feedback.of(word_validity)])
+
+        if self._node < 0:
+            raise AssertionError("Decision tree does not cover this game, recompile it")
+
+        return str(DICTIONARY[self.tree.guesses[self._node]])
+
+    def train(self) -> None:
+        """[NOT IMPLEMENTED] Train decision tree solver."""
+        raise NotImplementedError("Decision tree solver is compiled with compile_tree.py rather than trained")
@@ -0,0 +1,95 @@
+"""
+File containing entropy solver class.
+
+Classes:
+    EntropySolver(FilterSolver)
+"""
+
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from ..data import DICTIONARY, DICTIONARY_LENGTH, FEEDBACK_CODES
+from ..generator import Generator, score_guesses
+from .filter_solver import FilterSolver
+
+
+class EntropySolver(FilterSolver):
+    """
+    Entropy solver class, guessing the word whose feedback is expected to give the most information.
+
+    ...
+
+    Attributes
+    ----------
+    BATCH_SIZE : int
+        Number of guesses to score at once
+    """
+
+    BATCH_SIZE: int = 256
+
+    _opening_guess: Optional[str] = None
+
+    def __init__(
+        self,
+        generator: Generator,
+        feedback_matrix: Optional[npt.NDArray[np.uint8]] = None,
+        *,
+        word_filter: str = "array",
+    ) -> None:
+        """Initialise object, optionally looking up feedback from a precomputed feedback matrix."""
+        super().__init__(generator, feedback_matrix, word_filter=word_filter)
+
+        self._feedback_matrix: Optional[npt.NDArray[np.uint8]] = feedback_matrix
+
+    def _choose_guess(self, possible_idxs: npt.NDArray[np.int_]) -> str:
+        if len(possible_idxs) <= 2:
+            return str(DICTIONARY[possible_idxs[0]])
+
+        # Every game starts from the whole dictionary, so the opening guess only needs scoring once
+        if len(possible_idxs) == DICTIONARY_LENGTH:
+            if EntropySolver._opening_guess is None:
+                EntropySolver._opening_guess = self._best_guess(possible_idxs)
+            return EntropySolver._opening_guess
+
+        return self._best_guess(possible_idxs)
+
+    def _best_guess(self, answer_idxs: npt.NDArray[np.int_]) -> str:
+        entropies = np.concatenate(
+            [
+                self._entropies(np.arange(start, min(start + self.BATCH_SIZE, DICTIONARY_LENGTH)), answer_idxs)
+                for start in range(0, DICTIONARY_LENGTH, self.BATCH_SIZE)
+            ]
+        )
+
+        # Prefer guesses that could be the answer when they are just as informative
+        is_answer = np.zeros(DICTIONARY_LENGTH, dtype=np.bool_)
+        is_answer[answer_idxs] = True
+        best_idx = np.lexsort((~is_answer, -np.round(entropies, 9)))[0]
+
+        return str(DICTIONARY[best_idx])
+
+    def _entropies(
+        self, guess_idxs: npt.NDArray[np.int_], answer_idxs: npt.NDArray[np.int_]
+    ) -> npt.NDArray[np.float64]:
+        codes = score_guesses(guess_idxs, answer_idxs, self._feedback_matrix)
+
+        # Offset each guess's codes so one bincount gives every guess's feedback histogram
+        offsets = FEEDBACK_CODES * np.arange(len(guess_idxs))[:, None]
+        histograms = np.bincount((codes + offsets).ravel(), minlength=len(guess_idxs) * FEEDBACK_CODES).reshape(
+            len(guess_idxs), FEEDBACK_CODES
+        )
+
+        # Entropy of the histogram is log2(n) - sum(count * log2(count)) / n for n answers
+        answers_count = len(answer_idxs)
+        log_histograms = np.log2(histograms, out=np.zeros(histograms.shape), where=histograms > 0)
+        entropies: npt.NDArray[np.float64] = (
+            np.log2(answers_count) - (histograms * log_histograms).sum(axis=1) / answers_count
+        )
+
+        return entropies
+
+    def train(self) -> None:
+        """[NOT IMPLEMENTED] Train entropy solver."""
+        raise NotImplementedError("Entropy solver cannot be trained")
@@ -0,0 +1,74 @@
+"""
+File containing word filter based solver abstract class.
+
+Classes:
+    FilterSolver(Solver)
+"""
+
+from abc import abstractmethod
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple, Type, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from ..data import BitsetWordFilter, Feedback, LetterValidity, WordFilter
+from ..generator import Generator
+from ..generator.wrappers import PreviousActionWrapper
+from .solver import Solver
+
+
+# pylint: disable=too-few-public-methods; abstract class
+class FilterSolver(Solver):
+    """
+    Word filter based solver abstract class, choosing each guess from the words remaining in its word filter.
+
+    ...
+
+    Attributes
+    ----------
+    WORD_FILTERS : Dict[str, Type[WordFilter]]
+        Ways of filtering words, masking an array of dictionary indices or ANDing precomputed bitmaps
+    word_filter : WordFilter
+        Filter of words still possible
+    """
+
+    WORD_FILTERS: Dict[str, Type[WordFilter]] = {"array": WordFilter, "bitset": BitsetWordFilter}
+
+    def __init__(
+        self,
+        generator: Generator,
+        feedback_matrix: Optional[npt.NDArray[np.uint8]] = None,
+        *,
+        word_filter: str = "array",
+    ) -> None:
+        """Initialise object, optionally looking up feedback from a precomputed feedback matrix."""
+        if word_filter not in self.WORD_FILTERS:
+            raise AssertionError(f"Unknown word filter {word_filter}, expected one of {list(self.WORD_FILTERS)}")
+        if feedback_matrix is not None and word_filter != "array":
+            raise AssertionError(f"Only the array word filter uses a feedback matrix, not {word_filter}")
+
+        super().__init__(PreviousActionWrapper(generator))
+
+        self.word_filter: WordFilter = (
+            WordFilter(feedback_matrix) if feedback_matrix is not None else self.WORD_FILTERS[word_filter]()
+        )
+
+    def _next_guess(self, observation: Tuple[Optional[str], Optional[Union[List[LetterValidity], Feedback]]]) -> str:
+        self.word_filter.filter(*observation)
+
+        possible_idxs = self.word_filter.possible_idxs
+        if self.cache is None:
+            return self._choose_guess(possible_idxs)
+
+        key = self.cache.key(type(self).__name__, possible_idxs)
+        if (guess := self.cache.get(key)) is None:
+            start = perf_counter()
+            guess = self._choose_guess(possible_idxs)
+            self.cache.put(key, guess, perf_counter() - start)
+
+        return guess
+
+    @abstractmethod
+    def _choose_guess(self, possible_idxs: npt.NDArray[np.int_]) -> str:
+        raise NotImplementedError
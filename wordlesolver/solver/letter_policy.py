@@ -0,0 +1,94 @@
+"""
+File containing letter actor critic policy classes, scoring words by their letters.
+
+Classes:
+    LetterActionNet(nn.Module)
+    LetterActorCriticPolicy(ActorCriticPolicy)
+    MaskedLetterActorCriticPolicy(LetterActorCriticPolicy, MaskedActorCriticPolicy)
+"""
+
+import torch as th
+from stable_baselines3.common.policies import ActorCriticPolicy
+from stable_baselines3.common.type_aliases import Schedule
+from torch import nn
+
+from ..data import DICTIONARY_LETTER_IDXS, LETTERS_COUNT, WORD_LENGTH
+from .masked_policy import MaskedActorCriticPolicy
+
+
+class LetterActionNet(nn.Module):
+    """
+    Letter action net, scoring every letter at every position and each word as the sum of its letters' scores.
+
+    ...
+
+    Attributes
+    ----------
+    letter_logits : nn.Linear
+        Layer scoring every letter at every position
+    letter_idxs : th.Tensor
+        Index of each word's letter into the letter scores, by position
+
+    Methods
+    -------
+    forward(self, latent_pi: th.Tensor) -> th.Tensor
+        Score of each word
+    """
+
+    letter_idxs: th.Tensor
+
+    def __init__(self, latent_dim: int) -> None:
+        """Initialise object."""
+        super().__init__()
+
+        self.letter_logits: nn.Linear = nn.Linear(latent_dim, WORD_LENGTH * LETTERS_COUNT)
+        # Not saved with the weights, as it is rebuilt from the dictionary
+        self.register_buffer("letter_idxs", th.as_tensor(DICTIONARY_LETTER_IDXS.T.copy()), persistent=False)
+
+    def forward(self, latent_pi: th.Tensor) -> th.Tensor:
+        """
+        Score of each word.
+
+        Parameters
+        ----------
+        latent_pi : th.Tensor
+            Latent codes of the actor
+
+        Returns
+        -------
+        th.Tensor
+        """
+        letter_logits: th.Tensor = self.letter_logits(latent_pi)
+
+        # Gathered a position at a time, as selecting whole columns is several times faster, forwards and backwards,
+        # than gathering every letter of every word at once
+        word_logits = letter_logits.index_select(1, self.letter_idxs[0])
+        for position_idxs in self.letter_idxs[1:]:
+            word_logits += letter_logits.index_select(1, position_idxs)
+
+        return word_logits
+
+
+class LetterActorCriticPolicy(ActorCriticPolicy):
+    """
+    Letter actor critic policy class, choosing words with a LetterActionNet rather than a logit per word.
+
+    The distribution is still over words, so PPO's log probabilities and entropy are unchanged, but the action head
+    has WORD_LENGTH * LETTERS_COUNT outputs rather than DICTIONARY_LENGTH.
+    """
+
+    def _build(self, lr_schedule: Schedule) -> None:
+        super()._build(lr_schedule)
+
+        self.action_net = LetterActionNet(self.mlp_extractor.latent_dim_pi)
+        if self.ortho_init:
+            self.action_net.apply(lambda module: self.init_weights(module, gain=0.01))
+
+        # Rebuilt, as the optimizer was given the parameters of the replaced action net
+        self.optimizer = self.optimizer_class(  # type:ignore[call-arg]
+            self.parameters(), lr=lr_schedule(1), **self.optimizer_kwargs
+        )
+
+
+class MaskedLetterActorCriticPolicy(LetterActorCriticPolicy, MaskedActorCriticPolicy):
+    """Masked letter actor critic policy class, only choosing words still possible with a LetterActionNet."""
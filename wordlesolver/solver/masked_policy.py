@@ -0,0 +1,97 @@
+"""
+File containing masked actor critic policy class.
+
+Classes:
+    MaskedActorCriticPolicy(ActorCriticPolicy)
+"""
+
+from typing import Tuple
+
+import torch as th
+from stable_baselines3.common.distributions import Distribution
+from stable_baselines3.common.policies import ActorCriticPolicy
+
+
+class MaskedActorCriticPolicy(ActorCriticPolicy):
+    """
+    Masked actor critic policy class, only choosing words still possible.
+
+    Observations of IntWrapper and VecFakeGenerator mark the words still possible, which are also their action masks,
+    so the mask is read from the observation and stays consistent between collecting rollouts and training on them.
+    Words already guessed are never possible again, as their feedback would have been all green.
+
+    ...
+
+    Attributes
+    ----------
+    MASKED_LOGIT : float
+        Logit given to masked actions, finite so entropy stays defined
+    masks_actions : bool
+        Whether the policy masks actions, checked when exporting it
+
+    Methods
+    -------
+    forward(self, obs: th.Tensor, deterministic: bool = False) -> Tuple[th.Tensor, th.Tensor, th.Tensor]
+        Choose actions, giving them with their values and log probabilities
+    evaluate_actions(self, obs: th.Tensor, actions: th.Tensor) -> Tuple[th.Tensor, th.Tensor, th.Tensor]
+        Values, log probabilities and entropy of actions taken
+    """
+
+    MASKED_LOGIT: float = -1e8
+    masks_actions: bool = True
+
+    def forward(self, obs: th.Tensor, deterministic: bool = False) -> Tuple[th.Tensor, th.Tensor, th.Tensor]:
+        """
+        Choose actions, giving them with their values and log probabilities.
+
+        Parameters
+        ----------
+        obs : th.Tensor
+            Observations
+        deterministic : bool
+            Whether to choose the most likely actions rather than sampling them
+
+        Returns
+        -------
+        Tuple[th.Tensor, th.Tensor, th.Tensor]
+        """
+        latent_pi, latent_vf, _ = self._get_latent(obs)
+        distribution = self._masked_distribution(obs, latent_pi)
+        actions = distribution.get_actions(deterministic=deterministic)
+
+        return actions, self.value_net(latent_vf), distribution.log_prob(actions)
+
+    def evaluate_actions(self, obs: th.Tensor, actions: th.Tensor) -> Tuple[th.Tensor, th.Tensor, th.Tensor]:
+        """
+        Values, log probabilities and entropy of actions taken.
+
+        Parameters
+        ----------
+        obs : th.Tensor
+            Observations
+        actions : th.Tensor
+            Actions taken
+
+        Returns
+        -------
+        Tuple[th.Tensor, th.Tensor, th.Tensor]
+        """
+        latent_pi, latent_vf, _ = self._get_latent(obs)
+        distribution = self._masked_distribution(obs, latent_pi)
+        if (entropy := distribution.entropy()) is None:
+            raise AssertionError("Categorical distributions always have an entropy")
+
+        return self.value_net(latent_vf), distribution.log_prob(actions), entropy
+
+    def _predict(self, observation: th.Tensor, deterministic: bool = False) -> th.Tensor:
+        latent_pi, _, _ = self._get_latent(observation)
+
+        return self._masked_distribution(observation, latent_pi).get_actions(deterministic=deterministic)
+
+    def _masked_distribution(self, obs: th.Tensor, latent_pi: th.Tensor) -> Distribution:
+        possible = obs.reshape(len(obs), -1) > 0
+        # Rows with nothing possible are left unmasked, rather than having no valid action
+        possible |= ~possible.any(dim=1, keepdim=True)
+        logits = self.action_net(latent_pi).masked_fill(~possible, self.MASKED_LOGIT)
+
+        return self.action_dist.proba_distribution(action_logits=logits)
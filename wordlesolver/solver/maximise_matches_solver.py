@@ -2,46 +2,40 @@
 File containing maximise matches solver class.
 
 Classes:
-    MaximiseMatchesSolver(Solver)
+    MaximiseMatchesSolver(FilterSolver)
 """
 
-from typing import List, Optional, Set, Tuple
+import numpy as np
+import numpy.typing as npt
 
-from tqdm import tqdm
+from ..data import DICTIONARY, DICTIONARY_LETTERS, LETTERS_COUNT, WORD_LENGTH
+from .filter_solver import FilterSolver
 
-from ..data import LetterValidity, WordFilter
-from ..generator import Generator
-from ..generator.wrappers import PreviousActionWrapper
-from .solver import Solver
 
-
-class MaximiseMatchesSolver(Solver):
+class MaximiseMatchesSolver(FilterSolver):
     """Maximise matches solver class."""
 
-    def __init__(self, generator: Generator) -> None:
-        """Initialise object."""
-        super().__init__(PreviousActionWrapper(generator))
+    def _choose_guess(self, possible_idxs: npt.NDArray[np.int_]) -> str:
+        matches = self._count_matches(DICTIONARY_LETTERS[possible_idxs], DICTIONARY_LETTERS[possible_idxs])
 
-        self.word_filter: WordFilter = WordFilter()
+        return str(DICTIONARY[possible_idxs[np.argmax(matches)]])
 
-    def _next_guess(self, observation: Tuple[Optional[str], Optional[List[LetterValidity]]]) -> str:
-        self.word_filter.filter(*observation)
+    @staticmethod
+    def _count_matches(guesses: npt.NDArray[np.uint8], words: npt.NDArray[np.uint8]) -> npt.NDArray[np.int_]:
+        # presence[pos, letter] is whether any word has the letter at that position
+        presence = np.zeros((WORD_LENGTH, LETTERS_COUNT), dtype=np.bool_)
+        presence[np.arange(WORD_LENGTH), words] = True
 
-        return str(
-            max(
-                tqdm(self.word_filter.possible_words),
-                key=self._count_matches,
-            )
+        # Count distinct letters of each guess that match some word, using LETTERS_COUNT for letters that don't
+        matching_letters = np.sort(
+            np.where(presence[np.arange(WORD_LENGTH), guesses], guesses, LETTERS_COUNT),
+            axis=1,
         )
+        is_new_letter = np.ones_like(matching_letters, dtype=np.bool_)
+        is_new_letter[:, 1:] = matching_letters[:, 1:] != matching_letters[:, :-1]
+        matches: npt.NDArray[np.int_] = np.sum(is_new_letter & (matching_letters != LETTERS_COUNT), axis=1)
 
-    def _count_matches(self, guess: str) -> int:
-        matching_chars: Set[str] = set()
-
-        for word in self.word_filter.possible_words:
-            for char_0, char_1 in zip(guess, word):
-                if char_0 == char_1:
-                    matching_chars.add(char_0)
-        return len(matching_chars)
+        return matches
 
     def train(self) -> None:
         """[NOT IMPLEMENTED] Train maximise matches solver."""
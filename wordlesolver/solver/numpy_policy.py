@@ -0,0 +1,157 @@
+"""
+File containing helpers for running a trained PPO policy in NumPy, without torch or stable baselines.
+
+Classes:
+    NumpyPolicy(NamedTuple)
+
+Functions:
+    export_policy(model: Any) -> NumpyPolicy
+    save_policy(policy: NumpyPolicy, file_path: str) -> None
+    load_policy(file_path: str) -> NumpyPolicy
+
+Misc variables:
+    POLICY_FILE : str
+"""
+
+from os import makedirs, path, replace
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from ..data import DICTIONARY_LETTER_IDXS, LETTERS_COUNT, WORD_LENGTH
+
+POLICY_FILE: str = path.join("out", "ppo_policy.npz")
+
+# Index of each word's letter into letter scores by position, gathering whole rows being faster than words
+_POSITION_LETTER_IDXS: npt.NDArray[np.int_] = np.ascontiguousarray(DICTIONARY_LETTER_IDXS.T)
+
+
+class NumpyPolicy(NamedTuple):
+    """
+    Multilayer perceptron policy, with tanh activations between layers and the most likely action chosen.
+
+    Policies scoring letters rather than words, with WORD_LENGTH * LETTERS_COUNT outputs, score each word as the sum
+    of its letters' scores.
+
+    ...
+
+    Attributes
+    ----------
+    weights : Tuple[npt.NDArray[np.float32], ...]
+        (inputs, outputs) weights of each layer
+    biases : Tuple[npt.NDArray[np.float32], ...]
+        Biases of each layer
+    masked : bool
+        Whether only actions marked in the observation are chosen
+
+    Methods
+    -------
+    predict(self, observation: npt.NDArray[Any]) -> int
+        Most likely action given the observation
+    """
+
+    weights: Tuple[npt.NDArray[np.float32], ...]
+    biases: Tuple[npt.NDArray[np.float32], ...]
+    masked: bool = False
+
+    def predict(self, observation: npt.NDArray[Any]) -> int:
+        """
+        Most likely action given the observation.
+
+        Parameters
+        ----------
+        observation : npt.NDArray[Any]
+            Environment state
+
+        Returns
+        -------
+        int
+        """
+        activations: npt.NDArray[np.float32] = np.asarray(observation, dtype=np.float32).reshape(-1)
+        for weights, biases in zip(self.weights[:-1], self.biases[:-1]):
+            activations = np.tanh(activations @ weights + biases)
+
+        logits = activations @ self.weights[-1] + self.biases[-1]
+        if len(logits) == WORD_LENGTH * LETTERS_COUNT:
+            logits = logits[_POSITION_LETTER_IDXS].sum(axis=0)
+        if self.masked and (possible := np.asarray(observation).reshape(-1) > 0).any():
+            logits = np.where(possible, logits, -np.inf)
+
+        return int(np.argmax(logits))
+
+
+def export_policy(model: Any) -> NumpyPolicy:
+    """
+    Copy the weights of a stable baselines PPO model's actor critic policy, for tanh activations.
+
+    Parameters
+    ----------
+    model : Any
+        Trained PPO model
+
+    Returns
+    -------
+    NumpyPolicy
+    """
+    mlp_extractor = model.policy.mlp_extractor
+    layers: List[Any] = [*mlp_extractor.shared_net, *mlp_extractor.policy_net]
+
+    if any(not hasattr(layer, "weight") and type(layer).__name__ != "Tanh" for layer in layers):
+        raise AssertionError("Only linear layers with tanh activations can be exported")
+
+    linear_layers = [layer for layer in layers if hasattr(layer, "weight")]
+    # Letter action nets are exported as their letter scoring layer, with words scored in predict
+    linear_layers.append(getattr(model.policy.action_net, "letter_logits", model.policy.action_net))
+
+    return NumpyPolicy(
+        tuple(layer.weight.detach().cpu().numpy().T.astype(np.float32) for layer in linear_layers),
+        tuple(layer.bias.detach().cpu().numpy().astype(np.float32) for layer in linear_layers),
+        getattr(model.policy, "masks_actions", False),
+    )
+
+
+def save_policy(policy: NumpyPolicy, file_path: str = POLICY_FILE) -> None:
+    """
+    Save the policy, replacing any existing file atomically.
+
+    Parameters
+    ----------
+    policy : NumpyPolicy
+        Policy
+    file_path : str
+        File to save to
+    """
+    if folder := path.dirname(file_path):
+        makedirs(folder, exist_ok=True)
+
+    arrays: Dict[str, Any] = {f"weights_{idx}": weights for idx, weights in enumerate(policy.weights)}
+    arrays.update({f"biases_{idx}": biases for idx, biases in enumerate(policy.biases)})
+    arrays["masked"] = np.array(policy.masked)
+
+    temporary_file_path = f"{file_path}.tmp"
+    with open(temporary_file_path, "wb") as file:
+        np.savez(file, **arrays)
+    replace(temporary_file_path, file_path)
+
+
+def load_policy(file_path: str = POLICY_FILE) -> NumpyPolicy:
+    """
+    Load the policy.
+
+    Parameters
+    ----------
+    file_path : str
+        File to load from
+
+    Returns
+    -------
+    NumpyPolicy
+    """
+    with np.load(file_path) as policy:
+        layers = range(sum(name.startswith("weights_") for name in policy.files))
+        return NumpyPolicy(
+            tuple(policy[f"weights_{idx}"] for idx in layers),
+            tuple(policy[f"biases_{idx}"] for idx in layers),
+            bool(policy["masked"]) if "masked" in policy.files else False,
+        )
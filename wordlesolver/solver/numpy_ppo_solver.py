@@ -0,0 +1,35 @@
+"""
+File containing NumPy ppo solver class.
+
+Classes:
+    NumpyPPOSolver(Solver)
+"""
+
+from typing import Any
+
+import numpy.typing as npt
+
+from ..data import DICTIONARY_LENGTH
+from ..generator import Generator
+from ..generator.wrappers import IntWrapper, LetterStateWrapper, PreviousActionWrapper
+from .numpy_policy import POLICY_FILE, NumpyPolicy, load_policy
+from .solver import Solver
+
+
+class NumpyPPOSolver(Solver):
+    """NumPy ppo solver class, playing a policy exported with export_policy.py without torch or stable baselines."""
+
+    def __init__(self, generator: Generator, policy_file: str = POLICY_FILE) -> None:
+        """Initialise object, observing games the way the policy was trained to from the size of its inputs."""
+        policy = load_policy(policy_file)
+        wrapper_type = IntWrapper if policy.weights[0].shape[0] == DICTIONARY_LENGTH else LetterStateWrapper
+        super().__init__(wrapper_type(PreviousActionWrapper(generator)))
+
+        self.policy: NumpyPolicy = policy
+
+    def _next_guess(self, observation: npt.NDArray[Any]) -> int:
+        return self.policy.predict(observation)
+
+    def train(self) -> None:
+        """[NOT IMPLEMENTED] Train NumPy ppo solver."""
+        raise NotImplementedError("NumPy ppo solver is exported from PPOSolver with export_policy.py")
@@ -5,20 +5,36 @@ Classes:
     PPOSolver(Solver)
 """
 
+from functools import partial
 from os import makedirs, path
+from typing import Callable, Dict, Optional, Tuple, Type, Union
 
 import numpy as np
 import numpy.typing as npt
+from gym import Env
 from stable_baselines3 import PPO  # type:ignore[attr-defined]
-from stable_baselines3.common.monitor import Monitor
 from stable_baselines3.common.on_policy_algorithm import OnPolicyAlgorithm
+from stable_baselines3.common.policies import ActorCriticPolicy
+from stable_baselines3.common.vec_env import (  # type:ignore[attr-defined]
+    DummyVecEnv,
+    SubprocVecEnv,
+    VecMonitor,
+)
+from stable_baselines3.common.vec_env.base_vec_env import VecEnv
 
-from ..generator import Generator
-from ..generator.wrappers import IntWrapper, PreviousActionWrapper
+from ..generator import FakeGenerator, Generator, VecFakeGenerator
+from ..generator.wrappers import IntWrapper, LetterStateWrapper, PreviousActionWrapper
+from ..generator.wrappers.action_observation_wrapper import ActionObservationWrapper
+from .letter_policy import LetterActorCriticPolicy, MaskedLetterActorCriticPolicy
+from .masked_policy import MaskedActorCriticPolicy
 from .save_callback import SaveCallback
 from .solver import Solver
 
 
+def _wrapped_generator(new_generator: Callable[[], Generator], wrapper_type: Type[ActionObservationWrapper]) -> Env:
+    return wrapper_type(PreviousActionWrapper(new_generator()))
+
+
 class PPOSolver(Solver):
     """
     PPO solver class.
@@ -29,10 +45,18 @@ class PPOSolver(Solver):
     ----------
     OUTPUT_FOLDER : str
         Folder to store/load metrics and weights
-    WEIGHTS_FILE : str
-        File to store/load weights
+    WEIGHTS_FILES : Dict[Tuple[str, str], str]
+        File to store/load weights, for each observation and action head
     EVAL_INTERVAL : int
         Number of episodes to average reward over
+    ROLLOUT_STEPS : int
+        Number of steps gathered across all environments between updates
+    BACKENDS : Dict[str, Callable[..., VecEnv]]
+        Ways of running training environments, in process one after another or in worker processes
+    OBSERVATIONS : Dict[str, Type[ActionObservationWrapper]]
+        Ways of observing games, as the words still possible or as what is known about each letter
+    POLICIES : Dict[Tuple[str, bool], Union[str, Type[ActorCriticPolicy]]]
+        Policy for each action head, scoring words or letters, and whether actions are masked
 
     Methods
     -------
@@ -41,22 +65,89 @@ class PPOSolver(Solver):
     """
 
     OUTPUT_FOLDER: str = "out"
-    WEIGHTS_FILE: str = "ppo_weights.hdf5"
+    WEIGHTS_FILES: Dict[Tuple[str, str], str] = {
+        ("words", "words"): "ppo_weights.hdf5",
+        ("letters", "words"): "ppo_letters_weights.hdf5",
+        ("words", "letters"): "ppo_letter_actions_weights.hdf5",
+        ("letters", "letters"): "ppo_letters_letter_actions_weights.hdf5",
+    }
     EVAL_INTERVAL: int = 100
+    ROLLOUT_STEPS: int = 2048
+    BACKENDS: Dict[str, Callable[..., VecEnv]] = {"dummy": DummyVecEnv, "subprocess": SubprocVecEnv}
+    OBSERVATIONS: Dict[str, Type[ActionObservationWrapper]] = {"words": IntWrapper, "letters": LetterStateWrapper}
+    POLICIES: Dict[Tuple[str, bool], Union[str, Type[ActorCriticPolicy]]] = {
+        ("words", False): "MlpPolicy",
+        ("words", True): MaskedActorCriticPolicy,
+        ("letters", False): LetterActorCriticPolicy,
+        ("letters", True): MaskedLetterActorCriticPolicy,
+    }
+
+    # pylint: disable=too-many-arguments; training options
+    def __init__(
+        self,
+        generator: Generator,
+        n_envs: int = 1,
+        backend: str = "dummy",
+        *,
+        observation: str = "words",
+        actions: str = "words",
+        mask_actions: Optional[bool] = None,
+    ) -> None:
+        """
+        Initialise object, training on n_envs copies of the generator run by the given backend.
+
+        The "vectorised" backend steps every game at once with VecFakeGenerator, so needs a FakeGenerator and the
+        "words" observation. With mask_actions, only words still possible are sampled, which the "words" observation
+        does by default and the "letters" observation can't do. The "letters" actions score each word as the sum of
+        scores of its letters, for a smaller action head than a score per word.
+        """
+        if observation not in self.OBSERVATIONS:
+            raise AssertionError(f"Unknown observation {observation}, expected one of {list(self.OBSERVATIONS)}")
+        if (actions, False) not in self.POLICIES:
+            raise AssertionError(
+                f"Unknown actions {actions}, expected one of {sorted({head for head, _ in self.POLICIES})}"
+            )
+        if mask_actions is None:
+            mask_actions = observation == "words"
+        if mask_actions and observation != "words":
+            raise AssertionError("Only the words observation marks the words still possible, to mask actions with")
 
-    def __init__(self, generator: Generator) -> None:
-        """Initialise object."""
-        super().__init__(IntWrapper(PreviousActionWrapper(generator)))
+        super().__init__(self.OBSERVATIONS[observation](PreviousActionWrapper(generator)))
 
+        self.weights_file: str = self.WEIGHTS_FILES[(observation, actions)]
         makedirs(self.OUTPUT_FOLDER, exist_ok=True)
-        wrapped_generator: Monitor = Monitor(self._generator, self.OUTPUT_FOLDER)
-        self.model: OnPolicyAlgorithm = PPO("MlpPolicy", wrapped_generator)
-        if path.exists(self.OUTPUT_FOLDER):
-            self.model.load(path.join(self.OUTPUT_FOLDER, self.WEIGHTS_FILE))
+        training_generator: VecEnv = VecMonitor(
+            self._training_generator(generator, n_envs, backend, observation), self.OUTPUT_FOLDER
+        )
+        self.model: OnPolicyAlgorithm = PPO(
+            self.POLICIES[(actions, mask_actions)],
+            training_generator,
+            n_steps=max(self.ROLLOUT_STEPS // n_envs, 1),
+        )
+        # Loaded in place, keeping the training environments, once there are weights to load
+        if path.exists(weights_path := path.join(self.OUTPUT_FOLDER, self.weights_file)):
+            self.model.set_parameters(weights_path)
+
+    def _training_generator(self, generator: Generator, n_envs: int, backend: str, observation: str) -> VecEnv:
+        if backend == "vectorised":
+            if not isinstance(generator, FakeGenerator) or observation != "words":
+                raise AssertionError("Vectorised backend can only train on FakeGenerator with the words observation")
+            return VecFakeGenerator(n_envs)
+
+        if backend not in self.BACKENDS:
+            raise AssertionError(f"Unknown backend {backend}, expected one of {[*self.BACKENDS, 'vectorised']}")
+
+        # The solver's own generator is reused when training in process on one environment
+        if n_envs == 1 and backend == "dummy":
+            return DummyVecEnv([lambda: self._generator])
+
+        # Other environments are built like the solver's own generator, e.g. keeping a FakeGenerator's fixed answer
+        wrapped_generator = partial(_wrapped_generator, generator.factory(), self.OBSERVATIONS[observation])
+        return self.BACKENDS[backend]([wrapped_generator] * n_envs)
 
     def _next_guess(self, observation: npt.NDArray[np.uint8]) -> npt.NDArray[np.uint8]:
         return self.model.predict(observation, deterministic=True)[0]
 
     def train(self) -> None:
         """Train ppo solver."""
-        self.model.learn(10000, callback=SaveCallback(self.OUTPUT_FOLDER, self.WEIGHTS_FILE, self.EVAL_INTERVAL))
+        self.model.learn(10000, callback=SaveCallback(self.OUTPUT_FOLDER, self.weights_file, self.EVAL_INTERVAL))
@@ -5,15 +5,16 @@ Classes:
     SaveCallback(BaseCallback)
 """
 
-from logging import info
-from os import path
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+from logging import error, info
+from os import path, replace
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 import numpy as np
+from stable_baselines3.common.base_class import BaseAlgorithm
 from stable_baselines3.common.callbacks import BaseCallback
-from stable_baselines3.common.results_plotter import (  # type:ignore[attr-defined]
-    load_results,
-    ts2xy,
-)
 
 
 class SaveCallback(BaseCallback):
@@ -24,16 +25,22 @@ class SaveCallback(BaseCallback):
 
     Attributes
     ----------
+    REWARD_WINDOW : int
+        Number of most recent episodes to average reward over
     output_folder : str
         Folder to store/load weights
     weights_file : str
         File to store/load weights
     eval_interval : int
-        Number of episodes to average reward over
+        Number of steps between evaluations
     best_reward : float
         Best reward achieved
+    episodes : Deque[Tuple[float, int]]
+        Reward and length of the most recent episodes
     """
 
+    REWARD_WINDOW: int = 100
+
     def __init__(self, output_folder: str, weights_file: str, eval_interval: int):
         """Initialise object."""
         super().__init__()
@@ -42,18 +49,56 @@ class SaveCallback(BaseCallback):
         self.weights_file = weights_file
         self.eval_interval = eval_interval
         self.best_averaged_reward = -np.inf
+        self.episodes: Deque[Tuple[float, int]] = deque(maxlen=self.REWARD_WINDOW)
+
+        # One writer thread, so saves land in the order they were made
+        self._writer: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+        self._pending_save: Optional[Future[None]] = None
 
     def _on_step(self) -> bool:
-        if self.num_timesteps > 0 and self.n_calls % self.eval_interval == 0:
-            _, rewards = ts2xy(load_results(self.output_folder), "timesteps")
-            averaged_reward = np.mean(rewards[-100:])
-            info(f"Timestep: {self.num_timesteps}")
+        infos: List[Dict[str, Any]] = self.locals.get("infos", [])
+        for episode in (step_info["episode"] for step_info in infos if "episode" in step_info):
+            self.episodes.append((float(episode["r"]), int(episode["l"])))
+
+        if self.num_timesteps > 0 and self.n_calls % self.eval_interval == 0 and self.episodes:
+            averaged_reward, averaged_length = (float(mean) for mean in np.mean(self.episodes, axis=0))
+            info(f"Timestep: {self.num_timesteps}, averaged episode length: {averaged_length:.2f}")
             info(f"Averaged reward: {averaged_reward:.2f}, best averaged reward: {self.best_averaged_reward:.2f}")
 
             if averaged_reward > self.best_averaged_reward:
                 info("Updating model")
                 self.best_averaged_reward = averaged_reward
                 if self.model:
-                    self.model.save(path.join(self.output_folder, self.weights_file))
+                    self._save(self.model)
 
         return True
+
+    def _on_training_end(self) -> None:
+        self._wait_for_save()
+
+    def _save(self, model: BaseAlgorithm) -> None:
+        # Weights are serialised now, as training carries on changing them, but written to disk in the background
+        weights = BytesIO()
+        model.save(weights)
+
+        # A failed write is raised before the next is submitted, rather than replaced and lost
+        self._wait_for_save()
+        self._pending_save = self._writer.submit(self._write, weights.getvalue())
+        # Logged as soon as it fails too, as training ending in an exception never waits on it
+        self._pending_save.add_done_callback(self._log_failed_save)
+
+    def _wait_for_save(self) -> None:
+        if self._pending_save is not None:
+            pending_save, self._pending_save = self._pending_save, None
+            pending_save.result()
+
+    @staticmethod
+    def _log_failed_save(save: Future[None]) -> None:
+        if (exception := save.exception()) is not None:
+            error(f"Saving weights failed: {exception!r}")
+
+    def _write(self, weights: bytes) -> None:
+        weights_path = path.join(self.output_folder, self.weights_file)
+        with open(f"{weights_path}.tmp", "wb") as file:
+            file.write(weights)
+        replace(f"{weights_path}.tmp", weights_path)
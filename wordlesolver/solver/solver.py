@@ -7,10 +7,13 @@ Classes:
 
 from abc import ABC, abstractmethod
 from logging import info
-from typing import Any
+from time import perf_counter
+from typing import Any, List, Optional
 
 from gym import Env
 
+from .solver_cache import SolverCache
+
 
 # pylint: disable=too-few-public-methods; abstract class
 class Solver(ABC):
@@ -19,29 +22,77 @@ class Solver(ABC):
 
     ...
 
+    Attributes
+    ----------
+    cache : Optional[SolverCache]
+        Cache of previous decisions, for solvers that support one
+
     Methods
     -------
-    run() -> None
+    run() -> List[float]
         Run the game
+    run_async() -> List[float]
+        Run the game on a generator playing asynchronously
     """
 
     def __init__(self, generator: Env) -> None:
         """Initialise object."""
         self._generator: Env = generator
+        self.cache: Optional[SolverCache] = None
 
-    def run(self) -> None:
-        """Run the game."""
+    def run(self) -> List[float]:
+        """
+        Run the game.
+
+        Returns
+        -------
+        List[float]
+            Seconds taken to choose each guess
+        """
         observation: Any = self._generator.reset()
         done: bool = False
+        latencies: List[float] = []
 
         while not done:
-            next_action: Any = self._next_guess(observation)
+            next_action: Any = self._timed_guess(observation, latencies)
             observation, reward, done, _ = self._generator.step(next_action)
 
             info(f"Took action {next_action}, got reward {reward}, got observation {observation}")
 
         info("Finished game")
 
+        return latencies
+
+    async def run_async(self) -> List[float]:
+        """
+        Run the game on a generator playing asynchronously, e.g. AsyncRealGenerator.
+
+        Returns
+        -------
+        List[float]
+            Seconds taken to choose each guess
+        """
+        observation: Any = await self._generator.areset()
+        done: bool = False
+        latencies: List[float] = []
+
+        while not done:
+            next_action: Any = self._timed_guess(observation, latencies)
+            observation, reward, done, _ = await self._generator.astep(next_action)
+
+            info(f"Took action {next_action}, got reward {reward}, got observation {observation}")
+
+        info("Finished game")
+
+        return latencies
+
+    def _timed_guess(self, observation: Any, latencies: List[float]) -> Any:
+        start = perf_counter()
+        next_action: Any = self._next_guess(observation)
+        latencies.append(perf_counter() - start)
+
+        return next_action
+
     @abstractmethod
     def _next_guess(self, observation: Any) -> Any:
         raise NotImplementedError
@@ -0,0 +1,188 @@
+"""
+File containing solver cache class.
+
+Classes:
+    SolverCache
+
+Misc variables:
+    SOLVER_CACHE_FILE : str
+"""
+
+from collections import OrderedDict
+from hashlib import sha256
+from os import makedirs, path
+from sqlite3 import Connection, connect
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+SOLVER_CACHE_FILE: str = path.join("out", "solver_cache.sqlite")
+
+
+class SolverCache:
+    """
+    Solver cache class, memoising guesses by solver and remaining candidates in memory and on disk.
+
+    ...
+
+    Properties
+    ----------
+    stats : Dict[str, float]
+        Hit, miss and eviction counters, and seconds of solving saved by hits
+
+    Methods
+    -------
+    key(solver_name: str, candidate_idxs: npt.NDArray[np.int_]) -> str
+        Stable key for a solver's decision given the remaining candidates
+    get(self, key: str) -> Optional[str]
+        Get cached guess
+    put(self, key: str, guess: str, seconds: float) -> None
+        Cache guess, which took the given seconds to compute
+    close(self) -> None
+        Close on disk cache
+    """
+
+    # Uses are ordered by a counter rather than a clock, so eviction order doesn't depend on timer resolution
+    _NEXT_USE: str = "SELECT COALESCE(MAX(last_used), 0) + 1 FROM guesses"
+
+    def __init__(
+        self, file_path: Optional[str] = SOLVER_CACHE_FILE, memory_size: int = 4096, disk_size: int = 1000000
+    ) -> None:
+        """Initialise object, keeping up to memory_size guesses in memory and disk_size in file_path if given."""
+        self._memory_size: int = memory_size
+        self._disk_size: int = disk_size
+        self._memory: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+        self._connection: Optional[Connection] = self._connect(file_path) if file_path else None
+        self._stats: Dict[str, float] = dict.fromkeys(
+            ["memory_hits", "disk_hits", "misses", "memory_evictions", "disk_evictions", "seconds_saved"], 0
+        )
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Hit, miss and eviction counters, and seconds of solving saved by hits."""
+        return dict(self._stats)
+
+    @staticmethod
+    def key(solver_name: str, candidate_idxs: npt.NDArray[np.int_]) -> str:
+        """
+        Stable key for a solver's decision given the remaining candidates.
+
+        Parameters
+        ----------
+        solver_name : str
+            Solver identity
+        candidate_idxs : npt.NDArray[np.int_]
+            Dictionary indices of remaining candidates
+
+        Returns
+        -------
+        str
+        """
+        return sha256(solver_name.encode("utf-8") + candidate_idxs.astype("<i4").tobytes()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get cached guess.
+
+        Parameters
+        ----------
+        key : str
+            Cache key
+
+        Returns
+        -------
+        Optional[str]
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            guess, seconds = self._memory[key]
+            self._stats["memory_hits"] += 1
+        elif (row := self._get_from_disk(key)) is not None:
+            guess, seconds = row
+            self._put_in_memory(key, guess, seconds)
+            self._stats["disk_hits"] += 1
+        else:
+            self._stats["misses"] += 1
+            return None
+
+        self._stats["seconds_saved"] += seconds
+        return guess
+
+    def put(self, key: str, guess: str, seconds: float = 0) -> None:
+        """
+        Cache guess.
+
+        Parameters
+        ----------
+        key : str
+            Cache key
+        guess : str
+            Guess to cache
+        seconds : float
+            Seconds taken to compute guess
+        """
+        self._put_in_memory(key, guess, seconds)
+        self._put_on_disk(key, guess, seconds)
+
+    def close(self) -> None:
+        """Close on disk cache."""
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+
+    @staticmethod
+    def _connect(file_path: str) -> Connection:
+        if folder := path.dirname(file_path):
+            makedirs(folder, exist_ok=True)
+
+        connection = connect(file_path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS guesses (key TEXT PRIMARY KEY, guess TEXT, seconds REAL, last_used INTEGER)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS guesses_last_used ON guesses (last_used)")
+
+        return connection
+
+    def _count(self) -> int:
+        if not self._connection:
+            return 0
+
+        return int(self._connection.execute("SELECT COUNT(*) FROM guesses").fetchone()[0])
+
+    def _put_in_memory(self, key: str, guess: str, seconds: float) -> None:
+        self._memory[key] = (guess, seconds)
+        self._memory.move_to_end(key)
+
+        while len(self._memory) > self._memory_size:
+            self._memory.popitem(last=False)
+            self._stats["memory_evictions"] += 1
+
+    def _get_from_disk(self, key: str) -> Optional[Tuple[str, float]]:
+        if not self._connection:
+            return None
+
+        with self._connection:
+            row = self._connection.execute("SELECT guess, seconds FROM guesses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(f"UPDATE guesses SET last_used = ({self._NEXT_USE}) WHERE key = ?", (key,))
+
+        return str(row[0]), float(row[1])
+
+    def _put_on_disk(self, key: str, guess: str, seconds: float) -> None:
+        if not self._connection:
+            return
+
+        with self._connection:
+            self._connection.execute(
+                f"INSERT OR IGNORE INTO guesses VALUES (?, ?, ?, ({self._NEXT_USE}))", (key, guess, seconds)
+            )
+
+            # Counted within the write transaction, so guesses other processes sharing the file added are included
+            if (excess := self._count() - self._disk_size) > 0:
+                self._connection.execute(
+                    "DELETE FROM guesses WHERE key IN (SELECT key FROM guesses ORDER BY last_used LIMIT ?)", (excess,)
+                )
+                self._stats["disk_evictions"] += excess